@@ -0,0 +1,35 @@
+create table if not exists "public"."user_brief_access" (
+    "user_id" integer not null,
+    "brief_id" integer not null,
+    "creator_id" integer not null,
+    constraint "user_brief_access_pkey" primary key ("user_id", "brief_id", "creator_id"),
+    constraint "user_brief_access_user_id_fkey" foreign key ("user_id") references "public"."user"("id") on delete cascade,
+    constraint "user_brief_access_brief_id_fkey" foreign key ("brief_id") references "public"."brief"("id") on delete cascade,
+    constraint "user_brief_access_creator_id_fkey" foreign key ("creator_id") references "public"."user"("id") on delete cascade
+);
+
+create index if not exists "ix_user_brief_access_brief_id" on "public"."user_brief_access" using btree ("brief_id");
+
+-- backfill, mirroring UserBriefAccessService.compute_access
+insert into "public"."user_brief_access" ("user_id", "brief_id", "creator_id")
+select tm.user_id, tb.brief_id, tb.user_id
+from team_member tm
+join team t on t.id = tm.team_id and t.status = 'completed'
+join team_brief tb on tb.team_id = tm.team_id
+union
+select tm.user_id, bu.brief_id, bu.user_id
+from team_member tm
+join team t on t.id = tm.team_id and t.status = 'completed'
+join team_member mate on mate.team_id = tm.team_id
+join brief_user bu on bu.user_id = mate.user_id
+union
+select own.user_id, bu.brief_id, bu.user_id
+from brief_user own
+join brief_user bu on bu.brief_id = own.brief_id
+where not exists (
+    select 1
+    from team_member tm
+    join team t on t.id = tm.team_id and t.status = 'completed'
+    where tm.user_id = own.user_id
+)
+on conflict do nothing;
@@ -0,0 +1,10 @@
+alter table "public"."brief" alter column "data" type jsonb using "data"::jsonb;
+alter table "public"."brief_response" alter column "data" type jsonb using "data"::jsonb;
+alter table "public"."supplier" alter column "data" type jsonb using "data"::jsonb;
+alter table "public"."application" alter column "data" type jsonb using "data"::jsonb;
+alter table "public"."audit_event" alter column "data" type jsonb using "data"::jsonb;
+
+create index if not exists "idx_audit_events_type_campaign_title" on "public"."audit_event" using btree ("type", ("data" ->> 'campaign_title')) where ("data" ->> 'campaign_title') is not null;
+create index if not exists "idx_brief_data_sellers" on "public"."brief" using gin (("data" -> 'sellers'));
+create index if not exists "idx_supplier_data_contact_email" on "public"."supplier" using btree (lower("data" ->> 'contact_email'));
+create index if not exists "idx_supplier_data_recruiter" on "public"."supplier" using btree (("data" ->> 'recruiter'));
@@ -0,0 +1,16 @@
+alter table "public"."brief_response" add column if not exists "created_by" character varying;
+
+create index if not exists "idx_brief_response_brief_id_status" on "public"."brief_response" using btree ("brief_id", (case when ("submitted_at" is null) then 'draft' when ("withdrawn_at" is not null) then 'withdrawn' else 'submitted' end));
+
+-- backfill from the audit log, taking the earliest create event for each response
+update "public"."brief_response" br
+set "created_by" = ae."user"
+from (
+    select distinct on ("object_id") "object_id", "user"
+    from "public"."audit_event"
+    where "type" = 'create_brief_response'
+    and "object_type" = 'BriefResponse'
+    order by "object_id", "created_at"
+) ae
+where ae."object_id" = br."id"
+and br."created_by" is null;
@@ -0,0 +1,14 @@
+-- pgcrypto is only needed for digest() in the backfill, and is dropped again below since the schema doesn't use it
+create extension if not exists pgcrypto;
+
+alter table "public"."api_key" add column if not exists "key_hash" character varying(64);
+
+update "public"."api_key"
+set "key_hash" = encode(digest("key", 'sha256'), 'hex')
+where "key_hash" is null;
+
+alter table "public"."api_key" alter column "key_hash" set not null;
+
+create unique index if not exists "ix_api_key_key_hash" on "public"."api_key" using btree ("key_hash");
+
+drop extension if exists pgcrypto;
@@ -0,0 +1,3 @@
+create index if not exists "idx_supplier_name_trgm" on "public"."supplier" using gin ("name" gin_trgm_ops);
+
+create index if not exists "idx_supplier_abn_trgm" on "public"."supplier" using gin ("abn" gin_trgm_ops);
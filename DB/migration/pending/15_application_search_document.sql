@@ -0,0 +1,14 @@
+alter table "public"."application" add column if not exists "search_document" character varying;
+
+-- same as application_search_document() in app/models.py, which maintains the column from here on
+update "public"."application"
+set "search_document" = concat_ws(' ',
+    nullif("data"->>'name', ''),
+    nullif("data"->>'abn', ''),
+    nullif(replace("data"->>'abn', ' ', ''), ''),
+    nullif("data"->>'contact_email', '')
+);
+
+create index if not exists "idx_application_search_document_trgm" on "public"."application" using gin ("search_document" gin_trgm_ops);
+
+create index if not exists "idx_user_email_address_trgm" on "public"."user" using gin ("email_address" gin_trgm_ops);
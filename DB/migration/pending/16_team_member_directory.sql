@@ -0,0 +1,21 @@
+alter table "public"."user" add column if not exists "in_completed_team" boolean not null default false;
+
+-- vuser selects * from "user", which postgres expands when the view is created, so it is recreated as
+-- DB/migration/setup-post.sql defines it to pick up the new column
+drop view if exists "public"."vuser";
+create view vuser as (
+  select *, split_part(email_address, '@', 2) as email_domain from "user" u
+);
+
+-- maintained by team_business.update_team from here on
+update "public"."user" u
+set "in_completed_team" = exists (
+    select 1
+    from "public"."team_member" tm
+    inner join "public"."team" t on t."id" = tm."team_id"
+    where tm."user_id" = u."id" and t."status" = 'completed'
+);
+
+create index if not exists "idx_user_name_trgm" on "public"."user" using gin ("name" gin_trgm_ops);
+
+create index if not exists "idx_user_agency_directory" on "public"."user" ("agency_id", "role", "in_completed_team") where "active" is true;
@@ -0,0 +1,3 @@
+create index if not exists "idx_supplier_abn_normalised" on "public"."supplier" using btree (replace("abn", ' ', ''));
+
+create index if not exists "idx_application_data_abn_normalised" on "public"."application" using btree (replace("data" ->> 'abn', ' ', ''));
@@ -0,0 +1,30 @@
+alter table "public"."case_study" add column if not exists "domain_id" integer references "public"."domain" ("id");
+
+-- same as set_case_study_domain_id in app/models.py, which maintains the column from here on.
+-- legacy service names are mapped as in data/domain_mapping_old_to_new.yaml
+with legacy_mapping ("service", "domain_name") as (
+    values
+    ('Agile Coach', 'Change, Training and Transformation'),
+    ('Business Analyst', 'Agile delivery and Governance'),
+    ('Delivery Manager', 'Agile delivery and Governance'),
+    ('Developer', 'Software engineering and Development'),
+    ('Digital Transformation Adviser', 'Change, Training and Transformation'),
+    ('Ethical Hacker', 'Cyber security'),
+    ('Inclusive Designer (accessibility consultant)', 'User research and Design'),
+    ('Interaction Designer', 'User research and Design'),
+    ('Product Manager', 'Agile delivery and Governance'),
+    ('Technical Lead', 'Software engineering and Development'),
+    ('User Research', 'User research and Design'),
+    ('Service Designer', 'User research and Design'),
+    ('Web Devops Engineer', 'Software engineering and Development'),
+    ('Web Performance Analyst', 'Agile delivery and Governance')
+)
+update "public"."case_study" cs
+set "domain_id" = d."id"
+from "public"."domain" d
+where lower(d."name") = lower(coalesce(
+    (select lm."domain_name" from legacy_mapping lm where lm."service" = cs."data" ->> 'service'),
+    cs."data" ->> 'service'
+));
+
+create index if not exists "idx_case_study_supplier_code_domain_id_status" on "public"."case_study" ("supplier_code", "domain_id", "status");
@@ -0,0 +1,21 @@
+alter table "public"."user_claim" add column if not exists "expires_at" timestamp without time zone;
+alter table "public"."user_claim" add column if not exists "team_id" integer references "public"."team" ("id");
+
+-- same expiry as USER_CLAIM_EXPIRY_DAYS in config.py, which make_claim uses from here on
+update "public"."user_claim"
+set "expires_at" = "created_at" + case "type"
+    when 'password_reset' then interval '7 days'
+    else interval '30 days'
+end
+where "expires_at" is null;
+
+-- same as set_user_claim_team_id in app/models.py
+update "public"."user_claim"
+set "team_id" = ("data" ->> 'team_id')::integer
+where "type" = 'join_team' and "team_id" is null and ("data" ->> 'team_id') ~ '^[0-9]+$';
+
+drop index if exists "ix_user_claim_token";
+create unique index if not exists "ix_user_claim_token" on "public"."user_claim" using btree ("token");
+
+create index if not exists "ix_user_claim_expires_at" on "public"."user_claim" using btree ("expires_at");
+create index if not exists "ix_user_claim_team_id" on "public"."user_claim" using btree ("team_id");
@@ -0,0 +1,3 @@
+-- the change record for each edit, worked out when the edit is made. edits made before this are left null
+-- and their changes are worked out from the snapshots when the history is viewed
+alter table "public"."brief_history" add column if not exists "changes" json;
@@ -0,0 +1,20 @@
+-- deleted briefs and brief responses, for the change feed
+create table if not exists "public"."tombstone" (
+    "id" serial primary key,
+    "entity_type" varchar not null,
+    "entity_id" bigint not null,
+    "deleted_at" timestamp without time zone not null
+);
+
+create index if not exists "idx_tombstone_change_feed"
+    on "public"."tombstone" ("entity_type", "deleted_at", "entity_id");
+
+-- keyset indexes for paging through each entity type by when it last changed
+create index if not exists "idx_supplier_change_feed"
+    on "public"."supplier" (timezone('UTC', "last_update_time"), "code");
+
+create index if not exists "idx_brief_change_feed"
+    on "public"."brief" ("updated_at", "id");
+
+create index if not exists "idx_brief_response_change_feed"
+    on "public"."brief_response" ("updated_at", "id");
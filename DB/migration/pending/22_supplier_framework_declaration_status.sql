@@ -0,0 +1,20 @@
+alter table "public"."supplier_framework" add column if not exists "declaration_status" character varying;
+alter table "public"."supplier_framework" add column if not exists "submitted_draft_count" integer not null default 0;
+
+-- same as set_declaration_status in app/models.py
+update "public"."supplier_framework"
+set "declaration_status" = coalesce("declaration" ->> 'status', '')
+where json_typeof("declaration") = 'object';
+
+-- same as set_submitted_draft_count in app/models.py, which keeps it up to date from here on
+update "public"."supplier_framework" sf
+set "submitted_draft_count" = drafts."count"
+from (
+    select "supplier_code", "framework_id", count(*) as "count"
+    from "public"."draft_service"
+    where "status" = 'submitted'
+    group by "supplier_code", "framework_id"
+) drafts
+where sf."supplier_code" = drafts."supplier_code" and sf."framework_id" = drafts."framework_id";
+
+create index if not exists "idx_supplier_framework_declaration_status" on "public"."supplier_framework" using btree ("framework_id", "declaration_status");
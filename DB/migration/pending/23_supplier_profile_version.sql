@@ -0,0 +1,2 @@
+-- bumped by app.supplier_profiles from here on
+alter table "public"."supplier" add column if not exists "profile_version" integer not null default 0;
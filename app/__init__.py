@@ -37,22 +37,9 @@ def create_app(config_name):
     )
 
     if application.config['REDIS_SESSIONS']:
-        vcap_services = parse_vcap_services()
-        redis_opts = {
-            'ssl': application.config['REDIS_SSL'],
-            'ssl_ca_certs': application.config['REDIS_SSL_CA_CERTS'],
-            'ssl_cert_reqs': application.config['REDIS_SSL_HOST_REQ']
-        }
-        if vcap_services and 'redis' in vcap_services:
-            redis_opts['host'] = vcap_services['redis'][0]['credentials']['hostname']
-            redis_opts['port'] = vcap_services['redis'][0]['credentials']['port']
-            redis_opts['password'] = vcap_services['redis'][0]['credentials']['password']
-        else:
-            redis_opts['host'] = application.config['REDIS_SERVER_HOST']
-            redis_opts['port'] = application.config['REDIS_SERVER_PORT']
-            redis_opts['password'] = application.config['REDIS_SERVER_PASSWORD']
-
-        session_store = RedisStore(redis.StrictRedis(**redis_opts))
+        redis_client = make_redis_client(application.config)
+        application.extensions['redis'] = redis_client
+        session_store = RedisStore(redis_client)
         KVSessionExtension(session_store, application)
 
     if not application.config['DM_API_AUTH_TOKENS']:
@@ -83,6 +70,9 @@ def create_app(config_name):
 
     swag.init_app(application)
 
+    from . import sql_instrumentation
+    sql_instrumentation.init_app(application)
+
     if application.config['DEBUG']:
         # enable raise to raise exception on ORM misconfigured queries
         # application.config['NPLUSONE_RAISE'] = True
@@ -113,6 +103,33 @@ def isolation_level(level):
     return decorator
 
 
+def make_redis_client(config):
+    vcap_services = parse_vcap_services()
+    redis_opts = {
+        'ssl': config['REDIS_SSL'],
+        'ssl_ca_certs': config['REDIS_SSL_CA_CERTS'],
+        'ssl_cert_reqs': config['REDIS_SSL_HOST_REQ']
+    }
+    if vcap_services and 'redis' in vcap_services:
+        redis_opts['host'] = vcap_services['redis'][0]['credentials']['hostname']
+        redis_opts['port'] = vcap_services['redis'][0]['credentials']['port']
+        redis_opts['password'] = vcap_services['redis'][0]['credentials']['password']
+    else:
+        redis_opts['host'] = config['REDIS_SERVER_HOST']
+        redis_opts['port'] = config['REDIS_SERVER_PORT']
+        redis_opts['password'] = config['REDIS_SERVER_PASSWORD']
+
+    return redis.StrictRedis(**redis_opts)
+
+
+def get_redis_client(application):
+    """Returns the app's redis client, connecting on first use in processes that didn't create it (celery)."""
+    client = application.extensions.get('redis')
+    if client is None and application.config.get('REDIS_SESSIONS'):
+        client = application.extensions['redis'] = make_redis_client(application.config)
+    return client
+
+
 def parse_vcap_services():
     import os
     import json
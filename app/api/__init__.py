@@ -6,11 +6,9 @@ from flask import Blueprint, request, current_app
 from flask_login import LoginManager
 from app.models import User
 from app.api.business import supplier_business, team_business
-from app.api.services import api_key_service
 from base64 import b64decode
 from app import encryption
-from app.api.helpers import abort
-from app.authentication import get_api_key_from_request
+from app.api.helpers import abort, resolve_api_key
 
 api = Blueprint('api', __name__)
 login_manager = LoginManager()
@@ -60,8 +58,7 @@ def check_csrf_token():
         not be forwarded by browsers automatically in authenticated requests, so the presence of a valid API key in the
         request proves authenticity like a CSRF token.
         '''
-        api_key = get_api_key_from_request(request)
-        if not api_key or not api_key_service.get_key(api_key):
+        if resolve_api_key(request) is None:
             new_csrf_valid = check_valid_csrf()
 
             if not (new_csrf_valid):
@@ -124,6 +121,7 @@ from app.api.views.reports import (  # noqa
     agency,
     brief,
     brief_response,
+    changes,
     feedback,
     suppliers
 )
@@ -224,6 +224,7 @@ def edit_opportunity(user_id, brief_id, edits):
         user_id=user_id,
         data=previous_data
     )
+    edit.changes = get_change_record(brief, edit)
 
     brief_history_service.save(edit, do_commit=False)
     brief_service.commit_changes()
@@ -416,6 +417,50 @@ def get_changes_made_to_opportunity(source, previous):
     return data
 
 
+def get_change_record(source, previous):
+    """Works out the compact record of an edit that is stored against it: the fields changed and the sellers
+    added rather than both full seller lists.
+    """
+    changes = copy.deepcopy(get_changes_made_to_opportunity(source, previous))
+
+    if 'sellers' in changes:
+        previous_sellers = changes['sellers']['oldValue']
+        changes['sellers'] = {
+            'added': {
+                code: seller
+                for code, seller in changes['sellers']['newValue'].iteritems()
+                if code not in previous_sellers
+            }
+        }
+
+    if 'closingDate' in changes and not isinstance(changes['closingDate']['newValue'], basestring):
+        changes['closingDate']['newValue'] = changes['closingDate']['newValue'].to_iso8601_string(extended=True)
+
+    return changes
+
+
+def get_change_records(brief_id, brief=None):
+    """Returns the edited date and change record of each edit, newest first.
+
+    Edits made before change records were stored are worked out from the snapshots.
+    """
+    records = brief_history_service.get_change_records(brief_id)
+    legacy_changes = {}
+
+    if any(record.changes is None for record in records):
+        brief = brief or brief_service.get(brief_id)
+        edits = brief_history_service.get_edits(brief_id)
+        for i, edit in enumerate(edits):
+            if edit.changes is None:
+                source = brief if i == 0 else edits[i - 1]
+                legacy_changes[edit.id] = get_change_record(source, edit)
+
+    return [
+        (record.edited_at, record.changes if record.changes is not None else legacy_changes[record.id])
+        for record in records
+    ]
+
+
 def get_opportunity_history(brief_id, show_documents=False, include_sellers=True):
     brief = brief_service.get(brief_id)
     if not brief:
@@ -430,14 +475,11 @@ def get_opportunity_history(brief_id, show_documents=False, include_sellers=True
     }
 
     edits = []
-    changes = brief_history_service.get_edits(brief.id)
-
-    for i, change in enumerate(changes):
-        source = brief if i == 0 else changes[i - 1]
-        edit_data = get_changes_made_to_opportunity(source, change)
+    for edited_at, changes in get_change_records(brief.id, brief):
+        edit_data = dict(changes)
 
         if edit_data:
-            edit_data['editedAt'] = change.edited_at
+            edit_data['editedAt'] = edited_at
             if not include_sellers and 'sellers' in edit_data:
                 del edit_data['sellers']
             if not brief_business.is_open_to_all(brief) and not show_documents:
@@ -455,14 +497,12 @@ def get_opportunity_history(brief_id, show_documents=False, include_sellers=True
 
 
 def only_sellers_were_edited(brief_id):
-    history = get_opportunity_history(brief_id, show_documents=True)
     only_sellers_edited = False
 
-    for edit in history['edits']:
-        for key, value in edit.iteritems():
-            if key != 'editedAt' and key != 'sellers':
+    for _, changes in get_change_records(brief_id):
+        for key in changes:
+            if key != 'sellers':
                 return False
-            elif key == 'sellers':
-                only_sellers_edited = True
+            only_sellers_edited = True
 
     return only_sellers_edited
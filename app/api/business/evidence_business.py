@@ -1,28 +1,22 @@
 from app.api.services import (evidence_service, evidence_assessment_service, audit_service,
                               audit_types, domain_criteria_service)
-from app.api.business.domain_criteria import DomainCriteria
-from app.api.business.errors import DomainCriteriaInvalidRateException
 
 
 def get_all_evidence(supplier_code):
     evidence_collection = evidence_service.get_all_evidence(supplier_code=supplier_code)
+    assessments = evidence_assessment_service.get_latest_assessments_for_evidence(
+        [e['id'] for e in evidence_collection if e['status'] in ['rejected', 'assessed']]
+    )
     data = []
     for evidence_data in evidence_collection:
-        try:
-            evidence_data['criteriaNeeded'] = int(
-                DomainCriteria(
-                    domain_id=evidence_data.get('domain_id', None),
-                    rate=evidence_data.get('maxDailyRate', None)
-                ).get_criteria_needed()
-            )
-        except DomainCriteriaInvalidRateException as e:
-            pass
+        criteria_needed = evidence_data.pop('criteriaNeeded')
+        if criteria_needed is not None:
+            evidence_data['criteriaNeeded'] = int(criteria_needed)
         evidence_data['assessment'] = None
-        if evidence_data['status'] in ['rejected', 'assessed']:
-            assessment = evidence_assessment_service.get_assessment_for_evidence(evidence_data['id'])
-            if assessment:
-                evidence_data['assessment'] = assessment.serialize()
-                evidence_data['feedback_created_at'] = assessment.created_at
+        assessment = assessments.get(evidence_data['id'])
+        if assessment:
+            evidence_data['assessment'] = assessment.serialize()
+            evidence_data['feedback_created_at'] = assessment.created_at
         data.append(evidence_data)
     return data
 
@@ -1,13 +1,19 @@
 import collections
+import json
 
 import pendulum
+import redis
+from flask import current_app
 
+from app import get_redis_client
 from app.api.business.agreement_business import (get_current_agreement,
                                                  get_new_agreement,
                                                  has_signed_current_agreement)
 from app.api.business.validators import SupplierValidator
 from app.api.services import application_service, key_values_service, suppliers
 
+SupplierMessages = collections.namedtuple('Notification', ['warnings', 'errors'])
+
 
 def abn_is_used(abn):
     abn = "".join(abn.split())
@@ -21,6 +27,50 @@ def abn_is_used(abn):
 
 
 def get_supplier_messages(code, skip_application_check):
+    """Returns the supplier's validation warnings and errors, cached until the supplier, its edit applications, its
+    signed agreements or the master agreements change, or a date the rules depend on passes.
+    """
+    client = get_redis_client(current_app)
+    stamp = suppliers.get_supplier_messages_version(code) if client else None
+    if not stamp:
+        return _get_supplier_messages(code, skip_application_check)
+
+    key = 'supplier_messages:{}:{}'.format(code, 1 if skip_application_check else 0)
+    try:
+        cached = client.get(key)
+        if cached:
+            cached = json.loads(cached)
+            if cached['version'] == stamp['version']:
+                return SupplierMessages(warnings=cached['warnings'], errors=cached['errors'])
+    except redis.RedisError as e:
+        current_app.logger.warning('supplier.messages.cache.error: {error}', extra={'error': str(e)})
+
+    messages = _get_supplier_messages(code, skip_application_check)
+
+    try:
+        client.setex(key, _get_supplier_messages_ttl(stamp['next_agreement_change']), json.dumps({
+            'version': stamp['version'],
+            'warnings': messages.warnings,
+            'errors': messages.errors
+        }))
+    except redis.RedisError as e:
+        current_app.logger.warning('supplier.messages.cache.error: {error}', extra={'error': str(e)})
+
+    return messages
+
+
+def _get_supplier_messages_ttl(next_agreement_change):
+    # document and licence expiry rules compare dates in Canberra time, so results hold until midnight there.
+    # the agreement messages change when a master agreement starts or ends.
+    now = pendulum.now('Australia/Canberra')
+    expires_at = now.add(days=1).start_of('day').timestamp()
+    if next_agreement_change:
+        expires_at = min(expires_at, next_agreement_change)
+    ttl = min(int(expires_at - now.timestamp()) + 1, current_app.config['SUPPLIER_MESSAGES_CACHE_TTL'])
+    return max(ttl, 1)
+
+
+def _get_supplier_messages(code, skip_application_check):
     applications = application_service.find(
         supplier_code=code,
         type='edit'
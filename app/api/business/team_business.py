@@ -1,5 +1,6 @@
 from collections import namedtuple
 
+from flask import current_app
 from flask_login import current_user
 
 from app.api.business.errors import (NotFoundError, TeamError,
@@ -79,13 +80,19 @@ def get_teams_overview():
     return teams_overview
 
 
-def get_people_overview():
+def get_people_overview(page=1):
     people_overview = {}
     user = users.get(current_user.id)
     completed_teams = team_service.get_teams_for_user(user.id)
 
-    people = users.get_buyer_team_members(user.agency_id)
+    page_size = current_app.config['DM_API_TEAM_MEMBERS_PAGE_SIZE']
+    people = users.get_buyer_team_members(user.agency_id, limit=page_size, offset=(page - 1) * page_size)
     people_overview.update(users=people)
+    people_overview.update(
+        page=page,
+        pageSize=page_size,
+        total=users.count_buyer_team_members(user.agency_id)
+    )
 
     organisation = agency_service.get_agency_name(user.agency_id)
     people_overview.update(organisation=organisation)
@@ -133,6 +140,7 @@ def update_team(team_id, data):
     update_team_information(team, data)
     result = update_team_leads_and_members(team, data)
     update_permissions(team, data)
+    affected_user_ids = [tm.user_id for tm in team.team_members] + result.get('removed_team_members', [])
 
     create_team = data.get('createTeam', False)
 
@@ -174,6 +182,9 @@ def update_team(team_id, data):
 
         team_service.save(team)
 
+    # keeps the team member directory in step with who is in a completed team
+    users.update_in_completed_team(affected_user_ids)
+
     if saved:
         publish_tasks.team.delay(
             publish_tasks.compress_team(team),
@@ -377,8 +388,8 @@ def clear_all_join_requests(email_address, team_id):
         user_claims_service.save(claim)
 
 
-def search_team_members(current_user, agency_id, keywords=None, exclude=None):
-    return team_service.search_team_members(current_user, agency_id, keywords, exclude)
+def search_team_members(current_user, agency_id, keywords=None, exclude=None, limit=20):
+    return team_service.search_team_members(current_user, agency_id, keywords, exclude, limit)
 
 
 def get_team_briefs(team_id):
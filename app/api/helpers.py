@@ -7,7 +7,7 @@ import pendulum
 import requests
 import rollbar
 from flask import abort as flask_abort
-from flask import current_app, jsonify, make_response, render_template_string, request
+from flask import current_app, g, jsonify, make_response, render_template_string, request
 from flask_login import current_user, login_user
 from werkzeug.exceptions import HTTPException
 from sqlalchemy.exc import DBAPIError
@@ -21,19 +21,32 @@ from dmutils.email import (ONE_DAY_IN_SECONDS, EmailError,
                            parse_fernet_timestamp)
 
 
+def resolve_api_key(request):
+    """Returns the id of the user owning the request's API key, or None if there is no valid key.
+
+    The result is kept on flask.g so the CSRF check and the auth decorators share a single lookup per request.
+    """
+    if not hasattr(g, 'api_key_user_id'):
+        request_key = get_api_key_from_request(request)
+        user_id = None
+        if request_key:
+            from app.api.services import api_key_service
+            user_id = api_key_service.get_user_id(request_key)
+        g.api_key_user_id = user_id
+    return g.api_key_user_id
+
+
 def allow_api_key_auth(func):
     @wraps(func)
     def decorated_view(*args, **kwargs):
-        request_key = get_api_key_from_request(request)
-        if request_key:
+        if get_api_key_from_request(request):
             from app.api import load_user
-            from app.api.services import api_key_service
-            key = api_key_service.get_key(request_key)
-            if not key:
+            user_id = resolve_api_key(request)
+            if user_id is None:
                 return flask_abort(403, 'Invalid API key - revoked or non existent')
-            user = load_user(key.user_id)
+            user = load_user(user_id)
             login_user(user)
-            current_app.logger.info('login.api_key.success: {user}', extra={'user': key.user.name})
+            current_app.logger.info('login.api_key.success: {user}', extra={'user': user.name})
         return func(*args, **kwargs)
     return decorated_view
 
@@ -41,16 +54,14 @@ def allow_api_key_auth(func):
 def require_api_key_auth(func):
     @wraps(func)
     def decorated_view(*args, **kwargs):
-        request_key = get_api_key_from_request(request)
-        if request_key:
+        if get_api_key_from_request(request):
             from app.api import load_user
-            from app.api.services import api_key_service
-            key = api_key_service.get_key(request_key)
-            if not key:
+            user_id = resolve_api_key(request)
+            if user_id is None:
                 return flask_abort(403, 'Invalid API key - revoked or non existent')
-            user = load_user(key.user_id)
+            user = load_user(user_id)
             login_user(user)
-            current_app.logger.info('login.api_key.success: {user}', extra={'user': key.user.name})
+            current_app.logger.info('login.api_key.success: {user}', extra={'user': user.name})
             return func(*args, **kwargs)
         return flask_abort(403, 'Must authenticate using API key authentication')
     return decorated_view
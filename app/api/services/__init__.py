@@ -27,6 +27,7 @@ from .suppliers import SuppliersService
 from .team_member_permissions import TeamMemberPermissionService
 from .team_members import TeamMemberService
 from .teams import TeamService
+from .user_brief_access import UserBriefAccessService
 from .user_claims import UserClaimService
 from .users import UsersService
 from .work_order import WorkOrderService
@@ -53,6 +54,7 @@ team_service = TeamService()
 team_member_service = TeamMemberService()
 team_member_permission_service = TeamMemberPermissionService()
 user_claims_service = UserClaimService()
+user_brief_access_service = UserBriefAccessService()
 evidence_service = EvidenceService()
 evidence_assessment_service = EvidenceAssessmentService()
 work_order_service = WorkOrderService()
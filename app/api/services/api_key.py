@@ -1,4 +1,9 @@
+import time
+
+from flask import current_app
+
 from app.api.helpers import Service
+from app.authentication import hash_api_key
 from app.models import ApiKey, db
 from app.api.helpers import generate_random_token
 from datetime import datetime
@@ -9,6 +14,8 @@ class ApiKeyService(Service):
 
     def __init__(self, *args, **kwargs):
         super(ApiKeyService, self).__init__(*args, **kwargs)
+        # key hash -> (user id, expiry time) for recently resolved keys
+        self._cache = {}
 
     def get_key(self, key):
         query = (
@@ -16,12 +23,36 @@ class ApiKeyService(Service):
             .session
             .query(ApiKey)
             .filter(
-                ApiKey.key == key,
+                ApiKey.key_hash == hash_api_key(key),
                 ApiKey.revoked_at.is_(None)
             )
-            .order_by(ApiKey.created_at.desc())
         )
-        return query.first()
+        return query.one_or_none()
+
+    def get_user_id(self, key):
+        key_hash = hash_api_key(key)
+        ttl = int(current_app.config.get('API_KEY_CACHE_TTL') or 0)
+
+        if ttl:
+            cached = self._cache.get(key_hash)
+            if cached and cached[1] > time.time():
+                return cached[0]
+
+        user_id = (
+            db
+            .session
+            .query(ApiKey.user_id)
+            .filter(
+                ApiKey.key_hash == key_hash,
+                ApiKey.revoked_at.is_(None)
+            )
+            .scalar()
+        )
+
+        if user_id is not None and ttl:
+            self._cache[key_hash] = (user_id, time.time() + ttl)
+
+        return user_id
 
     def generate(self, user_id, length=32):
         api_key = ApiKey(user_id=user_id, key=generate_random_token(length=length))
@@ -29,12 +60,13 @@ class ApiKeyService(Service):
         return api_key.key
 
     def revoke(self, key):
+        key_hash = hash_api_key(key)
         keys = (
             db
             .session
             .query(ApiKey)
             .filter(
-                ApiKey.key == key,
+                ApiKey.key_hash == key_hash,
                 ApiKey.revoked_at.is_(None)
             )
             .all()
@@ -42,4 +74,5 @@ class ApiKeyService(Service):
         for key in keys:
             key.revoke()
             self.save(key)
+        self._cache.pop(key_hash, None)
         return True
@@ -2,6 +2,7 @@ from enum import Enum
 
 import rollbar
 
+from app import db
 from app.api.helpers import Service
 from app.models import AuditEvent
 
@@ -27,6 +28,22 @@ class AuditService(Service):
                 'id': kwargs['db_object'].id
             })
 
+    def get_object_ids_with_event(self, audit_type, object_type, object_ids):
+        result = (
+            db
+            .session
+            .query(AuditEvent.object_id)
+            .filter(
+                AuditEvent.type == audit_type.value,
+                AuditEvent.object_type == object_type,
+                AuditEvent.object_id.in_(object_ids)
+            )
+            .distinct()
+            .all()
+        )
+
+        return set(r.object_id for r in result)
+
 
 class AuditTypes(Enum):
     update_price = 'update_price'
@@ -17,6 +17,13 @@ class BriefHistoryService(Service):
                   .order_by(BriefHistory.edited_at.desc())
                   .all())
 
+    def get_change_records(self, brief_id):
+        return (db.session
+                  .query(BriefHistory.id, BriefHistory.edited_at, BriefHistory.changes)
+                  .filter(BriefHistory.brief_id == brief_id)
+                  .order_by(BriefHistory.edited_at.desc())
+                  .all())
+
     def get_last_edited_date(self, brief_id):
         return (db.session
                   .query(func.max(BriefHistory.edited_at))
@@ -1,5 +1,5 @@
 import pendulum
-from sqlalchemy import and_, case, desc, func, or_, union
+from sqlalchemy import and_, case, desc, exists, func, or_, union
 from sqlalchemy.orm import joinedload, noload
 from sqlalchemy.sql.expression import case as sql_case
 from sqlalchemy.sql.functions import concat
@@ -7,10 +7,11 @@ from sqlalchemy.types import Integer, Numeric
 
 from app import db
 from app.api.helpers import Service
-from app.models import (AuditEvent, Brief, BriefAssessor,
+from app.models import (Brief, BriefAssessor,
                         BriefClarificationQuestion, BriefQuestion,
                         BriefResponse, BriefUser, Framework, Lot, Supplier,
-                        Team, TeamBrief, TeamMember, User, WorkOrder)
+                        Team, TeamBrief, TeamMember, User, UserBriefAccess,
+                        WorkOrder)
 from dmutils.filters import timesince
 
 
@@ -339,96 +340,29 @@ class BriefsService(Service):
         return brief
 
     def accessible_briefs(self, user_id):
-        team_member_subquery = (
+        return (
             db
             .session
             .query(
-                TeamMember.team_id
+                UserBriefAccess.brief_id.label('brief_id'),
+                UserBriefAccess.creator_id.label('user_id')
             )
-            .join(Team)
-            .filter(TeamMember.user_id == user_id)
-            .filter(Team.status == 'completed')
+            .filter(UserBriefAccess.user_id == user_id)
             .subquery()
         )
-        team_member_result = (
-            db
-            .session
-            .query(
-                TeamMember.team_id,
-                TeamMember.user_id
-            )
-            .join(team_member_subquery, team_member_subquery.columns.team_id == TeamMember.team_id)
-            .all()
-        )
-        team_ids = [tm.team_id for tm in team_member_result]
-        user_ids = [tm.user_id for tm in team_member_result]
-
-        if team_ids:
-            team_brief_query = (
-                db
-                .session
-                .query(
-                    TeamBrief.brief_id.label('brief_id'),
-                    TeamBrief.user_id.label('user_id')
-                )
-                .join(Team)
-                .filter(TeamBrief.team_id.in_(team_ids))
-                .filter(Team.status == 'completed')
-            )
-
-            brief_user_query = (
-                db
-                .session
-                .query(
-                    BriefUser.brief_id.label('brief_id'),
-                    BriefUser.user_id.label('user_id')
-                )
-                .filter(BriefUser.user_id.in_(user_ids))
-            )
-            query = union(team_brief_query, brief_user_query).alias('result')
-            return (
-                db
-                .session
-                .query(
-                    query.c.brief_id.label('brief_id'),
-                    query.c.user_id.label('user_id')
-                )
-                .subquery()
-            )
-
-        else:
-            query = (
-                db
-                .session
-                .query(
-                    BriefUser.brief_id.label('brief_id')
-                )
-                .filter(BriefUser.user_id == user_id)
-                .subquery()
-            )
-            return (
-                db
-                .session
-                .query(
-                    BriefUser.brief_id.label('brief_id'),
-                    BriefUser.user_id.label('user_id')
-                )
-                .filter(BriefUser.brief_id.in_(query))
-                .subquery()
-            )
 
     def has_permission_to_brief(self, user_id, brief_id):
-        query = self.accessible_briefs(user_id)
-        result = (
+        return (
             db
             .session
-            .query(query)
-            .filter(query.c.brief_id == brief_id)
-            .all()
+            .query(
+                exists()
+                .where(UserBriefAccess.user_id == user_id)
+                .where(UserBriefAccess.brief_id == brief_id)
+            )
+            .scalar()
         )
 
-        return True if len(result) > 0 else False
-
     def get_contact_for_team_brief(self, brief_id):
         team_brief = (db.session
                         .query(TeamBrief)
@@ -549,7 +483,7 @@ class BriefsService(Service):
             .session
             .query(
                 Brief.id.label('brief_id'),
-                func.json_object_keys(Brief.data['sellers']).label('supplier_code')
+                func.jsonb_object_keys(Brief.data['sellers']).label('supplier_code')
             )
             .subquery()
         )
@@ -645,8 +579,6 @@ class BriefsService(Service):
         return brief
 
     def get_sellers_to_notify(self, brief, open_to_all):
-        from app.api.services import audit_types
-
         submitted_response_email_addresses = (
             db
             .session
@@ -657,33 +589,15 @@ class BriefsService(Service):
             )
         )
 
-        draft_responses = (
+        draft_response_email_addresses = (
             db
             .session
-            .query(BriefResponse.id)
+            .query(BriefResponse.created_by.label('email_address'))
             .filter(
                 BriefResponse.brief_id == brief.id,
-                BriefResponse.status == 'draft'
+                BriefResponse.status == 'draft',
+                BriefResponse.created_by.isnot(None)
             )
-            .subquery()
-        )
-
-        draft_response_audit_events = (
-            db
-            .session
-            .query(
-                AuditEvent.user.label('email_address'),
-                AuditEvent.object_id
-            )
-            .filter(AuditEvent.type == audit_types.create_brief_response.value)
-            .subquery()
-        )
-
-        draft_response_email_addresses = (
-            db
-            .session
-            .query(draft_response_audit_events.c.email_address)
-            .join(draft_responses, draft_responses.c.id == draft_response_audit_events.c.object_id)
         )
 
         questioners = (
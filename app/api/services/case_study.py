@@ -20,10 +20,10 @@ class CaseStudyService(Service):
                 CaseStudy.data.label('case_study_data'),
                 Domain.name.label('category_name')
             )
-            .join(Domain, Domain.name == CaseStudy.data['service'].astext)
+            .join(Domain, Domain.id == CaseStudy.domain_id)
             .filter(CaseStudy.supplier_code == supplier_code,
-                    CaseStudy.status == 'approved',
-                    Domain.id == domain_id)
+                    CaseStudy.domain_id == domain_id,
+                    CaseStudy.status == 'approved')
             .subquery()
         )
 
@@ -43,3 +43,22 @@ class CaseStudyService(Service):
         )
         results = result.one_or_none()
         return results._asdict() if results else {}
+
+    def get_rejected_case_studies_by_supplier_codes(self, supplier_codes):
+        result = (
+            db
+            .session
+            .query(
+                CaseStudy.id,
+                CaseStudy.supplier_code,
+                CaseStudy.data['title'].astext.label('title'),
+                CaseStudy.data['service'].astext.label('service'),
+                CaseStudy.domain_id
+            )
+            .filter(CaseStudy.supplier_code.in_(supplier_codes),
+                    CaseStudy.status == 'rejected')
+            .order_by(CaseStudy.id)
+            .all()
+        )
+
+        return [r._asdict() for r in result]
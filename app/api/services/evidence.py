@@ -1,12 +1,27 @@
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, case, cast, func, or_
 from sqlalchemy.orm import joinedload, raiseload
-from sqlalchemy.types import Integer
+from sqlalchemy.types import Integer, Numeric
 
 from app import db
 from app.api.helpers import Service
 from app.models import Brief, Domain, DomainCriteria, Evidence, EvidenceAssessment, Supplier
 
 
+def criteria_needed():
+    """The criteria needed for the evidence's max daily rate, worked out as DomainCriteria does.
+
+    NULL when the rate is missing or not a whole number.
+    """
+    rate = Evidence.data['maxDailyRate'].astext
+    return case(
+        [(
+            rate.op('~')('^[0-9]+$'),
+            Domain.criteria_needed + case([(cast(rate, Numeric) > Domain.price_maximum, 1)], else_=0)
+        )],
+        else_=None
+    ).label('criteriaNeeded')
+
+
 class EvidenceService(Service):
     __model__ = Evidence
 
@@ -156,7 +171,8 @@ class EvidenceService(Service):
                 Brief.id.label('brief_id'), Brief.closed_at.label('brief_closed_at'),
                 Brief.data['title'].astext.label('brief_title'),
                 Domain.name.label('domain_name'), Domain.id.label('domain_id'),
-                Domain.price_maximum.label('domain_price_maximum')
+                Domain.price_maximum.label('domain_price_maximum'),
+                criteria_needed()
             )
             .join(Domain, Evidence.domain_id == Domain.id)
             .join(Supplier, Evidence.supplier_code == Supplier.code)
@@ -177,7 +193,8 @@ class EvidenceService(Service):
                 Brief.id.label('brief_id'), Brief.closed_at.label('brief_closed_at'),
                 Brief.data['title'].astext.label('brief_title'),
                 Domain.name.label('domain_name'), Domain.id.label('domain_id'),
-                Domain.price_maximum.label('domain_price_maximum')
+                Domain.price_maximum.label('domain_price_maximum'),
+                criteria_needed()
             )
             .filter(
                 Evidence.submitted_at.isnot(None),
@@ -234,7 +251,8 @@ class EvidenceService(Service):
                 Brief.id.label('brief_id'), Brief.closed_at.label('brief_closed_at'),
                 Brief.data['title'].astext.label('brief_title'),
                 Domain.name.label('domain_name'), Domain.id.label('domain_id'),
-                Domain.price_maximum.label('domain_price_maximum')
+                Domain.price_maximum.label('domain_price_maximum'),
+                criteria_needed()
             )
             .filter(
                 Evidence.submitted_at.isnot(None),
@@ -21,6 +21,25 @@ class EvidenceAssessmentService(Service):
         )
         return feedback
 
+    def get_latest_assessments_for_evidence(self, evidence_ids):
+        """The most recent assessment for each of the evidence ids, keyed by evidence id."""
+        if not evidence_ids:
+            return {}
+        assessments = (
+            db.session.query(EvidenceAssessment)
+            .filter(
+                EvidenceAssessment.evidence_id.in_(evidence_ids)
+            )
+            .distinct(EvidenceAssessment.evidence_id)
+            .order_by(
+                EvidenceAssessment.evidence_id,
+                EvidenceAssessment.created_at.desc(),
+                EvidenceAssessment.id.desc()
+            )
+            .all()
+        )
+        return {assessment.evidence_id: assessment for assessment in assessments}
+
     def get_assessment_for_rejected_evidence(self, evidence_id):
         if not evidence_id:
             return False
@@ -3,6 +3,7 @@ from .briefs import BriefsService
 from .brief_responses import BriefResponsesService
 from .suppliers import SuppliersService
 from .feedback import FeedbackService
+from .changes import ChangesService
 # This is for report only queries.
 # The queries here should not be used by normal application code.
 # Since the queries for this will generally by quiet complex,
@@ -12,3 +13,4 @@ briefs_service = BriefsService()
 brief_responses_service = BriefResponsesService()
 suppliers_service = SuppliersService()
 feedback_service = FeedbackService()
+changes_service = ChangesService()
@@ -0,0 +1,136 @@
+import base64
+
+import pendulum
+from flask import current_app
+from sqlalchemy import false, func, literal, true, tuple_, union_all
+from sqlalchemy.sql import select
+
+from app import db
+from app.api.helpers import Service
+from app.datetime_utils import DateTime, utcnow
+from app.models import Brief, BriefResponse, Lot, Supplier, Tombstone
+
+
+def encode_watermark(changed_at, id):
+    return base64.urlsafe_b64encode('{}|{}'.format(changed_at.to_iso8601_string(extended=True), id))
+
+
+def decode_watermark(watermark):
+    """Returns the position a watermark marks in the feed, or raises ValueError if it isn't a watermark."""
+    try:
+        changed_at, id = base64.urlsafe_b64decode(str(watermark)).split('|')
+        return pendulum.parse(changed_at, tz='UTC'), int(id)
+    except (TypeError, ValueError):
+        raise ValueError('Invalid watermark: {}'.format(watermark))
+
+
+class ChangesService(Service):
+    __model__ = Tombstone
+
+    def __init__(self, *args, **kwargs):
+        super(ChangesService, self).__init__(*args, **kwargs)
+
+    def get_supplier_changes(self, since=None, limit=100):
+        return self._get_changes(
+            Supplier,
+            func.timezone('UTC', Supplier.last_update_time, type_=DateTime),
+            Supplier.code,
+            [
+                Supplier.name,
+                Supplier.abn,
+                Supplier.status
+            ],
+            since,
+            limit,
+            deleted=Supplier.status == 'deleted'
+        )
+
+    def get_brief_changes(self, since=None, limit=100):
+        return self._get_changes(
+            Brief,
+            Brief.updated_at,
+            Brief.id,
+            [
+                Lot.slug.label('lot'),
+                Brief.data['title'].astext.label('title'),
+                Brief.data['organisation'].astext.label('organisation'),
+                Brief.published_at.label('published_at'),
+                Brief.closed_at,
+                Brief.withdrawn_at
+            ],
+            since,
+            limit,
+            entity_type=Brief.__tablename__,
+            joins=[(Lot, Lot.id == Brief._lot_id)]
+        )
+
+    def get_brief_response_changes(self, since=None, limit=100):
+        return self._get_changes(
+            BriefResponse,
+            BriefResponse.updated_at,
+            BriefResponse.id,
+            [
+                BriefResponse.brief_id,
+                BriefResponse.supplier_code,
+                BriefResponse.status.label('status'),
+                BriefResponse.submitted_at,
+                BriefResponse.withdrawn_at
+            ],
+            since,
+            limit,
+            entity_type=BriefResponse.__tablename__
+        )
+
+    def _get_changes(self, model, changed_at, id, projection, since, limit, deleted=false(), entity_type=None,
+                     joins=()):
+        """Returns a page of the entities changed after the since watermark, ordered by when they changed, and the
+        watermark to fetch the next page from.
+
+        The page is found by keyset, then joined to the entity for its projection. Tombstones for entity_type are
+        reported as deleted entities with an empty projection.
+        """
+        settled_before = utcnow().subtract(seconds=current_app.config['CHANGE_FEED_SETTLE_SECONDS'])
+        position = decode_watermark(since) if since else None
+
+        def keyset(query, changed_at, id):
+            query = query.where(changed_at < literal(settled_before, DateTime))
+            if position:
+                query = query.where(
+                    tuple_(changed_at, id) > tuple_(literal(position[0], DateTime), literal(position[1]))
+                )
+            return query.order_by('changed_at', 'id').limit(limit).alias().select()
+
+        changes = [
+            keyset(select([changed_at.label('changed_at'), id.label('id'), deleted.label('deleted')]), changed_at, id)
+        ]
+        if entity_type:
+            changes.append(keyset(
+                select([
+                    Tombstone.deleted_at.label('changed_at'),
+                    Tombstone.entity_id.label('id'),
+                    true().label('deleted')
+                ])
+                .where(Tombstone.entity_type == entity_type),
+                Tombstone.deleted_at,
+                Tombstone.entity_id
+            ))
+
+        page = union_all(*changes).order_by('changed_at', 'id').limit(limit).alias('page')
+
+        query = (
+            db
+            .session
+            .query(page.c.changed_at, page.c.id, page.c.deleted, *projection)
+            .select_from(page)
+            .outerjoin(model, id == page.c.id)
+        )
+        for join_model, onclause in joins:
+            query = query.outerjoin(join_model, onclause)
+
+        items = [r._asdict() for r in query.order_by(page.c.changed_at, page.c.id).all()]
+
+        return {
+            'items': items,
+            'watermark': encode_watermark(items[-1]['changed_at'], items[-1]['id']) if items else since,
+            'hasMore': len(items) == limit
+        }
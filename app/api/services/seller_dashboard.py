@@ -80,7 +80,7 @@ class SellerDashboardService(object):
             .query(
                 Brief.id.label("brief_id")
             )
-            .filter(Brief.data['sellers']['{}'.format(supplier_code)].isnot(None))
+            .filter(Brief.data['sellers'].has_key(str(supplier_code)))  # noqa
         )
 
         query = union(responses_query, invited_query).alias('to_show_briefs')
@@ -30,6 +30,24 @@ class SupplierDomainService(Service):
 
         return [r._asdict() for r in result]
 
+    def get_supplier_domains_by_supplier_ids(self, supplier_ids):
+        result = (
+            db
+            .session
+            .query(
+                SupplierDomain.supplier_id,
+                SupplierDomain.price_status,
+                SupplierDomain.domain_id,
+                Domain.name.label('domain_name')
+            )
+            .join(Domain)
+            .filter(SupplierDomain.supplier_id.in_(supplier_ids))
+            .order_by(SupplierDomain.supplier_id, SupplierDomain.id)
+            .all()
+        )
+
+        return [r._asdict() for r in result]
+
     def set_supplier_domain_status(self, supplier_id, domain_id, status, price_status, do_commit=True):
         existing = self.filter(
             SupplierDomain.domain_id == domain_id,
@@ -2,14 +2,18 @@ from datetime import datetime, timedelta
 
 import pytz
 from sqlalchemy import and_, case, func, literal, or_, select, union
-from sqlalchemy.orm import joinedload, noload, raiseload
+from sqlalchemy.orm import joinedload
 from sqlalchemy.dialects.postgresql import aggregate_order_by
 
 from app import db
 from app.api.helpers import Service
-from app.models import (CaseStudy,
+from app.utils import escape_like
+from app.models import (Application,
+                        CaseStudy,
                         Domain,
                         Framework,
+                        MasterAgreement,
+                        SignedAgreement,
                         Supplier,
                         SupplierDomain,
                         SupplierFramework,
@@ -22,11 +26,17 @@ class SuppliersService(Service):
     def __init__(self, *args, **kwargs):
         super(SuppliersService, self).__init__(*args, **kwargs)
 
-    def get_suppliers_by_contact_email(self, emails):
-        return (db.session.query(Supplier)
-                .filter(func.lower(Supplier.data['contact_email'].astext).in_(emails))
-                .filter(Supplier.status != 'deleted')
-                .all())
+    def get_supplier_contact_emails(self, emails):
+        """The lower cased emails that are the contact email of a supplier that isn't deleted."""
+        if not emails:
+            return []
+        contact_email = func.lower(Supplier.data['contact_email'].astext)
+        results = (db.session.query(contact_email.label('contact_email'))
+                   .filter(contact_email.in_(emails))
+                   .filter(Supplier.status != 'deleted')
+                   .distinct()
+                   .all())
+        return [r.contact_email for r in results]
 
     def get_supplier_by_code(self, code, include_deleted=True):
         query = (
@@ -62,33 +72,166 @@ class SuppliersService(Service):
         )
 
     def get_suppliers_by_name_keyword(
-        self, keyword, framework_slug=None, category=None, exclude=None, exclude_recruiters=False
+        self, keyword, framework_slug=None, category=None, exclude=None, exclude_recruiters=False,
+        assessed_only=False, limit=20
     ):
-        query = (db.session.query(Supplier)
-                 .filter(Supplier.name.ilike('%{}%'.format(keyword.encode('utf-8'))))
-                 .filter(Supplier.status != 'deleted')
-                 .options(
-                     joinedload(Supplier.frameworks),
-                     joinedload(Supplier.domains),
-                     joinedload(Supplier.prices),
-                     joinedload('domains.domain'),
-                     joinedload('prices.service_role'),
-                     joinedload('frameworks.framework'),
-                     noload('frameworks.framework.lots'),
-                     raiseload('*')))
+        """Typeahead search on supplier name and ABN, backed by the trigram indexes on both columns.
+
+        Returns the code and name of at most `limit` suppliers, names starting with the keyword first and
+        then by similarity to it.
+        """
+        keyword = keyword.strip()
+        escaped = escape_like(keyword)
+        pattern = u'%{}%'.format(escaped)
+
+        query = (
+            db
+            .session
+            .query(
+                Supplier.code,
+                Supplier.name
+            )
+            .filter(
+                or_(
+                    Supplier.name.ilike(pattern, escape='!'),
+                    Supplier.abn.ilike(pattern, escape='!')
+                ),
+                Supplier.status != 'deleted'
+            )
+        )
         if framework_slug:
-            query = query.outerjoin(SupplierFramework).outerjoin(Framework)
-            query = query.filter(Framework.slug == framework_slug)
-        if category:
-            query = query.outerjoin(SupplierDomain)
-            query = query.filter(SupplierDomain.domain_id == category).filter(SupplierDomain.status == 'assessed')
+            query = query.filter(
+                db.session.query(SupplierFramework)
+                .join(Framework)
+                .filter(SupplierFramework.supplier_code == Supplier.code,
+                        Framework.slug == framework_slug)
+                .exists()
+            )
+        if category or assessed_only:
+            assessed_domain = (
+                db.session.query(SupplierDomain)
+                .filter(SupplierDomain.supplier_id == Supplier.id,
+                        SupplierDomain.status == 'assessed')
+            )
+            if category:
+                assessed_domain = assessed_domain.filter(SupplierDomain.domain_id == category)
+            query = query.filter(assessed_domain.exists())
         if exclude:
             query = query.filter(Supplier.code.notin_(exclude))
         if exclude_recruiters:
             query = query.filter(Supplier.data['recruiter'].astext != 'yes')
 
-        query.order_by(Supplier.name.asc()).limit(20)
-        return query.all()
+        result = (
+            query
+            .order_by(
+                Supplier.name.ilike(u'{}%'.format(escaped), escape='!').desc(),
+                func.similarity(Supplier.name, keyword).desc(),
+                Supplier.name.asc()
+            )
+            .limit(limit)
+            .all()
+        )
+
+        return [r._asdict() for r in result]
+
+    def get_supplier_profile_version(self, supplier_code):
+        """Returns a stamp of the supplier's profile, or None if the supplier doesn't exist or is deleted.
+
+        The stamp is the supplier's last_update_time and profile_version, which app.supplier_profiles bumps when a
+        flush writes the supplier's related rows, plus the row counts of the domain, framework and master agreement
+        tables the profile looks up. Other changes, such as edits to those tables' rows, are bounded by
+        SUPPLIER_PROFILE_CACHE_TTL.
+        """
+        def count(model):
+            return db.session.query(func.count(model.id)).as_scalar()
+
+        return (
+            db
+            .session
+            .query(
+                func.concat_ws(
+                    ':',
+                    Supplier.last_update_time,
+                    Supplier.profile_version,
+                    count(Domain),
+                    count(Framework),
+                    count(MasterAgreement)
+                )
+            )
+            .filter(Supplier.code == supplier_code,
+                    Supplier.status != 'deleted')
+            .scalar()
+        )
+
+    def get_supplier_messages_version(self, supplier_code):
+        """Returns a stamp of everything the supplier messages depend on, and the epoch time of the next master
+        agreement start or end, or None if the supplier doesn't exist.
+        """
+        edit_applications = (
+            db
+            .session
+            .query(
+                func.array_agg(aggregate_order_by(
+                    func.concat_ws(':', Application.id, Application.status, Application.updated_at),
+                    Application.id
+                ))
+            )
+            .filter(Application.supplier_code == Supplier.code,
+                    Application.type == 'edit')
+            .correlate(Supplier)
+            .as_scalar()
+        )
+
+        signed_agreements = (
+            db
+            .session
+            .query(
+                func.array_agg(aggregate_order_by(SignedAgreement.agreement_id, SignedAgreement.agreement_id))
+            )
+            .filter(SignedAgreement.supplier_code == Supplier.code)
+            .correlate(Supplier)
+            .as_scalar()
+        )
+
+        agreements = (
+            db
+            .session
+            .query(
+                func.array_agg(aggregate_order_by(
+                    func.concat_ws(':', MasterAgreement.id, MasterAgreement.start_date, MasterAgreement.end_date),
+                    MasterAgreement.id
+                ))
+            )
+            .as_scalar()
+        )
+
+        now = func.now()
+        next_agreement_change = (
+            db
+            .session
+            .query(
+                func.extract('epoch', func.min(func.least(
+                    case([(MasterAgreement.start_date > now, MasterAgreement.start_date)]),
+                    case([(MasterAgreement.end_date > now, MasterAgreement.end_date)])
+                )))
+            )
+            .as_scalar()
+        )
+
+        result = (
+            db
+            .session
+            .query(
+                func.md5(func.concat_ws(
+                    '|', Supplier.name, Supplier.data, edit_applications, signed_agreements, agreements
+                )).label('version'),
+                next_agreement_change.label('next_agreement_change')
+            )
+            .filter(Supplier.code == supplier_code)
+            .one_or_none()
+        )
+
+        return result._asdict() if result else None
 
     def get_supplier_assessed_status(self, supplier_id, category):
         return (
@@ -168,6 +311,28 @@ class SuppliersService(Service):
 
         return [r._asdict() for r in result]
 
+    def get_supplier_contacts_by_code(self, supplier_codes):
+        email_addresses = self.get_supplier_contacts_union()
+
+        result = (
+            db
+            .session
+            .query(
+                email_addresses.c.code,
+                email_addresses.c.email_address
+            )
+            .filter(
+                email_addresses.c.code.in_(supplier_codes)
+            )
+            .all()
+        )
+
+        contacts = {}
+        for code, email_address in result:
+            contacts.setdefault(code, []).append(email_address)
+
+        return contacts
+
     def get_suppliers_codes_with_domains(self, rejected_price_only):
         subquery = None
         if rejected_price_only:
@@ -302,10 +467,11 @@ class SuppliersService(Service):
         case_study_query = (
             db.session.query(
                 CaseStudy.supplier_code.label('supplier_code'),
-                CaseStudy.data['service'].astext.label('domain'),
+                CaseStudy.domain_id.label('domain_id'),
                 func.count(CaseStudy.id).label('count')
             )
-            .group_by(CaseStudy.supplier_code, CaseStudy.data['service'].astext)
+            .filter(CaseStudy.domain_id.isnot(None))
+            .group_by(CaseStudy.supplier_code, CaseStudy.domain_id)
         )
 
         subquery = (
@@ -329,7 +495,7 @@ class SuppliersService(Service):
             .join(SupplierDomain, Domain)
             .join(subquery, and_(
                 Supplier.code == subquery.columns.supplier_code,
-                Domain.name == subquery.columns.domain
+                SupplierDomain.domain_id == subquery.columns.domain_id
             ))
             .filter(
                 Supplier.status != 'deleted',
@@ -351,7 +517,7 @@ class SuppliersService(Service):
             .session
             .query(
                 Supplier.id,
-                func.json_array_elements_text(Supplier.data['certifications']).label('certifications')
+                func.jsonb_array_elements_text(Supplier.data['certifications']).label('certifications')
             )
             .subquery()
         )
@@ -4,6 +4,7 @@ from sqlalchemy.orm import joinedload, raiseload
 from sqlalchemy.dialects.postgresql import aggregate_order_by
 from app.api.helpers import Service
 from app.models import Team, TeamBrief, TeamMember, TeamMemberPermission, Agency, User, db
+from app.utils import escape_like
 
 
 class TeamService(Service):
@@ -204,21 +205,9 @@ class TeamService(Service):
 
         return [r._asdict() for r in result]
 
-    def search_team_members(self, current_user, agency_id, keywords=None, exclude=None):
+    def search_team_members(self, current_user, agency_id, keywords=None, exclude=None, limit=20):
         exclude = exclude if exclude else []
 
-        subquery = (
-            db
-            .session
-            .query(
-                TeamMember.user_id
-            )
-            .join(Team, User)
-            .filter(Team.status == 'completed')
-            .filter(User.agency_id == agency_id)
-            .subquery()
-        )
-
         results = (
             db
             .session
@@ -233,19 +222,26 @@ class TeamService(Service):
                 User.agency_id == agency_id
             )
             .filter(User.role == current_user.role)
-            .filter(User.id.notin_(exclude))
-            .filter(User.id.notin_(subquery))
+            .filter(User.in_completed_team.is_(False))
         )
 
+        if exclude:
+            results = results.filter(User.id.notin_(exclude))
+
         if keywords:
+            keyword = u'%{}%'.format(escape_like(keywords))
             results = results.filter(
                 or_(
-                    User.name.ilike('%{}%'.format(keywords.encode('utf-8'))),
-                    User.email_address.ilike('%{}%'.format(keywords.encode('utf-8')))
+                    User.name.ilike(keyword, escape='!'),
+                    User.email_address.ilike(keyword, escape='!')
                 )
             )
 
-        results = results.order_by(func.lower(User.name))
+        results = (
+            results
+            .order_by(func.lower(User.name), User.id)
+            .limit(limit)
+        )
         return [r._asdict() for r in results]
 
     def get_list_of_teams(self):
@@ -0,0 +1,208 @@
+from itertools import chain
+
+from sqlalchemy import event, exists, func, inspect, select, union
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.session import Session
+
+from app.api.helpers import Service
+from app.models import Brief, BriefUser, Team, TeamBrief, TeamMember, UserBriefAccess
+
+# first keys of the transaction level advisory locks held on a user, or a brief, while its access is refreshed
+REFRESH_LOCK_KEY = 26
+REFRESH_BRIEF_LOCK_KEY = 27
+
+
+class UserBriefAccessService(Service):
+    __model__ = UserBriefAccess
+
+    def __init__(self, *args, **kwargs):
+        super(UserBriefAccessService, self).__init__(*args, **kwargs)
+
+    def compute_access(self, session, user_ids=None, brief_ids=None):
+        """The access rows of the given users, or of the given briefs across all users."""
+        teammate = aliased(TeamMember)
+        own_brief_user = aliased(BriefUser)
+
+        # briefs created for any completed team the user belongs to
+        team_briefs = (
+            session
+            .query(
+                TeamMember.user_id.label('user_id'),
+                TeamBrief.brief_id.label('brief_id'),
+                TeamBrief.user_id.label('creator_id')
+            )
+            .select_from(TeamMember)
+            .join(Team, Team.id == TeamMember.team_id)
+            .join(TeamBrief, TeamBrief.team_id == TeamMember.team_id)
+            .filter(Team.status == 'completed')
+        )
+
+        # briefs owned by anyone in the same completed teams as the user
+        teammate_briefs = (
+            session
+            .query(
+                TeamMember.user_id.label('user_id'),
+                BriefUser.brief_id.label('brief_id'),
+                BriefUser.user_id.label('creator_id')
+            )
+            .select_from(TeamMember)
+            .join(Team, Team.id == TeamMember.team_id)
+            .join(teammate, teammate.team_id == TeamMember.team_id)
+            .join(BriefUser, BriefUser.user_id == teammate.user_id)
+            .filter(Team.status == 'completed')
+        )
+
+        # users outside of a completed team share briefs with the brief's other users
+        in_completed_team = (
+            exists()
+            .where(TeamMember.user_id == own_brief_user.user_id)
+            .where(TeamMember.team_id == Team.id)
+            .where(Team.status == 'completed')
+        )
+        user_briefs = (
+            session
+            .query(
+                own_brief_user.user_id.label('user_id'),
+                BriefUser.brief_id.label('brief_id'),
+                BriefUser.user_id.label('creator_id')
+            )
+            .select_from(own_brief_user)
+            .join(BriefUser, BriefUser.brief_id == own_brief_user.brief_id)
+            .filter(~in_completed_team)
+        )
+
+        if user_ids is not None:
+            team_briefs = team_briefs.filter(TeamMember.user_id.in_(user_ids))
+            teammate_briefs = teammate_briefs.filter(TeamMember.user_id.in_(user_ids))
+            user_briefs = user_briefs.filter(own_brief_user.user_id.in_(user_ids))
+
+        if brief_ids is not None:
+            team_briefs = team_briefs.filter(TeamBrief.brief_id.in_(brief_ids))
+            teammate_briefs = teammate_briefs.filter(BriefUser.brief_id.in_(brief_ids))
+            user_briefs = user_briefs.filter(BriefUser.brief_id.in_(brief_ids))
+
+        return union(team_briefs, teammate_briefs, user_briefs)
+
+    def insert_access(self, session, user_ids=None, brief_ids=None):
+        # a refresh by users and a refresh by briefs can both insert the same row, so the later one skips it
+        session.execute(
+            insert(UserBriefAccess.__table__)
+            .from_select(
+                ['user_id', 'brief_id', 'creator_id'],
+                self.compute_access(session, user_ids=user_ids, brief_ids=brief_ids)
+            )
+            .on_conflict_do_nothing()
+        )
+
+    def refresh(self, session, user_ids):
+        """Rebuilds all the access rows of the given users, for when their team membership changes."""
+        user_ids = sorted(set(user_ids))
+        if not user_ids:
+            return
+
+        # a refresh of the same user in another transaction would otherwise insert rows this one's delete can't see,
+        # and this insert would conflict with them. Locks are taken in order so two refreshes can't deadlock.
+        for user_id in user_ids:
+            session.execute(select([func.pg_advisory_xact_lock(REFRESH_LOCK_KEY, user_id)]))
+
+        session.execute(
+            UserBriefAccess.__table__
+            .delete()
+            .where(UserBriefAccess.user_id.in_(user_ids))
+        )
+        self.insert_access(session, user_ids=user_ids)
+
+    def refresh_briefs(self, session, brief_ids):
+        """Rebuilds the access rows of the given briefs only, for when their users or team change.
+
+        Access to a brief depends only on its own brief users and team briefs, and on team membership, so the rows of
+        other briefs are left alone.
+        """
+        brief_ids = sorted(set(brief_ids))
+        if not brief_ids:
+            return
+
+        for brief_id in brief_ids:
+            session.execute(select([func.pg_advisory_xact_lock(REFRESH_BRIEF_LOCK_KEY, brief_id)]))
+
+        session.execute(
+            UserBriefAccess.__table__
+            .delete()
+            .where(UserBriefAccess.brief_id.in_(brief_ids))
+        )
+        self.insert_access(session, brief_ids=brief_ids)
+
+    def get_affected_user_ids(self, session, user_ids, team_ids):
+        affected = set(user_ids)
+        team_ids = set(team_ids)
+
+        if affected:
+            # teammates in completed teams share each other's briefs
+            team_ids.update(
+                r.team_id for r in (
+                    session
+                    .query(TeamMember.team_id)
+                    .join(Team, Team.id == TeamMember.team_id)
+                    .filter(Team.status == 'completed')
+                    .filter(TeamMember.user_id.in_(affected))
+                    .all()
+                )
+            )
+
+        if team_ids:
+            affected.update(
+                r.user_id for r in (
+                    session
+                    .query(TeamMember.user_id)
+                    .filter(TeamMember.team_id.in_(team_ids))
+                    .all()
+                )
+            )
+
+        return affected
+
+
+def _attribute_values(obj, key):
+    history = inspect(obj).attrs[key].history
+    values = set(chain(history.added or [], history.unchanged or [], history.deleted or []))
+    return set(v for v in values if v is not None)
+
+
+def _changes_for_user_brief_access(session):
+    user_ids = set()
+    team_ids = set()
+    brief_ids = set()
+
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, TeamMember):
+            user_ids.update(_attribute_values(obj, 'user_id'))
+            team_ids.update(_attribute_values(obj, 'team_id'))
+        elif isinstance(obj, Team):
+            if obj in session.new or inspect(obj).attrs.status.history.has_changes():
+                team_ids.add(obj.id)
+        elif isinstance(obj, (TeamBrief, BriefUser)):
+            brief_ids.update(_attribute_values(obj, 'brief_id'))
+        elif isinstance(obj, Brief) and obj not in session.deleted:
+            history = inspect(obj).attrs.users.history
+            if history.added or history.deleted:
+                brief_ids.add(obj.id)
+
+    return user_ids, team_ids, brief_ids
+
+
+@event.listens_for(Session, 'after_flush')
+def maintain_user_brief_access(session, flush_context):
+    user_ids, team_ids, brief_ids = _changes_for_user_brief_access(session)
+    if not (user_ids or team_ids or brief_ids):
+        return
+
+    from app.api.services import user_brief_access_service
+
+    # membership changes move whole teams' access, so those users are rebuilt in full. Brief changes only move the
+    # rows of the changed briefs.
+    if user_ids or team_ids:
+        affected = user_brief_access_service.get_affected_user_ids(session, user_ids, team_ids)
+        user_brief_access_service.refresh(session, affected)
+
+    user_brief_access_service.refresh_briefs(session, brief_ids)
@@ -1,8 +1,10 @@
 from datetime import datetime
+from flask import current_app
+from sqlalchemy import or_
 from app.api.helpers import Service
 from app import db
 from app.api.helpers import generate_random_token
-from app.models import UserClaim
+from app.models import UserClaim, utcnow
 
 
 class UserClaimService(Service):
@@ -11,14 +13,22 @@ class UserClaimService(Service):
     def __init__(self, *args, **kwargs):
         super(UserClaimService, self).__init__(*args, **kwargs)
 
+    @staticmethod
+    def not_expired():
+        return or_(UserClaim.expires_at.is_(None), UserClaim.expires_at > utcnow())
+
     def get_active_claims(self, email_address=None, type=None, team_id=None):
-        query = db.session.query(UserClaim).filter(UserClaim.claimed.is_(False))
+        query = (
+            db.session.query(UserClaim)
+            .filter(UserClaim.claimed.is_(False))
+            .filter(self.not_expired())
+        )
         if email_address:
             query = query.filter(UserClaim.email_address == email_address)
         if type:
             query = query.filter(UserClaim.type == type)
         if team_id:
-            query = query.filter(UserClaim.data['team_id'].astext == str(team_id))
+            query = query.filter(UserClaim.team_id == team_id)
         return query.all()
 
     # records a claim of ownership of a user email address
@@ -28,7 +38,13 @@ class UserClaimService(Service):
         saved = False
         if email_address and data:
             token = generate_random_token()
-            claim = UserClaim(type=type, token=token, email_address=email_address, data=data)
+            claim = UserClaim(
+                type=type,
+                token=token,
+                email_address=email_address,
+                data=data,
+                expires_at=utcnow().add(days=current_app.config['USER_CLAIM_EXPIRY_DAYS'][type])
+            )
             self.save(claim)
             saved = True
         return claim if saved else None
@@ -38,6 +54,7 @@ class UserClaimService(Service):
             db.session.query(UserClaim)
             .filter(UserClaim.token == token, UserClaim.type == type)
             .filter(UserClaim.claimed.is_(claimed))
+            .filter(self.not_expired())
         )
         if email_address:
             query = query.filter(UserClaim.email_address == email_address)
@@ -51,7 +68,8 @@ class UserClaimService(Service):
                 UserClaim.type == type,
                 UserClaim.token == token,
                 UserClaim.email_address == email_address,
-                UserClaim.claimed.is_(False)
+                UserClaim.claimed.is_(False),
+                self.not_expired()
             ).first()
             if claim and age:
                 now = int(datetime.utcnow().strftime('%s'))
@@ -62,3 +80,24 @@ class UserClaimService(Service):
                 self.save(claim)
                 claimed = True
         return claim if claimed else None
+
+    def delete_expired_claims(self, batch_size):
+        """Deletes claims that have expired, batch_size rows per transaction. Returns the number deleted."""
+        deleted = 0
+        while True:
+            ids = (
+                db.session.query(UserClaim.id)
+                .filter(UserClaim.expires_at < utcnow())
+                .order_by(UserClaim.expires_at)
+                .limit(batch_size)
+                .subquery()
+            )
+            count = (
+                db.session.query(UserClaim)
+                .filter(UserClaim.id.in_(ids))
+                .delete(synchronize_session=False)
+            )
+            db.session.commit()
+            deleted += count
+            if count < batch_size:
+                return deleted
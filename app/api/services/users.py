@@ -1,5 +1,5 @@
 from sqlalchemy import and_, desc, func, literal
-from sqlalchemy.sql.expression import case, select
+from sqlalchemy.sql.expression import case, exists, select
 from sqlalchemy.orm import joinedload, raiseload
 from app import db
 from app.api.helpers import Service, abort
@@ -33,7 +33,7 @@ class UsersService(Service):
     def get_by_email(self, email):
         return self.find(email_address=email).one_or_none()
 
-    def get_buyer_team_members(self, agency_id):
+    def get_buyer_team_members(self, agency_id, limit=None, offset=0):
         completed_teams = (db.session
                              .query(TeamMember.user_id, Team.name)
                              .join(Team)
@@ -49,11 +49,43 @@ class UsersService(Service):
                      .filter(User.active.is_(True),
                              User.agency_id == agency_id,
                              User.role == 'buyer')
-                     .order_by(func.lower(User.name))
+                     .order_by(func.lower(User.name), User.id)
+                     .limit(limit)
+                     .offset(offset)
                      .all())
 
         return [r._asdict() for r in results]
 
+    def count_buyer_team_members(self, agency_id):
+        return (db.session
+                  .query(func.count(User.id))
+                  .filter(User.active.is_(True),
+                          User.agency_id == agency_id,
+                          User.role == 'buyer')
+                  .scalar())
+
+    def update_in_completed_team(self, user_ids, do_commit=True):
+        """Sets in_completed_team for the users from their current team memberships."""
+        if not user_ids:
+            return
+
+        db.session.flush()
+
+        in_completed_team = (
+            exists()
+            .where(and_(TeamMember.user_id == User.id,
+                        TeamMember.team_id == Team.id,
+                        Team.status == 'completed'))
+        )
+
+        (db.session
+           .query(User)
+           .filter(User.id.in_(user_ids))
+           .update({User.in_completed_team: in_completed_team}, synchronize_session=False))
+
+        if do_commit:
+            self.commit_changes()
+
     def get_by_id(self, user_id):
         query = (
             self.find(id=user_id)
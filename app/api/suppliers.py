@@ -1,12 +1,11 @@
-from flask import jsonify
+from flask import abort, current_app
 
-from app.models import Supplier
+from app.supplier_profiles import get_supplier_profile
 
 
 def get_supplier(code):
-    supplier = Supplier.query.filter(
-        Supplier.code == code,
-        Supplier.status != 'deleted'
-    ).first_or_404()
+    document = get_supplier_profile(code)
+    if document is None:
+        abort(404)
 
-    return jsonify(supplier.serializable), 200
+    return current_app.response_class(document, mimetype='application/json'), 200
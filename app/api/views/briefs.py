@@ -1211,7 +1211,8 @@ def create_brief_response(brief_id):
         brief_response = brief_responses_service.create(
             supplier=supplier,
             brief=brief,
-            data={}
+            data={},
+            created_by=current_user.email_address
         )
     except Exception as e:
         rollbar.report_exc_info()
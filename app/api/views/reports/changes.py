@@ -0,0 +1,32 @@
+from flask import abort, current_app, jsonify, request
+from app.api import api
+from app.api.helpers import require_api_key_auth
+from app.api.services.reports import changes_service
+from app.utils import get_positive_int_or_400
+
+
+@api.route('/reports/changes/<entity_type>', methods=['GET'])
+@require_api_key_auth
+def get_changes(entity_type):
+    """Suppliers, briefs or brief responses changed since a watermark, oldest change first.
+
+    Pass the watermark from each page as since to fetch the next page. Deleted entities are reported with
+    deleted set.
+    """
+    get_changes = {
+        'supplier': changes_service.get_supplier_changes,
+        'brief': changes_service.get_brief_changes,
+        'brief_response': changes_service.get_brief_response_changes
+    }.get(entity_type)
+    if not get_changes:
+        abort(404)
+
+    page_size = current_app.config['DM_API_CHANGE_FEED_PAGE_SIZE']
+    limit = min(get_positive_int_or_400(request.args, 'limit', page_size), page_size)
+
+    try:
+        result = get_changes(since=request.args.get('since'), limit=limit)
+    except ValueError as e:
+        abort(400, str(e))
+
+    return jsonify(result)
@@ -6,7 +6,7 @@ from flask_login import login_required
 from app.api import api
 from app.api.business.errors import NotFoundError
 from app.api.helpers import is_current_supplier, role_required
-from app.api.services import briefs, domain_service, suppliers
+from app.api.services import briefs, suppliers
 from app.api.suppliers import get_supplier
 from app.utils import get_json_from_request
 
@@ -175,26 +175,10 @@ def get_suppliers():
             framework_slug='digital-marketplace',
             category=category,
             exclude=supplier_codes_to_exclude,
-            exclude_recruiters=exclude_recruiters
+            exclude_recruiters=exclude_recruiters,
+            assessed_only=not all_suppliers
         )
 
-        supplier_results = []
-        for result in results:
-            if all_suppliers:
-                supplier = {}
-                supplier['name'] = result.name
-                supplier['code'] = result.code
-                supplier_results.append(supplier)
-            elif len(result.assessed_domains) > 0:
-                if category:
-                    domain = domain_service.get_by_name_or_id(int(category))
-                    if not domain or domain.name not in result.assessed_domains:
-                        continue
-                supplier = {}
-                supplier['name'] = result.name
-                supplier['code'] = result.code
-                supplier_results.append(supplier)
-
-        return jsonify(sellers=supplier_results), 200
+        return jsonify(sellers=results), 200
     else:
         return jsonify(message='You must provide a keyword param.'), 400
@@ -12,6 +12,7 @@ from app.tasks.mailchimp import (send_document_expiry_reminder,
                                  sync_mailchimp_seller_list)
 from app.tasks.supplier_tasks import update_supplier_metrics
 from app.tasks.dreamail import send_dreamail, send_dreamail_part_3
+from app.tasks import telemetry
 
 
 @api.route('/tasks/process-closed-briefs', methods=['POST'])
@@ -237,3 +238,22 @@ def run_send_dreamail_part_3():
         return jsonify(res.id)
     else:
         return jsonify(send_dreamail_part_3(simulate, skip_audit_check)), 200
+
+
+@api.route('/tasks/telemetry', methods=['GET'])
+@role_required('admin')
+def get_task_telemetry():
+    """Task run counts and average queue time, runtime and database cost
+    ---
+    tags:
+      - tasks
+    responses:
+      200:
+        type: object
+        properties:
+          tasks:
+            type: array
+            items:
+              type: object
+    """
+    return jsonify(tasks=telemetry.get_task_telemetry()), 200
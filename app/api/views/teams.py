@@ -1,5 +1,5 @@
 import rollbar
-from flask import jsonify, request
+from flask import current_app, jsonify, request
 from flask_login import current_user, login_required
 
 from app.api import api
@@ -13,7 +13,7 @@ from app.api.helpers import (
     exception_logger
 )
 from app.api.services import team_member_service
-from ...utils import get_json_from_request
+from ...utils import get_json_from_request, get_positive_int_or_400
 
 
 @api.route('/teams', methods=['GET'])
@@ -31,7 +31,8 @@ def get_teams_overview():
 @login_required
 @role_required('buyer')
 def get_people_overview():
-    team = team_business.get_people_overview()
+    page = get_positive_int_or_400(request.args, 'page', 1)
+    team = team_business.get_people_overview(page)
 
     return jsonify(team)
 
@@ -94,13 +95,18 @@ def update_team(team_id):
 def find_team_members():
     keywords = request.args.get('keywords') or ''
     exclude = request.args.get('exclude') or ''
+    limit = min(
+        get_positive_int_or_400(request.args, 'limit', 20),
+        current_app.config['DM_API_TEAM_MEMBERS_PAGE_SIZE']
+    )
 
     if keywords:
         results = team_business.search_team_members(
             current_user,
             current_user.agency_id,
             keywords=keywords,
-            exclude=exclude.split(',')
+            exclude=[int(user_id) for user_id in exclude.split(',') if user_id.strip().isdigit()],
+            limit=limit
         )
 
         return jsonify(users=results), 200
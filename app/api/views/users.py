@@ -5,7 +5,7 @@ from urllib import quote, unquote_plus
 from flask import current_app, jsonify, request, session
 from flask_login import current_user, login_required, login_user, logout_user
 
-from app import db, encryption
+from app import db, encryption, throttling
 from app.api import api
 from app.api.business import team_business, supplier_business
 from app.api.helpers import (allow_api_key_auth, get_email_domain,
@@ -82,15 +82,21 @@ def login():
     """
     json_payload = request.get_json()
     email_address = json_payload.get('emailAddress', None)
+    ip_address = throttling.get_client_ip(request)
+    if throttling.is_login_throttled(email_address, ip_address):
+        return jsonify(message='Too many login attempts. Please try again later.'), 429
+
     user = User.get_by_email_address(email_address.lower())
 
     if user is None or (user.supplier and user.supplier.status == 'deleted'):
+        throttling.record_failed_login(email_address, ip_address)
         return jsonify(message='User does not exist'), 403
     elif encryption.authenticate_user(json_payload.get('password', None), user) and user.active:
         user.logged_in_at = datetime.utcnow()
         user.failed_login_count = 0
         db.session.add(user)
         db.session.commit()
+        throttling.clear_failed_logins(user)
 
         if '_csrf_token' in session:
             session.pop('_csrf_token')
@@ -104,9 +110,7 @@ def login():
         loaded_user = load_user(user.id)
         return jsonify(user_info(loaded_user))
     else:
-        user.failed_login_count += 1
-        db.session.add(user)
-        db.session.commit()
+        throttling.record_failed_login(email_address, ip_address, user)
 
         return jsonify(message="Could not authorize user"), 403
 
@@ -307,8 +311,7 @@ def send_invite(token):
     if not email_address_encoded:
         return jsonify(message='You must provide an email address when validating a new account'), 400
     email_address = unquote_plus(email_address_encoded)
-    claim = user_claims_service.find(type='signup', token=token, email_address=email_address,
-                                     claimed=False).one_or_none()
+    claim = user_claims_service.get_claim(type='signup', token=token, email_address=email_address, claimed=False)
     if not claim:
         return jsonify(message='Invalid token'), 400
     name = claim.data.get('name', None)
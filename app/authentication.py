@@ -1,4 +1,7 @@
+import hashlib
+
 from flask import current_app, abort, request
+from six import text_type
 
 
 def get_api_key_from_request(request):
@@ -8,6 +11,12 @@ def get_api_key_from_request(request):
     return key
 
 
+def hash_api_key(key):
+    if isinstance(key, text_type):
+        key = key.encode('utf-8')
+    return hashlib.sha256(key).hexdigest()
+
+
 def requires_authentication():
     if current_app.config['AUTH_REQUIRED']:
         incoming_token = get_token_from_headers(request.headers)
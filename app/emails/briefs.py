@@ -806,7 +806,6 @@ def send_opportunity_closed_early_email(brief, current_user):
 
 def send_opportunity_edited_email_to_buyers(brief, current_user, edit):
     # to circumvent circular dependencies
-    from app.api.business.brief import brief_edit_business
     from app.api.services import audit_service, audit_types
 
     to_addresses = get_brief_emails(brief)
@@ -814,7 +813,7 @@ def send_opportunity_edited_email_to_buyers(brief, current_user, edit):
     summary = ''
     seller_questions_message = ''
     timezone = 'Australia/Canberra'
-    changes = brief_edit_business.get_changes_made_to_opportunity(brief, edit)
+    changes = edit.changes
 
     if 'closingDate' in changes:
         seller_questions_message = (
@@ -835,10 +834,7 @@ def send_opportunity_edited_email_to_buyers(brief, current_user, edit):
         )
 
     if 'sellers' in changes:
-        new_sellers = []
-        for key, value in changes['sellers']['newValue'].items():
-            if key not in changes['sellers']['oldValue']:
-                new_sellers.append(value['name'])
+        new_sellers = [value['name'] for value in changes['sellers']['added'].values()]
 
         number_of_sellers_invited = len(new_sellers)
         seller_or_sellers = 'seller' if number_of_sellers_invited == 1 else 'sellers'
@@ -17,7 +17,7 @@ from app.main import main
 from app.models import (Application, AuditEvent, Domain, SignedAgreement, User,
                         db)
 from app.tasks import publish_tasks
-from app.utils import (get_json_from_request, get_positive_int_or_400,
+from app.utils import (escape_like, get_json_from_request, get_positive_int_or_400,
                        get_valid_page_or_1, json_has_required_keys,
                        pagination_links, validate_and_return_updater_request)
 
@@ -348,7 +348,7 @@ def applications_list_response(with_task_status=False, status=None):
     return format_applications(applications, with_task_status)
 
 
-def format_applications(applications, with_task_status):
+def format_applications(applications, with_task_status, endpoint='.list_applications', endpoint_args=None):
     if request.args.get('order_by', None) == 'application.status desc, created_at desc':
         order_by = ['application.status desc', 'created_at desc']
     else:
@@ -387,8 +387,8 @@ def format_applications(applications, with_task_status):
         applications=apps_results,
         links=pagination_links(
             applications,
-            '.list_applications',
-            request.args
+            endpoint,
+            dict(request.args.items(), **(endpoint_args or {}))
         ),
         meta={
             "total": applications.total,
@@ -488,11 +488,13 @@ def search_applications(keyword):
     if keyword.isdigit():
         applications = Application.query.filter(Application.id == keyword)
     else:
-        applications = Application.query.outerjoin(User)
-        applications = applications.filter(or_(
-            Application.data["name"].astext.ilike('%{}%'.format(keyword)),
-            Application.data['contact_email'].astext.ilike('%{}%'.format(keyword)),
-            User.email_address.ilike('%{}%'.format(keyword))
+        pattern = u'%{}%'.format(escape_like(keyword))
+        applications = Application.query.filter(or_(
+            Application.search_document.ilike(pattern, escape='!'),
+            Application.id.in_(
+                db.session.query(User.application_id)
+                .filter(User.email_address.ilike(pattern, escape='!'))
+            )
         ))
 
     applications = applications.options(
@@ -501,7 +503,7 @@ def search_applications(keyword):
         noload("supplier.domains.assessments")
     )
 
-    return format_applications(applications, False)
+    return format_applications(applications, False, '.search_applications', {'keyword': keyword})
 
 
 @main.route('/tasks', methods=['GET'])
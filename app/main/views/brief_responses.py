@@ -52,6 +52,7 @@ def create_brief_response():
         data=brief_response_json,
         supplier=supplier,
         brief=brief,
+        created_by=updater_json['updated_by'],
     )
 
     brief_response.validate()
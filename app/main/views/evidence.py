@@ -21,15 +21,9 @@ def get_all_evidence_submitted():
     data = []
     for evidence in evidence_submitted:
         evidence_data = evidence._asdict()
-        try:
-            evidence_data['criteriaNeeded'] = int(
-                DomainCriteria(
-                    domain_id=evidence_data.get('domain_id', None),
-                    rate=evidence_data.get('maxDailyRate', None)
-                ).get_criteria_needed()
-            )
-        except DomainCriteriaInvalidRateException as e:
-            abort(400, str(e))
+        if evidence_data['criteriaNeeded'] is None:
+            abort(400, 'Invalid rate')
+        evidence_data['criteriaNeeded'] = int(evidence_data['criteriaNeeded'])
         data.append(evidence_data)
     return jsonify(evidence=data), 200
 
@@ -73,15 +67,9 @@ def get_evidence(evidence_id):
 
             evidence_data['approvedCriteria'] = approved_criteria
 
-            try:
-                evidence_data['criteriaNeeded'] = int(
-                    DomainCriteria(
-                        domain_id=evidence_data.get('domain_id', None),
-                        rate=evidence_data.get('maxDailyRate', None)
-                    ).get_criteria_needed()
-                )
-            except DomainCriteriaInvalidRateException as e:
-                abort(400, str(e))
+            if evidence_data['criteriaNeeded'] is None:
+                abort(400, 'Invalid rate')
+            evidence_data['criteriaNeeded'] = int(evidence_data['criteriaNeeded'])
     return jsonify(evidence=evidence_data), 200
 
 
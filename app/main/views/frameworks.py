@@ -1,15 +1,14 @@
 from flask import jsonify, abort, request
-from sqlalchemy.types import String
 from sqlalchemy.exc import IntegrityError, DataError
 from sqlalchemy.orm import joinedload
-from sqlalchemy import func, orm, case, cast
+from sqlalchemy import and_, func
 import datetime
 
 from dmapiclient.audit import AuditTypes
 from dmutils.config import convert_to_boolean
 from .. import main
 from ...models import (
-    db, Framework, DraftService, User, Supplier, SupplierFramework, AuditEvent, Lot,
+    db, Framework, DraftService, User, SupplierFramework, AuditEvent, Lot,
 )
 from ...utils import (
     get_json_from_request, json_has_required_keys, json_only_has_required_keys,
@@ -124,42 +123,33 @@ def get_framework_stats(framework_slug):
 
     seven_days_ago = datetime.datetime.utcnow() + datetime.timedelta(-7)
 
-    has_completed_drafts_query = db.session.query(
-        DraftService.supplier_code, func.min(DraftService.id)
-    ).filter(
-        DraftService.framework_id == framework.id,
-        DraftService.status == 'submitted'
-    ).group_by(
-        DraftService.supplier_code
-    ).subquery('completed_drafts')
-
-    drafts_alias = orm.aliased(DraftService, has_completed_drafts_query)
-
     def label_columns(labels, query):
         return [
             dict(zip(labels, item))
             for item in sorted(query, key=lambda x: list(map(str, x)))
         ]
 
-    is_declaration_complete = case([
-        (SupplierFramework.declaration['status'].cast(String) == 'complete', True)
-    ], else_=False)
+    is_declaration_complete = SupplierFramework.declaration_status == 'complete'
+    declaration_status = func.nullif(SupplierFramework.declaration_status, '')
+    has_completed_services = SupplierFramework.submitted_draft_count > 0
 
     return jsonify({
         'services': label_columns(
             ['status', 'lot', 'declaration_made', 'count'],
             db.session.query(
                 DraftService.status, Lot.slug, is_declaration_complete, func.count()
-            ).outerjoin(
-                SupplierFramework, DraftService.supplier_code == SupplierFramework.supplier_code
+            ).join(
+                SupplierFramework, and_(
+                    DraftService.supplier_code == SupplierFramework.supplier_code,
+                    DraftService.framework_id == SupplierFramework.framework_id
+                )
             ).join(
                 Lot, DraftService.lot_id == Lot.id
             ).group_by(
                 DraftService.status, Lot.slug, is_declaration_complete
             ).filter(
-                SupplierFramework.framework_id == framework.id,
                 DraftService.framework_id == framework.id,
-                cast(SupplierFramework.declaration, String) != 'null'
+                SupplierFramework.declaration_status.isnot(None)
             ).all()
         ),
         'supplier_users': label_columns(
@@ -175,19 +165,12 @@ def get_framework_stats(framework_slug):
         'interested_suppliers': label_columns(
             ['declaration_status', 'has_completed_services', 'count'],
             db.session.query(
-                SupplierFramework.declaration['status'].cast(String),
-                drafts_alias.supplier_code.isnot(None), func.count()
-            ).select_from(
-                Supplier
-            ).join(
-                SupplierFramework
-            ).outerjoin(
-                drafts_alias
+                declaration_status, has_completed_services, func.count()
             ).filter(
                 SupplierFramework.framework_id == framework.id,
-                cast(SupplierFramework.declaration, String) != 'null'
+                SupplierFramework.declaration_status.isnot(None)
             ).group_by(
-                SupplierFramework.declaration['status'].cast(String), drafts_alias.supplier_code.isnot(None)
+                declaration_status, has_completed_services
             ).all()
         )
     })
@@ -56,7 +56,7 @@ def get_domain_metrics():
                                 WHEN application.status = 'saved' THEN 'unsubmitted'
                             END) status
                             FROM
-                              application, json_each(application.data->'services') badge
+                              application, jsonb_each(application.data->'services') badge
                             WHERE "value"::TEXT = 'true'
                             AND (application.status = 'saved' OR application.status = 'submitted')
                             AND (application.type = 'new' OR application.type = 'upgrade')
@@ -77,7 +77,7 @@ def get_domain_metrics():
 def get_seller_type_metrics():
     metrics = {}
 
-    query = "SELECT key, count(*) FROM application, json_each(application.data->'seller_type') badge " \
+    query = "SELECT key, count(*) FROM application, jsonb_each(application.data->'seller_type') badge " \
             "where key != 'recruiter' " \
             "AND (application.type = 'new' OR application.type = 'upgrade') GROUP BY key " \
             "union select 'recruiter', count(*) from application where application.data->>'recruiter' = 'yes' " \
@@ -98,7 +98,7 @@ def get_seller_type_metrics():
 def get_step_metrics():
     metrics = {}
 
-    query = "SELECT key, count(*) FROM application, json_each(application.data->'steps') steps WHERE " \
+    query = "SELECT key, count(*) FROM application, jsonb_each(application.data->'steps') steps WHERE " \
             "(application.status = 'saved' OR application.status = 'submitted')" \
             "AND (application.type = 'new' OR application.type = 'upgrade')GROUP BY key"
     for (step, count) in db.session.execute(query).fetchall():
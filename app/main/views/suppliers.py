@@ -26,6 +26,8 @@ from app.utils import (
     get_valid_page_or_1, json_has_required_keys, pagination_links,
     validate_and_return_updater_request
 )
+from ... import supplier_imports
+from ...supplier_profiles import get_supplier_profile
 from ...supplier_utils import validate_agreement_details_data
 from dmapiclient.audit import AuditTypes
 from dmutils.logging import notify_team
@@ -97,24 +99,11 @@ def list_suppliers():
 
 @main.route('/suppliers/<int:code>', methods=['GET'])
 def get_supplier(code):
-    supplier = (
-        Supplier
-        .query
-        .filter(
-            Supplier.code == code,
-            Supplier.status != 'deleted'
-        )
-        .options(
-            joinedload('domains.domain'),
-            noload('domains.supplier'),
-            noload('domains.assessments'),
-            joinedload('domains.recruiter_info')
-        )
-        .first_or_404()
-    )
+    document = get_supplier_profile(code)
+    if document is None:
+        abort(404)
 
-    supplier.get_service_counts()
-    return jsonify(supplier=supplier.serializable)
+    return current_app.response_class('{{"supplier": {}}}'.format(document), mimetype='application/json')
 
 
 @main.route('/suppliers/<int:code>', methods=['DELETE'])
@@ -195,7 +184,7 @@ def product_search():
     if seller_types:
         selected_seller_types = select(
             [postgres.array_agg(column('key'))],
-            from_obj=func.json_each_text(Supplier.data[('seller_type',)]),
+            from_obj=func.jsonb_each_text(Supplier.data[('seller_type',)]),
             whereclause=cast(column('value'), Boolean)
         ).as_scalar()
 
@@ -291,7 +280,7 @@ def casestudies_search():
     if seller_types:
         selected_seller_types = select(
             [postgres.array_agg(column('key'))],
-            from_obj=func.json_each_text(Supplier.data[('seller_type',)]),
+            from_obj=func.jsonb_each_text(Supplier.data[('seller_type',)]),
             whereclause=cast(column('value'), Boolean)
         ).as_scalar()
 
@@ -447,7 +436,7 @@ def do_search(search_query, offset, result_count, new_domains, framework_slug):
     if seller_types_list is not None:
         selected_seller_types = select(
             [postgres.array_agg(column('key'))],
-            from_obj=func.json_each_text(Supplier.data[('seller_type',)]),
+            from_obj=func.jsonb_each_text(Supplier.data[('seller_type',)]),
             whereclause=cast(column('value'), Boolean)
         ).as_scalar()
 
@@ -587,6 +576,47 @@ def update_supplier(code):
     return update_supplier_data_impl(supplier, supplier_data, 200)
 
 
+def get_import_batch_or_400(key):
+    request_data = get_json_from_request()
+    json_has_required_keys(request_data, [key])
+    rows = request_data[key]
+
+    if not isinstance(rows, list):
+        abort(400, "'{}' must be a list".format(key))
+    if len(rows) > current_app.config['DM_API_SUPPLIER_IMPORT_BATCH_SIZE']:
+        abort(400, 'At most {} {} can be imported at once'.format(
+            current_app.config['DM_API_SUPPLIER_IMPORT_BATCH_SIZE'], key
+        ))
+
+    return rows
+
+
+@main.route('/suppliers/bulk', methods=['POST'])
+def import_suppliers():
+    rows = get_import_batch_or_400('suppliers')
+
+    try:
+        results = supplier_imports.import_suppliers(rows)
+    except IntegrityError as e:
+        db.session.rollback()
+        return jsonify(message="Database Error: {0}".format(e)), 400
+
+    return jsonify(results=results), 200
+
+
+@main.route('/suppliers/prices/bulk', methods=['POST'])
+def import_supplier_prices():
+    rows = get_import_batch_or_400('prices')
+
+    try:
+        results = supplier_imports.import_prices(rows)
+    except IntegrityError as e:
+        db.session.rollback()
+        return jsonify(message="Database Error: {0}".format(e)), 400
+
+    return jsonify(results=results), 200
+
+
 @main.route('/suppliers/<int:code>/frameworks/<framework_slug>/declaration', methods=['PUT'])
 def set_a_declaration(code, framework_slug):
     framework = Framework.query.filter(
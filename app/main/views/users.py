@@ -1,14 +1,17 @@
+import json
 from datetime import datetime
+from io import StringIO
+
+import csvx
 from dmapiclient.audit import AuditTypes
-from sqlalchemy import func
 from sqlalchemy.orm import lazyload, noload, joinedload, raiseload
 from sqlalchemy.exc import IntegrityError, DataError
-from flask import jsonify, abort, request, current_app
+from flask import jsonify, abort, request, current_app, Response, stream_with_context
 
-from app import db, encryption
+from app import db, encryption, throttling
 from app.main import main
 from app.models import (
-    AuditEvent, Contact, DraftService, Framework, Supplier, SupplierContact, SupplierFramework, SupplierUserInviteLog,
+    AuditEvent, Contact, Framework, Supplier, SupplierContact, SupplierFramework, SupplierUserInviteLog,
     User, Application
 )
 from app.utils import (
@@ -42,6 +45,10 @@ def auth_user():
         # will remove camel case email address with future api
         email_address = json_payload.get('emailAddress', None)
 
+    ip_address = throttling.get_client_ip(request)
+    if throttling.is_login_throttled(email_address, ip_address):
+        return jsonify(authorization=False), 429
+
     user = User.query.options(
         joinedload('supplier'),
         noload('supplier.*'),
@@ -53,12 +60,14 @@ def auth_user():
     ).first()
 
     if user is None or (user.supplier and user.supplier.status == 'deleted'):
+        throttling.record_failed_login(email_address, ip_address)
         return jsonify(authorization=False), 404
     elif encryption.authenticate_user(json_payload['password'], user) and user.active:
         user.logged_in_at = datetime.utcnow()
         user.failed_login_count = 0
         db.session.add(user)
         db.session.commit()
+        throttling.clear_failed_logins(user)
 
         validation_result = None
         if user.role == 'supplier':
@@ -69,9 +78,7 @@ def auth_user():
 
         return jsonify(users=user.serialize(), validation_result=validation_result), 200
     else:
-        user.failed_login_count += 1
-        db.session.add(user)
-        db.session.commit()
+        throttling.record_failed_login(email_address, ip_address, user)
 
         return jsonify(authorization=False), 403
 
@@ -428,72 +435,119 @@ def update_user(user_id):
         abort(400, "Could not update user with: {0}".format(user_update))
 
 
-@main.route('/users/export/<framework_slug>', methods=['GET'])
-def export_users_for_framework(framework_slug):
+USER_EXPORT_FIELDS = [
+    'user_email',
+    'user_name',
+    'supplier_code',
+    'declaration_status',
+    'application_status',
+    'framework_agreement',
+    'application_result'
+]
+USER_EXPORT_BATCH_SIZE = 1000
 
-    # 400 if framework slug is invalid
-    framework = Framework.query.filter(Framework.slug == framework_slug).first()
-    if not framework:
-        abort(400, 'invalid framework')
 
-    if framework.status == 'coming':
-        abort(400, 'framework not yet open')
-
-    supplier_frameworks_and_suppliers_and_users = db.session.query(
-        SupplierFramework, Supplier, User
-    ).join(
-        Supplier, User, Framework
-    ).filter(
-        Framework.slug == framework_slug
-    ).filter(
-        User.active.is_(True)
-    ).all()
-
-    submitted_draft_counts_per_supplier = {}
-    user_rows = []
-
-    for sf, s, u in supplier_frameworks_and_suppliers_and_users:
+def get_user_export_rows(framework):
+    results = (
+        db
+        .session
+        .query(
+            User.email_address,
+            User.name,
+            Supplier.code,
+            SupplierFramework.declaration_status,
+            SupplierFramework.on_framework,
+            SupplierFramework.agreement_returned_at,
+            SupplierFramework.submitted_draft_count
+        )
+        .select_from(SupplierFramework)
+        .join(Supplier, Supplier.code == SupplierFramework.supplier_code)
+        .join(User, User.supplier_code == Supplier.code)
+        .filter(SupplierFramework.framework_id == framework.id)
+        .filter(User.active.is_(True))
+        .yield_per(USER_EXPORT_BATCH_SIZE)
+    )
 
+    for result in results:
         # always get the declaration status
-        declaration_status = sf.declaration.get('status') if sf.declaration else 'unstarted'
+        declaration_status = result.declaration_status or 'unstarted'
         application_status = ''
         application_result = ''
         framework_agreement = ''
 
         # if framework is pending, live, or expired
         if framework.status != 'open':
-
-            # get number of completed draft services per supplier
             # `application_status` is based on a complete declaration and at least one completed draft service
-            if sf.supplier_code not in submitted_draft_counts_per_supplier.keys():
-                submitted_draft_counts_per_supplier[sf.supplier_code] = db.session.query(
-                    func.count()
-                ).filter(
-                    DraftService.supplier_code == sf.supplier_code,
-                    DraftService.framework_id == sf.framework_id,
-                    DraftService.status == 'submitted'
-                ).scalar()
-
-            submitted_draft_count = submitted_draft_counts_per_supplier[sf.supplier_code]
-            application_status = \
-                'application' if submitted_draft_count and declaration_status == 'complete' else 'no_application'
-            if sf.on_framework is None:
+            application_status = (
+                'application' if result.submitted_draft_count and declaration_status == 'complete'
+                else 'no_application'
+            )
+            if result.on_framework is None:
                 application_result = 'no result'
             else:
-                application_result = 'pass' if sf.on_framework else 'fail'
-            framework_agreement = bool(sf.agreement_returned_at)
+                application_result = 'pass' if result.on_framework else 'fail'
+            framework_agreement = bool(result.agreement_returned_at)
 
-        user_rows.append({
-            'user_email': u.email_address,
-            'user_name': u.name,
-            'supplier_code': s.code,
+        yield {
+            'user_email': result.email_address,
+            'user_name': result.name,
+            'supplier_code': result.code,
             'declaration_status': declaration_status,
             'application_status': application_status,
             'framework_agreement': framework_agreement,
             'application_result': application_result
-        })
+        }
+
+
+def generate_user_export_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row) + '\n'
+
+
+def generate_user_export_csv(rows):
+    buffer = StringIO()
+    writer = csvx.Writer(buffer)
+    writer.write_row(USER_EXPORT_FIELDS)
+    for row in rows:
+        writer.write_row([row[field] for field in USER_EXPORT_FIELDS])
+        if writer.row_count % USER_EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+@main.route('/users/export/<framework_slug>', methods=['GET'])
+def export_users_for_framework(framework_slug):
+    output_format = request.args.get('format', 'json')
+    if output_format not in ['json', 'ndjson', 'csv']:
+        abort(400, 'invalid format')
+
+    # 400 if framework slug is invalid
+    framework = Framework.query.filter(Framework.slug == framework_slug).first()
+    if not framework:
+        abort(400, 'invalid framework')
+
+    if framework.status == 'coming':
+        abort(400, 'framework not yet open')
+
+    rows = get_user_export_rows(framework)
+
+    if output_format == 'ndjson':
+        return Response(
+            stream_with_context(generate_user_export_ndjson(rows)),
+            mimetype='application/x-ndjson'
+        )
+
+    if output_format == 'csv':
+        response = Response(
+            stream_with_context(generate_user_export_csv(rows)),
+            mimetype='text/csv'
+        )
+        response.headers['Content-Disposition'] = 'attachment; filename="users-{}.csv"'.format(framework_slug)
+        return response
 
-    return jsonify(users=[user for user in user_rows])
+    return jsonify(users=list(rows))
 
 
 def invite_response(db_results):
@@ -15,16 +15,18 @@ from operator import itemgetter
 from six import string_types, text_type, binary_type
 
 from sqlalchemy import text
-from sqlalchemy import asc, desc, func, and_
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import asc, desc, event, func, and_
+from sqlalchemy.dialects.postgresql import JSON, JSONB
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.ext.hybrid import hybrid_property, hybrid_method
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import validates, relationship, column_property, noload
+from sqlalchemy.orm.attributes import get_history
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import case as sql_case
 from sqlalchemy.sql.expression import cast as sql_cast
+from sqlalchemy.sql.expression import select
 from sqlalchemy.types import String, Date, Integer, Interval
 from sqlalchemy_utils import generic_relationship
 from sqlalchemy.schema import Sequence, CheckConstraint
@@ -45,6 +47,7 @@ from .datetime_utils import DateTime, utcnow, parse_interval, is_textual, \
 import pendulum
 
 from .jiraapi import get_marketplace_jira
+from .authentication import hash_api_key
 from .modelsbase import normalize_key_case
 from .utils import sorted_uniques
 from itertools import groupby
@@ -127,6 +130,7 @@ class ApiKey(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), index=True, nullable=False)
     key = db.Column(db.String(64), index=True, nullable=False, unique=True)
+    key_hash = db.Column(db.String(64), index=True, nullable=False, unique=True)
     created_at = db.Column(DateTime, index=True, nullable=False, default=utcnow)
     revoked_at = db.Column(DateTime, index=True, nullable=True)
 
@@ -143,6 +147,7 @@ class ApiKey(db.Model):
     def validate_key(self, key, value):
         if len(value) <= 63:
             raise ValueError('key is too short')
+        self.key_hash = hash_api_key(value)
         return value
 
 
@@ -654,7 +659,8 @@ class Supplier(db.Model):
         'work_orders',
         'applications',
         'brief_responses',
-        'text_vector']
+        'text_vector',
+        'profile_version']
 
     DUMMY_ABN = '50 110 219 460'
 
@@ -709,7 +715,7 @@ class Supplier(db.Model):
         nullable=False
     )
     is_recruiter = db.Column(db.String, nullable=False, default=False, server_default=text('false'))
-    data = db.Column(MutableDict.as_mutable(JSON), default=dict)
+    data = db.Column(MutableDict.as_mutable(JSONB), default=dict)
 
     # TODO: migrate these to plain (non-timezone) fields
     creation_time = db.Column(DateTime(timezone=True),
@@ -720,7 +726,11 @@ class Supplier(db.Model):
     last_update_time = db.Column(DateTime(timezone=True),
                                  index=False,
                                  nullable=False,
-                                 default=localnow)
+                                 default=localnow,
+                                 onupdate=localnow)
+
+    # bumped by app.supplier_profiles whenever a flush writes the supplier or one of its related rows
+    profile_version = db.Column(db.Integer, nullable=False, default=0, server_default=text('0'))
 
     domains = relationship("SupplierDomain", back_populates="supplier")
     signed_agreements = db.relationship('SignedAgreement', single_parent=True, order_by="SignedAgreement.agreement_id")
@@ -1292,6 +1302,11 @@ class SupplierFramework(db.Model):
     agreement_returned_at = db.Column(DateTime, index=False, unique=False, nullable=True)
     countersigned_at = db.Column(DateTime, index=False, unique=False, nullable=True)
     agreement_details = db.Column(MutableDict.as_mutable(JSON))
+    # declaration['status'] for the framework stats, '' when the declaration has none and null when there is no
+    # declaration, maintained by set_declaration_status
+    declaration_status = db.Column(db.String, nullable=True)
+    # submitted drafts on the framework, maintained by set_submitted_draft_count and the draft service events
+    submitted_draft_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     supplier = db.relationship(Supplier, lazy='joined', innerjoin=True)
     framework = db.relationship(Framework, lazy='joined', innerjoin=True)
@@ -1449,6 +1464,9 @@ class User(db.Model):
                           db.ForeignKey('agency.id'),
                           index=True, unique=False, nullable=True)
 
+    # whether the user belongs to a completed team, maintained by team_business.update_team
+    in_completed_team = db.Column(db.Boolean, nullable=False, default=False, server_default=text('false'))
+
     @validates('email_address')
     def validate_email_address(self, key, value):
         from app.api.helpers import get_email_domain
@@ -1564,11 +1582,15 @@ class UserClaim(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     email_address = db.Column(db.String, index=True, unique=False, nullable=False)
-    token = db.Column(db.String, index=True, nullable=False)
+    token = db.Column(db.String, index=True, unique=True, nullable=False)
     data = db.Column(MutableDict.as_mutable(JSON), default=dict)
     claimed = db.Column(db.Boolean, index=False, unique=False, nullable=False, default=False)
     created_at = db.Column(DateTime, index=False, unique=False, nullable=False, default=utcnow)
     updated_at = db.Column(DateTime, index=False, nullable=False, default=utcnow, onupdate=utcnow)
+    # claims can't be used after this, and are deleted by the prune_expired_user_claims task
+    expires_at = db.Column(DateTime, index=True, nullable=True)
+    # the team a join_team claim is for, maintained by set_user_claim_team_id
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id'), index=True, nullable=True)
     type = db.Column(
         db.Enum(
             *[
@@ -1592,11 +1614,19 @@ class UserClaim(db.Model):
             'claimed': self.claimed,
             'type': self.type,
             'created_at': self.created_at,
-            'updated_at': self.updated_at
+            'updated_at': self.updated_at,
+            'expires_at': self.expires_at
         }
         return serialized
 
 
+@event.listens_for(UserClaim, 'before_insert')
+@event.listens_for(UserClaim, 'before_update')
+def set_user_claim_team_id(mapper, connection, target):
+    team_id = (target.data or {}).get('team_id') if target.type == 'join_team' else None
+    target.team_id = int(team_id) if team_id else None
+
+
 class SupplierUserInviteLog(db.Model):
     __tablename__ = 'supplier_user_invite_log'
 
@@ -1886,6 +1916,67 @@ class DraftService(ServiceTableMixin, db.Model):
         return url_for(".fetch_draft_service", draft_id=self.id)
 
 
+@event.listens_for(SupplierFramework, 'before_insert')
+@event.listens_for(SupplierFramework, 'before_update')
+def set_declaration_status(mapper, connection, target):
+    declaration = target.declaration
+    target.declaration_status = declaration.get('status', '') if isinstance(declaration, dict) else None
+
+
+@event.listens_for(SupplierFramework, 'before_insert')
+def set_submitted_draft_count(mapper, connection, target):
+    target.submitted_draft_count = connection.scalar(
+        select([func.count()])
+        .select_from(DraftService.__table__)
+        .where(and_(
+            DraftService.supplier_code == target.supplier_code,
+            DraftService.framework_id == target.framework_id,
+            DraftService.status == 'submitted'
+        ))
+    )
+
+
+def _change_submitted_draft_count(connection, supplier_code, framework_id, change):
+    table = SupplierFramework.__table__
+    connection.execute(
+        table.update()
+        .where(and_(table.c.supplier_code == supplier_code, table.c.framework_id == framework_id))
+        .values(submitted_draft_count=table.c.submitted_draft_count + change)
+    )
+
+
+def _previous_value(target, key):
+    history = get_history(target, key)
+    return history.deleted[0] if history.deleted else getattr(target, key)
+
+
+@event.listens_for(DraftService, 'after_insert')
+def count_submitted_draft(mapper, connection, target):
+    if target.status == 'submitted':
+        _change_submitted_draft_count(connection, target.supplier_code, target.framework_id, 1)
+
+
+@event.listens_for(DraftService, 'after_update')
+def count_submitted_drafts(mapper, connection, target):
+    previous = [_previous_value(target, key) for key in ('supplier_code', 'framework_id', 'status')]
+    current = [target.supplier_code, target.framework_id, target.status]
+    if previous == current:
+        return
+
+    if previous[2] == 'submitted':
+        _change_submitted_draft_count(connection, previous[0], previous[1], -1)
+    if current[2] == 'submitted':
+        _change_submitted_draft_count(connection, current[0], current[1], 1)
+
+
+@event.listens_for(DraftService, 'after_delete')
+def uncount_submitted_draft(mapper, connection, target):
+    if _previous_value(target, 'status') == 'submitted':
+        _change_submitted_draft_count(
+            connection, _previous_value(target, 'supplier_code'), _previous_value(target, 'framework_id'), -1
+        )
+
+
 class AuditEvent(db.Model):
     __tablename__ = 'audit_event'
 
@@ -1893,7 +1984,7 @@ class AuditEvent(db.Model):
     type = db.Column(db.String, index=True, nullable=False)
     created_at = db.Column(DateTime, index=True, nullable=False, default=utcnow)
     user = db.Column(db.String)
-    data = db.Column(MutableDict.as_mutable(JSON), default=dict)
+    data = db.Column(MutableDict.as_mutable(JSONB), default=dict)
 
     object_type = db.Column(db.String)
     object_id = db.Column(db.BigInteger)
@@ -1997,7 +2088,7 @@ class Brief(db.Model):
 
     domain_id = db.Column(db.Integer, db.ForeignKey('domain.id'), nullable=True)
 
-    data = db.Column(MutableDict.as_mutable(JSON))
+    data = db.Column(MutableDict.as_mutable(JSONB))
     created_at = db.Column(DateTime, index=True, nullable=False,
                            default=utcnow)
     updated_at = db.Column(DateTime, index=True, nullable=False,
@@ -2413,6 +2504,8 @@ class BriefHistory(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), index=True, nullable=False)
     edited_at = db.Column(DateTime, index=True, default=utcnow, nullable=False)
     data = db.Column(MutableDict.as_mutable(JSON), default=dict, nullable=False)
+    # the fields changed by this edit and the sellers it invited, worked out when the edit is made
+    changes = db.Column(JSON, nullable=True)
 
 
 class BriefUser(db.Model):
@@ -2436,11 +2529,14 @@ class BriefResponse(db.Model):
     __tablename__ = 'brief_response'
 
     id = db.Column(db.Integer, primary_key=True)
-    data = db.Column(JSON, nullable=False)
+    data = db.Column(JSONB, nullable=False)
 
     brief_id = db.Column(db.Integer, db.ForeignKey('brief.id'), nullable=False)
     supplier_code = db.Column(db.BigInteger, db.ForeignKey('supplier.code'), nullable=False)
 
+    # email address of the user that started the response
+    created_by = db.Column(db.String, nullable=True)
+
     created_at = db.Column(DateTime, index=True, nullable=False, default=utcnow)
     updated_at = db.Column(DateTime, index=True, nullable=False, default=utcnow, onupdate=utcnow)
     submitted_at = db.Column(DateTime, index=True, nullable=True)
@@ -2832,7 +2928,7 @@ class Application(db.Model):
     __tablename__ = 'application'
 
     id = db.Column(db.Integer, primary_key=True)
-    data = db.Column(MutableDict.as_mutable(JSON), default=dict, nullable=False)
+    data = db.Column(MutableDict.as_mutable(JSONB), default=dict, nullable=False)
     created_at = db.Column(DateTime, index=True, nullable=False, default=utcnow)
     updated_at = db.Column(DateTime,
                            index=True,
@@ -2880,6 +2976,9 @@ class Application(db.Model):
 
     supplier = db.relationship(Supplier, lazy='joined', innerjoin=False)
 
+    # name, ABN and contact email from data, kept up to date on flush for the admin search
+    search_document = db.Column(db.String, nullable=True)
+
     @validates('data')
     def validates_data(self, key, data):
         data = strip_whitespace_from_data(data)
@@ -3068,6 +3167,19 @@ class Application(db.Model):
         return [a._asdict() for a in agreements]
 
 
+def application_search_document(data):
+    data = data or {}
+    abn = text_type(data.get('abn') or '')
+    values = [data.get('name'), abn, abn.replace(' ', ''), data.get('contact_email')]
+    return u' '.join(text_type(v) for v in values if v)
+
+
+@event.listens_for(Application, 'before_insert')
+@event.listens_for(Application, 'before_update')
+def set_application_search_document(mapper, connection, target):
+    target.search_document = application_search_document(target.data)
+
+
 def check_for_uuid(data):
     uuid_result = [False]
     if not data:
@@ -3084,6 +3196,8 @@ class CaseStudy(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     data = db.Column(MutableDict.as_mutable(JSON), default=dict, nullable=False)
     supplier_code = db.Column(db.BigInteger, db.ForeignKey('supplier.code'), nullable=False)
+    # the domain named by data['service'], maintained by set_case_study_domain_id
+    domain_id = db.Column(db.Integer, db.ForeignKey('domain.id'), nullable=True)
     created_at = db.Column(DateTime, index=True, nullable=False, default=utcnow)
     status = db.Column(
         db.Enum(
@@ -3141,6 +3255,27 @@ class CaseStudy(db.Model):
         return c
 
 
+def case_study_domain_name(service):
+    """The name of the domain a case study's service is for, mapping legacy service names to their domain."""
+    if not service:
+        return None
+    return DOMAIN_MAPPING.get(service, service)
+
+
+@event.listens_for(CaseStudy, 'before_insert')
+@event.listens_for(CaseStudy, 'before_update')
+def set_case_study_domain_id(mapper, connection, target):
+    domain_name = case_study_domain_name((target.data or {}).get('service'))
+    if not domain_name:
+        target.domain_id = None
+        return
+
+    target.domain_id = connection.scalar(
+        select([Domain.id])
+        .where(func.lower(Domain.name) == func.lower(domain_name))
+    )
+
+
 class BriefAssessment(db.Model):
     __tablename__ = 'brief_assessment'
 
@@ -3328,6 +3463,40 @@ class TeamMemberPermission(db.Model):
     )
 
 
+# Projection of the briefs each buyer can access and the users credited as
+# each brief's creators. Rows are maintained by UserBriefAccessService when
+# team membership, team briefs or brief users change.
+class UserBriefAccess(db.Model):
+    __tablename__ = 'user_brief_access'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+    brief_id = db.Column(db.Integer, db.ForeignKey('brief.id', ondelete='CASCADE'), primary_key=True, index=True)
+    creator_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+
+
+# Deleted briefs and brief responses, so the change feed can report them.
+# Rows are added by the after_delete events below.
+class Tombstone(db.Model):
+    __tablename__ = 'tombstone'
+
+    id = db.Column(db.Integer, primary_key=True)
+    entity_type = db.Column(db.String, nullable=False)
+    entity_id = db.Column(db.BigInteger, nullable=False)
+    deleted_at = db.Column(DateTime, nullable=False, default=utcnow)
+
+
+@event.listens_for(Brief, 'after_delete')
+@event.listens_for(BriefResponse, 'after_delete')
+def add_tombstone(mapper, connection, target):
+    connection.execute(
+        Tombstone.__table__.insert().values(
+            entity_type=target.__tablename__,
+            entity_id=target.id,
+            deleted_at=utcnow()
+        )
+    )
+
+
 # Index for .last_for_object queries. Without a composite index the
 # query executes an index backward scan on created_at with filter,
 # which takes a long time for old events
@@ -3351,6 +3520,140 @@ db.Index(
     AuditEvent.acknowledged,
 )
 
+# Index for the Mailchimp campaign "already sent" checks, which look up
+# audit events by type and campaign title
+db.Index(
+    'idx_audit_events_type_campaign_title',
+    AuditEvent.type,
+    AuditEvent.data['campaign_title'].astext,
+    postgresql_where=AuditEvent.data['campaign_title'].astext.isnot(None)
+)
+
+# Expression indexes for the JSONB keys filtered on by the brief and supplier
+# services. The sellers index serves the key existence (?) checks for invited
+# sellers on the seller dashboard.
+db.Index(
+    'idx_brief_data_sellers',
+    Brief.data['sellers'],
+    postgresql_using='gin'
+)
+
+db.Index(
+    'idx_supplier_data_contact_email',
+    func.lower(Supplier.data['contact_email'].astext)
+)
+
+# Indexes for the ABN in use checks, which ignore spaces in the ABN
+db.Index(
+    'idx_supplier_abn_normalised',
+    func.replace(Supplier.abn, ' ', '')
+)
+
+db.Index(
+    'idx_application_data_abn_normalised',
+    func.replace(Application.data['abn'].astext, ' ', '')
+)
+
+db.Index(
+    'idx_supplier_data_recruiter',
+    Supplier.data['recruiter'].astext
+)
+
+# Trigram indexes for the supplier name and ABN typeahead (ILIKE '%keyword%')
+db.Index(
+    'idx_supplier_name_trgm',
+    Supplier.name,
+    postgresql_using='gin',
+    postgresql_ops={'name': 'gin_trgm_ops'}
+)
+
+db.Index(
+    'idx_supplier_abn_trgm',
+    Supplier.abn,
+    postgresql_using='gin',
+    postgresql_ops={'abn': 'gin_trgm_ops'}
+)
+
+# Index for finding a supplier's case studies for a domain by status
+db.Index(
+    'idx_case_study_supplier_code_domain_id_status',
+    CaseStudy.supplier_code,
+    CaseStudy.domain_id,
+    CaseStudy.status
+)
+
+# Index for finding a brief's responses by status
+db.Index(
+    'idx_brief_response_brief_id_status',
+    BriefResponse.brief_id,
+    BriefResponse.status
+)
+
+# Trigram indexes for the admin application search
+db.Index(
+    'idx_application_search_document_trgm',
+    Application.search_document,
+    postgresql_using='gin',
+    postgresql_ops={'search_document': 'gin_trgm_ops'}
+)
+
+db.Index(
+    'idx_user_email_address_trgm',
+    User.email_address,
+    postgresql_using='gin',
+    postgresql_ops={'email_address': 'gin_trgm_ops'}
+)
+
+# Indexes for the agency team member directory
+db.Index(
+    'idx_user_name_trgm',
+    User.name,
+    postgresql_using='gin',
+    postgresql_ops={'name': 'gin_trgm_ops'}
+)
+
+db.Index(
+    'idx_user_agency_directory',
+    User.agency_id,
+    User.role,
+    User.in_completed_team,
+    postgresql_where=User.active.is_(True)
+)
+
+# Keyset indexes for the change feed, which pages through each entity type
+# ordered by when it last changed
+db.Index(
+    'idx_supplier_change_feed',
+    func.timezone('UTC', Supplier.last_update_time),
+    Supplier.code
+)
+
+db.Index(
+    'idx_brief_change_feed',
+    Brief.updated_at,
+    Brief.id
+)
+
+db.Index(
+    'idx_brief_response_change_feed',
+    BriefResponse.updated_at,
+    BriefResponse.id
+)
+
+db.Index(
+    'idx_tombstone_change_feed',
+    Tombstone.entity_type,
+    Tombstone.deleted_at,
+    Tombstone.entity_id
+)
+
+# Framework stats group a framework's supplier_framework rows by declaration status
+db.Index(
+    'idx_supplier_framework_declaration_status',
+    SupplierFramework.framework_id,
+    SupplierFramework.declaration_status
+)
+
 
 def filter_null_value_fields(obj):
     return dict(
@@ -341,6 +341,12 @@ class MySQLAlchemy(SQLAlchemy):
         base.query = _QueryProperty(self)
         return base
 
+    def apply_driver_hacks(self, app, info, options):
+        super(MySQLAlchemy, self).apply_driver_hacks(app, info, options)
+        if info.drivername.startswith('postgresql'):
+            from .pool import apply_pool_options
+            apply_pool_options(app.config, options)
+
 
 def find_subclasses(cls):
     all_refs = gc.get_referrers(cls)
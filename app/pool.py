@@ -0,0 +1,101 @@
+import logging
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger('app.pool')
+
+
+def ping_connection(dbapi_connection, connection_record, connection_proxy):
+    """Checks a connection is alive before handing it out.
+
+    SQLAlchemy 1.1 has no pool_pre_ping, so this is the pessimistic disconnect handling recipe from its docs.
+    Raising DisconnectionError makes the pool throw the connection away and try another.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute('SELECT 1')
+    except Exception:
+        raise exc.DisconnectionError()
+    finally:
+        cursor.close()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long requests wait to check out a connection."""
+
+    slow_checkout_ms = 100
+
+    def __init__(self, *args, **kwargs):
+        super(InstrumentedQueuePool, self).__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_ms_total = 0.0
+        self._wait_ms_max = 0.0
+
+    def _do_get(self):
+        start = time.time()
+        try:
+            connection = super(InstrumentedQueuePool, self)._do_get()
+        except exc.TimeoutError:
+            self._record_checkout(start, timed_out=True)
+            logger.error('db.pool.timeout: {checked_out} checked out', extra=self.stats())
+            raise
+
+        wait_ms = self._record_checkout(start)
+        if wait_ms >= self.slow_checkout_ms:
+            logger.warning('db.pool.slow_checkout: {wait_ms}ms', extra=dict(self.stats(), wait_ms=round(wait_ms)))
+        return connection
+
+    def _record_checkout(self, start, timed_out=False):
+        wait_ms = (time.time() - start) * 1000
+        with self._stats_lock:
+            self._checkouts += 1
+            self._timeouts += 1 if timed_out else 0
+            self._wait_ms_total += wait_ms
+            self._wait_ms_max = max(self._wait_ms_max, wait_ms)
+        return wait_ms
+
+    def stats(self):
+        with self._stats_lock:
+            checkouts = self._checkouts
+            return {
+                'size': self.size(),
+                'checked_in': self.checkedin(),
+                'checked_out': self.checkedout(),
+                'overflow': max(self.overflow(), 0),
+                'max_overflow': self._max_overflow,
+                'checkouts': checkouts,
+                'timeouts': self._timeouts,
+                'wait_ms_avg': round(self._wait_ms_total / checkouts, 2) if checkouts else 0,
+                'wait_ms_max': round(self._wait_ms_max, 2)
+            }
+
+
+def apply_pool_options(config, options):
+    """Sets the engine options for the instrumented pool from the app config."""
+    options['poolclass'] = InstrumentedQueuePool
+    if config.get('SQLALCHEMY_POOL_PRE_PING'):
+        options['pool_events'] = [(ping_connection, 'checkout')]
+    InstrumentedQueuePool.slow_checkout_ms = config['SQLALCHEMY_POOL_SLOW_CHECKOUT_MS']
+
+
+def get_pool_stats(engine):
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        return engine.pool.stats()
+    return None
+
+
+def check_pool_capacity(threads, config):
+    """Warns when the server can run more requests at once than the pool has connections for."""
+    capacity = config['SQLALCHEMY_POOL_SIZE'] + config['SQLALCHEMY_MAX_OVERFLOW']
+    if threads > capacity:
+        logger.warning(
+            'db.pool.capacity: {threads} server threads but only {capacity} database connections',
+            extra={'threads': threads, 'capacity': capacity}
+        )
+        return False
+    return True
@@ -0,0 +1,115 @@
+import heapq
+import random
+import threading
+import time
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# longest statement text kept for the slow statement log fields
+STATEMENT_LOG_LENGTH = 300
+
+
+class SqlStats(object):
+    def __init__(self, top_n):
+        self.top_n = top_n
+        self.statements = 0
+        self.db_ms = 0.0
+        self._slowest = []
+
+    def add(self, statement, duration_ms):
+        self.statements += 1
+        self.db_ms += duration_ms
+        item = (duration_ms, self.statements, statement)
+        if len(self._slowest) < self.top_n:
+            heapq.heappush(self._slowest, item)
+        elif self.top_n:
+            heapq.heappushpop(self._slowest, item)
+
+    def slowest(self):
+        return [
+            {'ms': round(duration_ms, 2), 'statement': statement[:STATEMENT_LOG_LENGTH]}
+            for duration_ms, _, statement in sorted(self._slowest, reverse=True)
+        ]
+
+
+_local = threading.local()
+
+
+def _get_stats():
+    stats = getattr(_local, 'stats', None)
+    if stats is None and has_request_context():
+        stats = getattr(g, 'sql_stats', None)
+    return stats
+
+
+def start_collecting(top_n):
+    """Collects statements run by this thread outside of a sampled request, e.g. in a celery task.
+
+    Returns the stats being collected before, to pass back to stop_collecting.
+    """
+    previous = getattr(_local, 'stats', None)
+    _local.stats = SqlStats(top_n)
+    return previous
+
+
+def stop_collecting(previous=None):
+    stats = getattr(_local, 'stats', None)
+    _local.stats = previous
+    return stats
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _get_stats() is not None:
+        conn.info.setdefault('sql_instrumentation_start', []).append(time.time())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _get_stats()
+    if stats is None:
+        return
+    starts = conn.info.get('sql_instrumentation_start')
+    if starts:
+        stats.add(statement, (time.time() - starts.pop()) * 1000)
+
+
+def start_request():
+    rate = current_app.config['SQL_INSTRUMENTATION_SAMPLE_RATE']
+    if rate and random.random() < rate:
+        g.sql_stats = SqlStats(current_app.config['SQL_INSTRUMENTATION_TOP_N'])
+
+
+def finish_request(response):
+    stats = getattr(g, 'sql_stats', None)
+    if stats is None:
+        return response
+
+    response.headers.add(
+        'Server-Timing',
+        'db;dur={:.2f};desc="{} statements"'.format(stats.db_ms, stats.statements)
+    )
+    current_app.logger.info(
+        'request.sql: {endpoint} {statements} statements in {db_ms}ms',
+        extra={
+            'endpoint': request.endpoint,
+            'method': request.method,
+            'status': response.status_code,
+            'statements': stats.statements,
+            'db_ms': round(stats.db_ms, 2),
+            'slowest_statements': stats.slowest()
+        }
+    )
+    return response
+
+
+def listen():
+    if not event.contains(Engine, 'before_cursor_execute', before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', after_cursor_execute)
+
+
+def init_app(application):
+    listen()
+    application.before_request(start_request)
+    application.after_request(finish_request)
@@ -1,7 +1,10 @@
 from flask import jsonify, current_app, request
 from sqlalchemy.exc import SQLAlchemyError
 
+from app import db
+from app.pool import get_pool_stats
 from . import status
+from app.throttling import get_login_throttle_stats
 from dmutils.status import get_flags
 
 
@@ -19,7 +22,9 @@ def status_no_db():
         return jsonify(
             status="ok",
             version=version,
-            flags=get_flags(current_app)
+            flags=get_flags(current_app),
+            login_throttle=get_login_throttle_stats(),
+            db_pool=get_pool_stats(db.engine)
         )
 
     except SQLAlchemyError:
@@ -0,0 +1,229 @@
+from collections import defaultdict
+from decimal import InvalidOperation
+
+from sqlalchemy import func, or_
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app import db
+from app.datetime_utils import utcnow
+from app.models import PriceSchedule, ServiceRole, Supplier, ValidationError
+from app.supplier_profiles import invalidate_supplier_profiles
+
+REQUIRED_SUPPLIER_KEYS = ['name']
+
+
+def normalise_abn(abn):
+    return ''.join(abn.split()) if abn else None
+
+
+def import_suppliers(rows):
+    """Creates a batch of suppliers in one transaction and returns a result for each row.
+
+    Rows are validated the way single supplier creates are, by Supplier.update_from_json, and the valid ones are
+    inserted in one flush. Only if the database rejects that flush is each row flushed again in its own savepoint,
+    at a few statements per row, so a row the database rejects doesn't fail the batch. Rows that fail, or whose code
+    is already used by a supplier or an earlier row, are reported and skipped.
+    """
+    codes = set()
+    for row in rows:
+        try:
+            codes.add(int(row['code']))
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    used_codes = set(
+        code for code, in db.session.query(Supplier.code).filter(Supplier.code.in_(codes))
+    ) if codes else set()
+
+    results = {}
+    valid = []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            results[index] = {'index': index, 'status': 'invalid', 'error': 'Expected a supplier object'}
+            continue
+
+        supplier = Supplier()
+        try:
+            # validators only run on the fields a row sets, so required ones are checked up front
+            missing = [key for key in REQUIRED_SUPPLIER_KEYS if not row.get(key)]
+            if missing:
+                raise ValidationError('Supplier {} required'.format(', '.join(missing)))
+
+            if row.get('code') is not None:
+                code = int(row['code'])
+                if code in used_codes:
+                    raise ValidationError('Supplier code {} is already in use'.format(code))
+
+            with db.session.no_autoflush:
+                supplier.update_from_json(dict(row))
+        except (ValidationError, ValueError, KeyError, TypeError, AttributeError) as e:
+            if supplier in db.session:
+                db.session.expunge(supplier)
+            results[index] = {'index': index, 'status': 'invalid', 'error': str(e)}
+            continue
+
+        if supplier.code is not None:
+            used_codes.add(supplier.code)
+        valid.append((index, supplier))
+
+    try:
+        with db.session.begin_nested():
+            db.session.add_all([pending for _, pending in valid])
+            db.session.flush()
+    except (IntegrityError, DataError):
+        # the savepoint's rollback expunges the suppliers, so each is added again to find the rows at fault
+        for index, supplier in valid:
+            try:
+                with db.session.begin_nested():
+                    db.session.add(supplier)
+                    db.session.flush()
+            except (IntegrityError, DataError) as e:
+                results[index] = {'index': index, 'status': 'invalid', 'error': str(e)}
+
+    for index, supplier in valid:
+        results.setdefault(index, {'index': index, 'status': 'created', 'code': supplier.code})
+
+    db.session.commit()
+
+    return [results[index] for index in range(len(rows))]
+
+
+def _find_suppliers(rows):
+    """Looks up the suppliers the rows name by code, ABN or name, in one query.
+
+    Names are matched exactly against the supplier's name or long name, as the supplier list's name filter does.
+    """
+    codes = set()
+    abns = set()
+    names = set()
+    for row in rows:
+        if row.get('code') is not None:
+            try:
+                codes.add(int(row['code']))
+            except (TypeError, ValueError):
+                pass
+        elif row.get('abn'):
+            abns.add(normalise_abn(row['abn']))
+        elif row.get('name'):
+            names.add(row['name'].strip())
+
+    if not (codes or abns or names):
+        return {}, {}, {}
+
+    normalised_abn = func.replace(Supplier.abn, ' ', '')
+    criteria = []
+    if codes:
+        criteria.append(Supplier.code.in_(codes))
+    if abns:
+        criteria.append(normalised_abn.in_(abns))
+    if names:
+        criteria.append(Supplier.name.in_(names))
+        criteria.append(Supplier.long_name.in_(names))
+
+    found = (
+        db
+        .session
+        .query(Supplier.id, Supplier.code, normalised_abn.label('abn'), Supplier.name, Supplier.long_name)
+        .filter(Supplier.status != 'deleted',
+                or_(*criteria))
+        .all()
+    )
+
+    by_code = defaultdict(list)
+    by_abn = defaultdict(list)
+    by_name = defaultdict(list)
+    for supplier in found:
+        by_code[supplier.code].append(supplier)
+        by_abn[supplier.abn].append(supplier)
+        for name in set([supplier.name, supplier.long_name]):
+            by_name[name].append(supplier)
+
+    return by_code, by_abn, by_name
+
+
+def import_prices(rows):
+    """Replaces the price schedules of a batch of suppliers in one transaction and returns a result for each row.
+
+    Each row names its supplier by code, ABN or name and lists its prices in the form PriceSchedule.from_json takes.
+    Suppliers are looked up together, existing prices are deleted in one statement and the new prices are inserted
+    in another. A row with any invalid price is reported and skipped.
+    """
+    rows = [row if isinstance(row, dict) else {} for row in rows]
+    by_code, by_abn, by_name = _find_suppliers(rows)
+    roles = {name: id for id, name in db.session.query(ServiceRole.id, ServiceRole.name)}
+
+    results = []
+    updated = {}
+    price_rows = []
+    for index, row in enumerate(rows):
+        try:
+            if row.get('code') is not None:
+                matches = by_code.get(int(row['code']), [])
+            elif row.get('abn'):
+                matches = by_abn.get(normalise_abn(row['abn']), [])
+            elif row.get('name'):
+                matches = by_name.get(row['name'].strip(), [])
+            else:
+                raise ValidationError('Supplier code, ABN or name required')
+        except (ValidationError, ValueError) as e:
+            results.append({'index': index, 'status': 'invalid', 'error': str(e)})
+            continue
+
+        if len(matches) != 1:
+            results.append({
+                'index': index,
+                'status': 'not_found',
+                'error': '{} suppliers found'.format(len(matches))
+            })
+            continue
+
+        supplier = matches[0]
+        try:
+            if supplier.id in updated:
+                raise ValidationError('Supplier {} is already in this batch'.format(supplier.code))
+
+            prices = []
+            for price in row.get('prices') or []:
+                role_name = price['serviceRole']['role']
+                if role_name not in roles:
+                    raise ValidationError('Unknown role: {}'.format(role_name))
+                if roles[role_name] in [p.service_role_id for p in prices]:
+                    raise ValidationError('Duplicate role: {}'.format(role_name))
+
+                # validates and parses the rates the same way single supplier updates do
+                prices.append(PriceSchedule(
+                    supplier_id=supplier.id,
+                    service_role_id=roles[role_name],
+                    hourly_rate=price.get('hourlyRate'),
+                    daily_rate=price.get('dailyRate'),
+                    gst_included=price.get('gstIncluded', True)
+                ))
+        except (ValidationError, InvalidOperation, KeyError, TypeError) as e:
+            results.append({'index': index, 'status': 'invalid', 'error': str(e)})
+            continue
+
+        updated[supplier.id] = supplier.code
+        price_rows.extend({
+            'supplier_id': p.supplier_id,
+            'service_role_id': p.service_role_id,
+            'hourly_rate': p.hourly_rate,
+            'daily_rate': p.daily_rate,
+            'gst_included': p.gst_included
+        } for p in prices)
+        results.append({'index': index, 'status': 'updated', 'code': supplier.code, 'prices': len(prices)})
+
+    if updated:
+        db.session.execute(
+            PriceSchedule.__table__.delete().where(PriceSchedule.supplier_id.in_(updated.keys()))
+        )
+        if price_rows:
+            db.session.execute(PriceSchedule.__table__.insert().values(price_rows))
+        db.session.execute(
+            Supplier.__table__.update()
+            .where(Supplier.id.in_(updated.keys()))
+            .values(last_update_time=utcnow())
+        )
+        db.session.commit()
+        invalidate_supplier_profiles(updated.values())
+
+    return results
@@ -0,0 +1,136 @@
+from itertools import chain
+
+import redis
+from flask import current_app, json, request
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, joinedload, noload
+
+from app import get_redis_client
+from app.api.services import suppliers
+from app.models import (CaseStudy, PriceSchedule, Product, SignedAgreement,
+                        Supplier, SupplierDomain, SupplierFramework,
+                        SupplierReference)
+
+PROFILE_KEY = 'supplier_profile:{}'
+
+
+def get_supplier_profile(code):
+    """Returns the supplier's profile rendered as JSON, or None if the supplier doesn't exist or is deleted.
+
+    Rendered profiles are stored in redis against the supplier's profile version, and rendered again when the
+    version no longer matches. Without redis the profile is rendered on every call.
+    """
+    client = get_redis_client(current_app)
+    if client is None:
+        return render_supplier_profile(code)
+
+    version = suppliers.get_supplier_profile_version(code)
+    if not version:
+        return None
+
+    # the profile links are built from the url root of the request that renders it
+    url_root = request.url_root
+    key = PROFILE_KEY.format(code)
+    try:
+        stored_version, stored_url_root, document = client.hmget(key, 'version', 'url_root', 'document')
+        if document and stored_version == version and stored_url_root == url_root:
+            return document
+    except redis.RedisError as e:
+        current_app.logger.warning('supplier.profile.error: {error}', extra={'error': str(e)})
+
+    document = render_supplier_profile(code)
+    if document is None:
+        return None
+
+    try:
+        pipe = client.pipeline()
+        pipe.hmset(key, {'version': version, 'url_root': url_root, 'document': document})
+        pipe.expire(key, current_app.config['SUPPLIER_PROFILE_CACHE_TTL'])
+        pipe.execute()
+    except redis.RedisError as e:
+        current_app.logger.warning('supplier.profile.error: {error}', extra={'error': str(e)})
+
+    return document
+
+
+def render_supplier_profile(code):
+    supplier = (
+        Supplier
+        .query
+        .filter(
+            Supplier.code == code,
+            Supplier.status != 'deleted'
+        )
+        .options(
+            joinedload('domains.domain'),
+            noload('domains.supplier'),
+            noload('domains.assessments'),
+            joinedload('domains.recruiter_info')
+        )
+        .one_or_none()
+    )
+
+    if not supplier:
+        return None
+
+    return json.dumps(supplier.serializable)
+
+
+def invalidate_supplier_profiles(codes):
+    client = get_redis_client(current_app)
+    if client is None or not codes:
+        return
+
+    try:
+        client.delete(*[PROFILE_KEY.format(code) for code in codes])
+    except redis.RedisError as e:
+        current_app.logger.warning('supplier.profile.error: {error}', extra={'error': str(e)})
+
+
+def _changed_supplier_codes(session):
+    codes = set()
+    supplier_ids = set()
+
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Supplier):
+            codes.add(obj.code)
+        elif isinstance(obj, (CaseStudy, Product, SignedAgreement, SupplierFramework)):
+            codes.add(obj.supplier_code)
+        elif isinstance(obj, (PriceSchedule, SupplierDomain, SupplierReference)):
+            supplier_ids.add(obj.supplier_id)
+
+    supplier_ids.discard(None)
+    if supplier_ids:
+        codes.update(
+            code for code, in session.execute(select([Supplier.code]).where(Supplier.id.in_(supplier_ids)))
+        )
+
+    codes.discard(None)
+    return codes
+
+
+@event.listens_for(Session, 'after_flush')
+def collect_changed_supplier_profiles(session, flush_context):
+    codes = _changed_supplier_codes(session)
+    if codes:
+        # moves the version of profiles stored by other processes too, should the delete after the commit fail.
+        # last_update_time is set to itself so that changes to related rows don't count as supplier updates.
+        session.execute(
+            Supplier.__table__.update()
+            .where(Supplier.code.in_(codes))
+            .values(profile_version=Supplier.profile_version + 1,
+                    last_update_time=Supplier.last_update_time)
+        )
+        session.info.setdefault('changed_supplier_profiles', set()).update(codes)
+
+
+@event.listens_for(Session, 'after_commit')
+def invalidate_changed_supplier_profiles(session):
+    codes = session.info.pop('changed_supplier_profiles', None)
+    if codes:
+        invalidate_supplier_profiles(codes)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def forget_changed_supplier_profiles(session, previous_transaction):
+    session.info.pop('changed_supplier_profiles', None)
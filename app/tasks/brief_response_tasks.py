@@ -5,7 +5,7 @@ from app.api.services import (
 from . import celery
 
 
-@celery.task
+@celery.task(singleton_lease=60 * 60)
 def update_brief_response_metrics():
     brief_response_metrics = brief_responses_service.get_metrics()
     key_values_service.upsert('brief_response_metrics', {
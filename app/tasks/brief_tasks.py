@@ -14,7 +14,7 @@ from app.models import Brief, Framework, Lot
 from . import celery
 
 
-@celery.task
+@celery.task(singleton_lease=60 * 60)
 def process_closed_briefs():
     # find briefs that were closed yesterday. this task is designed to run after midnight.
     closed_briefs = (
@@ -36,7 +36,7 @@ def process_closed_briefs():
         send_specialist_brief_closed_email(closed_brief)
 
 
-@celery.task
+@celery.task(singleton_lease=4 * 60 * 60)
 def create_responses_zip_for_closed_briefs():
     from app.tasks.s3 import create_responses_zip, CreateResponsesZipException
     closed_briefs = (
@@ -72,6 +72,6 @@ def create_responses_zip_for_closed_briefs():
             current_app.logger.error(str(e))
 
 
-@celery.task
+@celery.task(singleton_lease=60 * 60)
 def update_brief_metrics():
     key_values_service.upsert('brief_metrics', briefs.get_metrics())
@@ -4,7 +4,9 @@ from urllib import quote_plus
 from os import getenv
 from kombu.transport import SQS
 from flask import current_app
-from app import db
+from app import db, sql_instrumentation
+from app.tasks.singleton import run_singleton
+from app.tasks.telemetry import run_task
 
 
 QUEUE_NAME = getenv('AWS_SQS_QUEUE_NAME')
@@ -51,6 +53,7 @@ def make_celery(flask_app):
             'app.tasks.s3',
             'app.tasks.brief_response_tasks',
             'app.tasks.supplier_tasks',
+            'app.tasks.user_tasks',
             'app.tasks.jira',
             'app.tasks.dreamail',
             'app.tasks.publish_tasks'
@@ -68,9 +71,10 @@ def make_celery(flask_app):
 
         def __call__(self, *args, **kwargs):
             if current_app:
-                return TaskBase.__call__(self, *args, **kwargs)
+                return run_task(self, run_singleton, TaskBase.__call__, *args, **kwargs)
             else:
                 with flask_app.app_context():
-                    return TaskBase.__call__(self, *args, **kwargs)
+                    return run_task(self, run_singleton, TaskBase.__call__, *args, **kwargs)
     celery.Task = ContextTask
+    sql_instrumentation.listen()
     return celery
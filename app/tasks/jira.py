@@ -19,7 +19,7 @@ def create_evidence_assessment_in_jira(evidence_id):
     marketplace_jira.create_evidence_approval_task(evidence)
 
 
-@celery.task
+@celery.task(singleton_lease=60 * 60)
 def sync_application_approvals_with_jira():
     application_ids = application_service.get_submitted_application_ids()
 
@@ -257,7 +257,7 @@ def send_labour_hire_licence_expiry_campaign(client, sellers):
     )
 
 
-@celery.task
+@celery.task(singleton_lease=60 * 60)
 def send_document_expiry_reminder():
     # Find sellers with documents 28 days from expiry, 14 days from expiry, on expiry and 28 days after expiry
     sellers = (suppliers.get_suppliers_with_expiring_documents(days=28) +
@@ -277,7 +277,7 @@ def send_document_expiry_reminder():
         rollbar.report_exc_info()
 
 
-@celery.task
+@celery.task(singleton_lease=60 * 60)
 def send_labour_hire_expiry_reminder():
     # Find sellers with labour hire licences 28 days from expiry, 14 days from expiry, on expiry and 28 days after
     # expiry
@@ -298,7 +298,7 @@ def send_labour_hire_expiry_reminder():
         rollbar.report_exc_info()
 
 
-@celery.task
+@celery.task(singleton_lease=60 * 60)
 def send_new_briefs_email():
     client = get_client()
     list_id = getenv('MAILCHIMP_SELLER_EMAIL_LIST_ID')
@@ -379,7 +379,7 @@ def send_new_briefs_email():
         rollbar.report_exc_info()
 
 
-@celery.task
+@celery.task(singleton_lease=4 * 60 * 60)
 def sync_mailchimp_seller_list():
     client = get_client()
     list_id = getenv('MAILCHIMP_SELLER_LIST_ID')
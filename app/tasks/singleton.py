@@ -0,0 +1,45 @@
+from __future__ import absolute_import
+
+import redis
+from flask import current_app
+
+from app import get_redis_client
+
+LOCK_KEY = 'task_lock:{}'
+
+
+def run_singleton(task, call, *args, **kwargs):
+    """Runs the task unless another run of it holds its lock.
+
+    Tasks opt in with the singleton_lease option, the seconds the lock is held for if the worker running the task
+    dies without releasing it. A run that finds the lock taken is skipped, so a periodic task that is still running
+    when beat schedules it again is not run twice, whichever worker picks it up. Tasks run without a lock when
+    redis is unavailable.
+    """
+    lease = getattr(task, 'singleton_lease', None)
+    client = get_redis_client(current_app) if lease else None
+    if client is None:
+        return call(task, *args, **kwargs)
+
+    lock = client.lock(LOCK_KEY.format(task.name), timeout=lease)
+    try:
+        acquired = lock.acquire(blocking=False)
+    except redis.RedisError as e:
+        current_app.logger.warning('task.lock.error: {error}', extra={'error': str(e), 'task_name': task.name})
+        return call(task, *args, **kwargs)
+
+    if not acquired:
+        current_app.logger.info(
+            'task.skipped: {task_name} is already running',
+            extra={'task_name': task.name, 'task_id': task.request.id}
+        )
+        return None
+
+    try:
+        return call(task, *args, **kwargs)
+    finally:
+        try:
+            lock.release()
+        except redis.RedisError as e:
+            # the lease ran out before the task finished, and another run may hold the lock now
+            current_app.logger.warning('task.lock.error: {error}', extra={'error': str(e), 'task_name': task.name})
@@ -5,7 +5,7 @@ from app.api.services import (
 from . import celery
 
 
-@celery.task
+@celery.task(singleton_lease=60 * 60)
 def update_supplier_metrics():
     supplier_metrics = suppliers.get_metrics()
     key_values_service.upsert('supplier_metrics', {
@@ -0,0 +1,113 @@
+from __future__ import absolute_import
+
+import time
+
+import redis
+from celery.exceptions import Retry
+from celery.signals import before_task_publish
+from flask import current_app
+
+from app import get_redis_client, sql_instrumentation
+
+TASKS_KEY = 'task_telemetry:tasks'
+TASK_KEY = 'task_telemetry:task:{}'
+
+
+@before_task_publish.connect
+def add_enqueued_at(headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault('enqueued_at', time.time())
+
+
+def _get_enqueued_at(request):
+    enqueued_at = getattr(request, 'enqueued_at', None)
+    if enqueued_at is None:
+        enqueued_at = (getattr(request, 'headers', None) or {}).get('enqueued_at')
+    return enqueued_at
+
+
+def run_task(task, call, *args, **kwargs):
+    """Runs the task, then logs and records how long it queued and ran and the statements it executed."""
+    started_at = time.time()
+    enqueued_at = _get_enqueued_at(task.request)
+    queue_ms = (started_at - enqueued_at) * 1000 if enqueued_at else None
+    previous = sql_instrumentation.start_collecting(current_app.config['SQL_INSTRUMENTATION_TOP_N'])
+    outcome = 'success'
+
+    try:
+        return call(task, *args, **kwargs)
+    except Retry:
+        outcome = 'retry'
+        raise
+    except Exception:
+        outcome = 'failure'
+        raise
+    finally:
+        stats = sql_instrumentation.stop_collecting(previous)
+        runtime_ms = (time.time() - started_at) * 1000
+        current_app.logger.info(
+            'task.finished: {task_name} {outcome} in {runtime_ms}ms',
+            extra={
+                'task_name': task.name,
+                'task_id': task.request.id,
+                'outcome': outcome,
+                'retries': task.request.retries,
+                'queue_ms': round(queue_ms, 2) if queue_ms is not None else None,
+                'runtime_ms': round(runtime_ms, 2),
+                'statements': stats.statements,
+                'db_ms': round(stats.db_ms, 2),
+                'slowest_statements': stats.slowest()
+            }
+        )
+        record_task_run(task.name, outcome, queue_ms, runtime_ms, stats)
+
+
+def record_task_run(task_name, outcome, queue_ms, runtime_ms, stats):
+    client = get_redis_client(current_app)
+    if client is None:
+        return
+
+    key = TASK_KEY.format(task_name)
+    try:
+        pipe = client.pipeline()
+        pipe.sadd(TASKS_KEY, task_name)
+        pipe.hincrby(key, 'runs', 1)
+        pipe.hincrby(key, outcome, 1)
+        pipe.hincrbyfloat(key, 'runtime_ms', runtime_ms)
+        pipe.hincrby(key, 'statements', stats.statements)
+        pipe.hincrbyfloat(key, 'db_ms', stats.db_ms)
+        if queue_ms is not None:
+            pipe.hincrby(key, 'queued', 1)
+            pipe.hincrbyfloat(key, 'queue_ms', queue_ms)
+        pipe.execute()
+    except redis.RedisError as e:
+        current_app.logger.warning('task.telemetry.error: {error}', extra={'error': str(e)})
+
+
+def get_task_telemetry():
+    client = get_redis_client(current_app)
+    if client is None:
+        return []
+
+    task_names = sorted(client.smembers(TASKS_KEY))
+    pipe = client.pipeline()
+    for task_name in task_names:
+        pipe.hgetall(TASK_KEY.format(task_name))
+
+    result = []
+    for task_name, counters in zip(task_names, pipe.execute()):
+        counters = {k: float(v) for k, v in counters.items()}
+        runs = counters.get('runs', 0)
+        queued = counters.get('queued', 0)
+        result.append({
+            'task': task_name,
+            'runs': int(runs),
+            'successes': int(counters.get('success', 0)),
+            'failures': int(counters.get('failure', 0)),
+            'retries': int(counters.get('retry', 0)),
+            'avg_queue_ms': round(counters.get('queue_ms', 0) / queued, 2) if queued else None,
+            'avg_runtime_ms': round(counters.get('runtime_ms', 0) / runs, 2) if runs else None,
+            'avg_statements': round(counters.get('statements', 0) / runs, 2) if runs else None,
+            'avg_db_ms': round(counters.get('db_ms', 0) / runs, 2) if runs else None
+        })
+    return result
@@ -0,0 +1,16 @@
+from flask import current_app
+
+from app import throttling
+from app.api.services import user_claims_service
+from . import celery
+
+
+@celery.task(singleton_lease=60)
+def flush_failed_login_counts():
+    throttling.flush_failed_login_counts()
+
+
+@celery.task(singleton_lease=60 * 60)
+def prune_expired_user_claims():
+    deleted = user_claims_service.delete_expired_claims(current_app.config['USER_CLAIM_PRUNE_BATCH_SIZE'])
+    current_app.logger.info('user_claims.pruned: {deleted}', extra={'deleted': deleted})
@@ -0,0 +1,181 @@
+import time
+import uuid
+
+import redis
+from flask import current_app
+from sqlalchemy import bindparam
+
+from app import db, get_redis_client
+
+FAILED_LOGINS_KEY = 'login_throttle:failed_logins'
+STATS_KEY = 'login_throttle:stats'
+
+
+def get_redis():
+    if not current_app.config.get('LOGIN_THROTTLE_ENABLED'):
+        return None
+
+    return get_redis_client(current_app)
+
+
+def get_client_ip(request):
+    """Returns the address the outermost trusted proxy saw the request come from.
+
+    Entries to the left of the ones the trusted proxies appended to X-Forwarded-For are written by the client, so
+    they can't be used to key the IP limit.
+    """
+    proxies = current_app.config['LOGIN_THROTTLE_TRUSTED_PROXIES']
+    forwarded_for = request.access_route if request.headers.get('X-Forwarded-For') else []
+    if proxies and forwarded_for:
+        return forwarded_for[-min(proxies, len(forwarded_for))]
+    return request.remote_addr
+
+
+def _window_keys(email_address, ip_address):
+    return (
+        'login_throttle:email:{}'.format((email_address or '').lower()),
+        'login_throttle:ip:{}'.format(ip_address)
+    )
+
+
+def is_login_throttled(email_address, ip_address):
+    """Checks the failed attempts for the email address and IP address within the sliding window.
+
+    This runs before the user is loaded and the password is hashed, so rejected attempts cost a single
+    redis round trip. Logins are never blocked when redis is unavailable.
+    """
+    client = get_redis()
+    if client is None:
+        return False
+
+    window = current_app.config['LOGIN_THROTTLE_WINDOW']
+    email_key, ip_key = _window_keys(email_address, ip_address)
+    now = time.time()
+
+    try:
+        pipe = client.pipeline()
+        pipe.zremrangebyscore(email_key, 0, now - window)
+        pipe.zcard(email_key)
+        pipe.zremrangebyscore(ip_key, 0, now - window)
+        pipe.zcard(ip_key)
+        pipe.hincrby(STATS_KEY, 'attempts', 1)
+        _, email_count, _, ip_count, _ = pipe.execute()
+
+        rejected_by = None
+        if email_count >= current_app.config['LOGIN_THROTTLE_EMAIL_LIMIT']:
+            rejected_by = 'email'
+        elif ip_count >= current_app.config['LOGIN_THROTTLE_IP_LIMIT']:
+            rejected_by = 'ip'
+
+        if rejected_by:
+            client.hincrby(STATS_KEY, 'rejected_{}'.format(rejected_by), 1)
+            current_app.logger.info('login.throttled: {rejected_by} {ip_address}', extra={
+                'rejected_by': rejected_by,
+                'ip_address': ip_address
+            })
+            return True
+    except redis.RedisError as e:
+        current_app.logger.warning('login.throttle.error: {error}', extra={'error': str(e)})
+
+    return False
+
+
+def record_failed_login(email_address, ip_address, user=None):
+    """Adds a failed attempt to the sliding windows, and counts it against the user's failed_login_count.
+
+    The user's count is buffered in redis and written by flush_failed_login_counts, unless this attempt
+    locks the account, in which case it is written straight away.
+    """
+    client = get_redis()
+    if client is not None:
+        window = current_app.config['LOGIN_THROTTLE_WINDOW']
+        email_key, ip_key = _window_keys(email_address, ip_address)
+        now = time.time()
+        member = '{}:{}'.format(now, uuid.uuid4().hex)
+
+        try:
+            pipe = client.pipeline()
+            for key in (email_key, ip_key):
+                pipe.zadd(key, {member: now})
+                pipe.expire(key, window)
+            pipe.hincrby(STATS_KEY, 'failed', 1)
+            if user is not None:
+                pipe.hincrby(FAILED_LOGINS_KEY, user.id, 1)
+            results = pipe.execute()
+
+            if user is None:
+                return
+
+            pending = results[-1]
+            if user.failed_login_count + pending < current_app.config['DM_FAILED_LOGIN_LIMIT']:
+                return
+
+            pipe = client.pipeline()
+            pipe.hget(FAILED_LOGINS_KEY, user.id)
+            pipe.hdel(FAILED_LOGINS_KEY, user.id)
+            claimed, _ = pipe.execute()
+            user.failed_login_count += int(claimed or 0)
+            db.session.add(user)
+            db.session.commit()
+            return
+        except redis.RedisError as e:
+            current_app.logger.warning('login.throttle.error: {error}', extra={'error': str(e)})
+
+    if user is not None:
+        user.failed_login_count += 1
+        db.session.add(user)
+        db.session.commit()
+
+
+def clear_failed_logins(user):
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        client.hdel(FAILED_LOGINS_KEY, user.id)
+    except redis.RedisError as e:
+        current_app.logger.warning('login.throttle.error: {error}', extra={'error': str(e)})
+
+
+def flush_failed_login_counts():
+    """Writes the buffered failed login counts to the user table in a single statement."""
+    from app.models import User
+
+    client = get_redis()
+    if client is None:
+        return 0
+
+    pipe = client.pipeline()
+    pipe.hgetall(FAILED_LOGINS_KEY)
+    pipe.delete(FAILED_LOGINS_KEY)
+    pending, _ = pipe.execute()
+
+    if not pending:
+        return 0
+
+    db.session.execute(
+        User.__table__.update()
+        .where(User.id == bindparam('user_id'))
+        .values(failed_login_count=User.failed_login_count + bindparam('count')),
+        [{'user_id': int(user_id), 'count': int(count)} for user_id, count in pending.items()]
+    )
+    db.session.commit()
+    client.hincrby(STATS_KEY, 'flushed', len(pending))
+
+    return len(pending)
+
+
+def get_login_throttle_stats():
+    client = get_redis()
+    if client is None:
+        return None
+
+    try:
+        stats = {k.decode('utf-8'): int(v) for k, v in client.hgetall(STATS_KEY).items()}
+        stats['pending_failed_logins'] = client.hlen(FAILED_LOGINS_KEY)
+    except redis.RedisError as e:
+        current_app.logger.warning('login.throttle.error: {error}', extra={'error': str(e)})
+        return None
+
+    return stats
@@ -161,6 +161,11 @@ def purge_nulls_from_data(data):
     return dict((k, v) for k, v in iteritems(data) if v is not None)
 
 
+def escape_like(keyword, escape='!'):
+    """Escapes LIKE wildcards in a user supplied keyword, for use with `.like(..., escape=escape)`."""
+    return keyword.replace(escape, escape * 2).replace('%', escape + '%').replace('_', escape + '_')
+
+
 def get_request_page_questions():
     json_payload = get_json_from_request()
     return json_payload.get('page_questions', [])
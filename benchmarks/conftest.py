@@ -0,0 +1,97 @@
+from __future__ import absolute_import
+
+import json
+import os
+
+import pytest
+from sqlbag import temporary_database
+
+from app import create_app, db
+from benchmarks import data, harness
+from migrations import load_from_app_model, load_test_fixtures
+from tests.app.helpers import WSGIApplicationWithEnvironment
+
+
+@pytest.fixture(autouse=True, scope='session')
+def db_initialization(request):
+    """Loads the synthetic data set once for the whole run.
+
+    Set BENCHMARK_DATABASE_URL to benchmark against an existing local
+    database that already holds the data set, skipping the load.
+    """
+    from config import configs
+
+    dburi = os.getenv('BENCHMARK_DATABASE_URL')
+    if dburi:
+        configs['test'].SQLALCHEMY_DATABASE_URI = dburi
+        yield
+        return
+
+    with temporary_database() as dburi:
+        configs['test'].SQLALCHEMY_DATABASE_URI = dburi
+
+        load_from_app_model(dburi)
+        load_test_fixtures(dburi)
+
+        app = create_app('test')
+        with app.app_context():
+            data.seed(data.get_scale())
+            db.session.remove()
+
+        yield
+
+
+@pytest.fixture(scope='session')
+def app(request):
+    app = create_app('test')
+    app.config['SERVER_NAME'] = 'localhost'
+    app.config['CSRF_ENABLED'] = False
+    app.config['DM_API_AUTH_TOKENS'] = 'valid-token'
+    app.wsgi_app = WSGIApplicationWithEnvironment(app.wsgi_app, HTTP_AUTHORIZATION='Bearer valid-token')
+
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture()
+def client(app):
+    yield app.test_client()
+
+
+def login(client, email_address):
+    response = client.post('/2/login', data=json.dumps({
+        'emailAddress': email_address,
+        'password': data.PASSWORD
+    }), content_type='application/json')
+    assert response.status_code == 200
+    return client
+
+
+@pytest.fixture()
+def buyer_client(client):
+    yield login(client, data.BUYER_EMAIL)
+
+
+@pytest.fixture()
+def seller_client(client):
+    yield login(client, data.SELLER_EMAIL)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not harness.results:
+        return
+
+    terminalreporter.write_sep('=', 'benchmark results')
+    terminalreporter.write_line('{:<32} {:>6} {:>10} {:>10} {:>10} {:>11}'.format(
+        'benchmark', 'runs', 'p50 ms', 'p95 ms', 'p99 ms', 'statements'))
+    for result in harness.results:
+        terminalreporter.write_line('{name:<32} {iterations:>6} {p50_ms:>10} {p95_ms:>10} {p99_ms:>10} '
+                                    '{statements:>11}'.format(**result))
+
+    report_path = os.getenv('BENCHMARK_REPORT')
+    if report_path:
+        harness.write_report(report_path)
+
+    if harness.recording_budgets():
+        harness.write_budgets()
+        terminalreporter.write_line('budgets recorded in {}'.format(harness.BUDGETS_PATH))
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import os
+import random
+
+import pendulum
+
+from app import encryption
+from app.api.services import user_brief_access_service
+from app.models import (Agency, AgencyDomain, Application, AuditEvent, Brief,
+                        BriefResponse, BriefUser, CaseStudy, Domain, Framework,
+                        Lot, Supplier, SupplierDomain, SupplierFramework, User,
+                        db)
+
+# Row counts for each scale. "full" approximates production volumes, "small"
+# is for quickly checking the harness itself.
+SCALES = {
+    'small': {
+        'suppliers': 500,
+        'buyers': 50,
+        'briefs': 250,
+        'brief_responses': 1000,
+        'audit_events': 2000,
+        'applications': 500
+    },
+    'full': {
+        'suppliers': 20000,
+        'buyers': 2000,
+        'briefs': 10000,
+        'brief_responses': 50000,
+        'audit_events': 100000,
+        'applications': 20000
+    }
+}
+
+BATCH_SIZE = 5000
+PASSWORD = 'benchmark'
+BUYER_EMAIL = 'buyer1@digital.gov.au'
+SELLER_EMAIL = 'seller1@example.com'
+
+STATES = ['ACT', 'NSW', 'NT', 'QLD', 'SA', 'TAS', 'VIC', 'WA', 'Remote']
+WORDS = ['Agile', 'Cloud', 'Data', 'Digital', 'Design', 'Delivery', 'Insight', 'Platform', 'Service', 'Systems']
+
+
+def get_scale():
+    return SCALES[os.getenv('BENCHMARK_SCALE', 'full')]
+
+
+def _insert(model, rows):
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(model.__table__.insert(), rows[start:start + BATCH_SIZE])
+
+
+def _reset_sequence(model):
+    table = model.__tablename__
+    db.session.execute(
+        "select setval(pg_get_serial_sequence('\"{0}\"', 'id'), coalesce(max(id), 1)) from \"{0}\"".format(table)
+    )
+
+
+def _name(rng, n):
+    return '{} {} {}'.format(rng.choice(WORDS), rng.choice(WORDS), n)
+
+
+def seed(scale):
+    """Loads synthetic suppliers, buyers, briefs, responses, audit events and applications.
+
+    Rows are inserted with executemany rather than through the ORM so that
+    the full scale loads in a reasonable time, and a fixed random seed keeps
+    the data the same between runs.
+    """
+    rng = random.Random(2018)
+    now = pendulum.now('UTC')
+    password = encryption.hashpw(PASSWORD)
+
+    framework = Framework.query.filter(Framework.slug == 'digital-marketplace').one()
+    lots = Lot.query.filter(Lot.slug.in_(['specialist', 'rfx', 'atm'])).all()
+    domains = Domain.query.all()
+
+    db.session.add(Agency(
+        id=1,
+        name='Digital Transformation Agency',
+        domain='digital.gov.au',
+        category='Commonwealth',
+        whitelisted=True,
+        domains=[AgencyDomain(domain='digital.gov.au', active=True)]
+    ))
+    db.session.flush()
+
+    supplier_codes = range(1, scale['suppliers'] + 1)
+    _insert(Supplier, [{
+        'id': code,
+        'code': code,
+        'name': _name(rng, code),
+        'abn': '{:011d}'.format(code),
+        'status': 'complete',
+        'data': {
+            'contact_email': 'contact{}@example.com'.format(code),
+            'email': 'rep{}@example.com'.format(code),
+            'contact_phone': '0200000000',
+            'recruiter': rng.choice(['no', 'both', 'yes'])
+        }
+    } for code in supplier_codes])
+    _insert(SupplierFramework, [{
+        'supplier_code': code,
+        'framework_id': framework.id
+    } for code in supplier_codes])
+
+    supplier_domains = []
+    case_studies = []
+    for code in supplier_codes:
+        for domain in rng.sample(domains, rng.randint(1, 4)):
+            supplier_domains.append({
+                'supplier_id': code,
+                'domain_id': domain.id,
+                'status': rng.choice(['unassessed', 'assessed', 'rejected']),
+                'price_status': rng.choice(['approved', 'rejected', 'unassessed'])
+            })
+            for _ in range(rng.randint(0, 2)):
+                case_studies.append({
+                    'supplier_code': code,
+                    'domain_id': domain.id,
+                    'status': rng.choice(['unassessed', 'approved', 'rejected']),
+                    'data': {
+                        'title': 'Case study for {}'.format(domain.name),
+                        'service': domain.name
+                    }
+                })
+    _insert(SupplierDomain, supplier_domains)
+    _insert(CaseStudy, case_studies)
+
+    buyer_ids = range(1, scale['buyers'] + 1)
+    users = [{
+        'id': user_id,
+        'name': 'Buyer {}'.format(user_id),
+        'email_address': 'buyer{}@digital.gov.au'.format(user_id),
+        'password': password,
+        'active': True,
+        'password_changed_at': now,
+        'role': 'buyer',
+        'agency_id': 1,
+        'supplier_code': None
+    } for user_id in buyer_ids]
+    users.extend({
+        'id': scale['buyers'] + code,
+        'name': 'Seller {}'.format(code),
+        'email_address': 'seller{}@example.com'.format(code),
+        'password': password,
+        'active': True,
+        'password_changed_at': now,
+        'role': 'supplier',
+        'agency_id': None,
+        'supplier_code': code
+    } for code in supplier_codes)
+    _insert(User, users)
+
+    briefs = []
+    brief_users = []
+    for brief_id in range(1, scale['briefs'] + 1):
+        published_at = now.subtract(days=rng.randint(0, 365)) if rng.random() < 0.9 else None
+        seller_selector = rng.choice(['allSellers', 'someSellers', 'oneSeller'])
+        invited = rng.sample(supplier_codes, 1 if seller_selector == 'oneSeller' else 5)
+        briefs.append({
+            'id': brief_id,
+            'framework_id': framework.id,
+            'lot_id': rng.choice(lots).id,
+            'data': {
+                'title': _name(rng, brief_id),
+                'organisation': 'Digital Transformation Agency',
+                'location': rng.sample(STATES, 2),
+                'sellerSelector': seller_selector,
+                'openTo': 'all' if seller_selector == 'allSellers' else 'selected',
+                'sellers': {} if seller_selector == 'allSellers' else {
+                    str(code): {'name': 'Supplier {}'.format(code)} for code in invited
+                }
+            },
+            'published_at': published_at,
+            'questions_closed_at': published_at.add(days=7) if published_at else None,
+            'closed_at': published_at.add(days=14) if published_at else None,
+            'withdrawn_at': None
+        })
+        brief_users.append({'brief_id': brief_id, 'user_id': rng.choice(buyer_ids)})
+    _insert(Brief, briefs)
+    _insert(BriefUser, brief_users)
+
+    published_brief_ids = [b['id'] for b in briefs if b['published_at']]
+    brief_responses = []
+    for response_id in range(1, scale['brief_responses'] + 1):
+        code = rng.choice(supplier_codes)
+        submitted = rng.random() < 0.8
+        brief_responses.append({
+            'id': response_id,
+            'brief_id': rng.choice(published_brief_ids),
+            'supplier_code': code,
+            'created_by': 'seller{}@example.com'.format(code),
+            'data': {
+                'respondToEmailAddress': 'seller{}@example.com'.format(code),
+                'essentialRequirements': ['Yes'],
+                'availability': '1 week'
+            },
+            'submitted_at': now if submitted else None,
+            'withdrawn_at': None
+        })
+    _insert(BriefResponse, brief_responses)
+
+    audit_events = []
+    for _ in range(scale['audit_events']):
+        kind = rng.random()
+        if kind < 0.5:
+            response = rng.choice(brief_responses)
+            audit_events.append({
+                'type': 'create_brief_response',
+                'user': response['created_by'],
+                'data': {'briefResponseId': response['id']},
+                'object_type': 'BriefResponse',
+                'object_id': response['id'],
+                'acknowledged': False
+            })
+        elif kind < 0.9:
+            code = rng.choice(supplier_codes)
+            audit_events.append({
+                'type': 'update_supplier',
+                'user': 'seller{}@example.com'.format(code),
+                'data': {'supplierCode': code},
+                'object_type': 'Supplier',
+                'object_id': code,
+                'acknowledged': rng.random() < 0.5
+            })
+        else:
+            code = rng.choice(supplier_codes)
+            audit_events.append({
+                'type': 'seller_to_review_pricing_case_study_email_part_2',
+                'user': '',
+                'data': {},
+                'object_type': 'Supplier',
+                'object_id': code,
+                'acknowledged': False
+            })
+    _insert(AuditEvent, audit_events)
+
+    applications = []
+    for application_id in range(1, scale['applications'] + 1):
+        code = rng.choice(supplier_codes) if rng.random() < 0.5 else None
+        applications.append({
+            'id': application_id,
+            'status': rng.choice(['saved', 'submitted', 'approved', 'complete']),
+            'type': 'edit' if code else 'new',
+            'supplier_code': code,
+            'data': {
+                'name': _name(rng, application_id),
+                'abn': '{:011d}'.format(application_id),
+                'email': 'applicant{}@example.com'.format(application_id),
+                'contact_email': 'applicant{}@example.com'.format(application_id)
+            }
+        })
+    _insert(Application, applications)
+
+    user_brief_access_service.refresh(db.session, buyer_ids)
+
+    for model in [Supplier, User, Brief, BriefResponse, AuditEvent, Application, CaseStudy]:
+        _reset_sequence(model)
+    db.session.execute("select setval('supplier_code_seq', (select max(code) from supplier))")
+
+    db.session.execute('analyze')
+    db.session.commit()
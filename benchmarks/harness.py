@@ -0,0 +1,150 @@
+from __future__ import absolute_import, division
+
+import io
+import json
+import math
+import os
+import timeit
+
+import pytest
+import yaml
+from sqlalchemy import event
+
+from app import db
+
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), 'budgets.yaml')
+
+# margins left over the reference run when budgets are recorded. Statement counts are the same on every run, so
+# they only allow for a request that legitimately varies by a statement or two.
+LATENCY_MARGIN = 1.2
+STATEMENT_MARGIN = 2
+
+results = []
+
+
+class StatementCounter(object):
+    """Counts the SQL statements sent to the database while active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(self.engine, 'before_cursor_execute', self._before_cursor_execute)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        event.remove(self.engine, 'before_cursor_execute', self._before_cursor_execute)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    rank = int(math.ceil(pct / 100 * len(ordered)))
+    return ordered[max(rank, 1) - 1]
+
+
+def load_budgets():
+    with io.open(BUDGETS_PATH) as f:
+        return yaml.safe_load(f) or {}
+
+
+def run_benchmark(name, fn, iterations=None):
+    """Runs fn repeatedly, recording latency percentiles and the most statements executed by any run.
+
+    The first call is a warm up and is not recorded, so that lazily built
+    caches and connection pool setup don't skew the figures.
+    """
+    if iterations is None:
+        iterations = int(os.getenv('BENCHMARK_ITERATIONS', 20))
+
+    fn()
+
+    timings = []
+    statements = []
+    for _ in range(iterations):
+        with StatementCounter(db.engine) as counter:
+            start = timeit.default_timer()
+            fn()
+            timings.append((timeit.default_timer() - start) * 1000)
+        statements.append(counter.count)
+
+    result = {
+        'name': name,
+        'iterations': iterations,
+        'p50_ms': round(percentile(timings, 50), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'p99_ms': round(percentile(timings, 99), 2),
+        'max_ms': round(max(timings), 2),
+        'statements': max(statements)
+    }
+    results.append(result)
+    return result
+
+
+def recording_budgets():
+    return bool(os.getenv('BENCHMARK_RECORD_BUDGETS'))
+
+
+def check_budget(result):
+    """Fails the current benchmark when its result is over the budget configured in budgets.yaml."""
+    if recording_budgets():
+        return
+
+    budget = load_budgets().get(result['name'])
+    if not budget:
+        return
+
+    latency_factor = float(os.getenv('BENCHMARK_LATENCY_FACTOR', 1))
+    errors = []
+
+    if 'p95_ms' in budget and result['p95_ms'] > budget['p95_ms'] * latency_factor:
+        errors.append('p95 latency {}ms is over the budget of {}ms'.format(
+            result['p95_ms'], budget['p95_ms'] * latency_factor))
+
+    if 'statements' in budget and result['statements'] > budget['statements']:
+        errors.append('{} SQL statements is over the budget of {}'.format(
+            result['statements'], budget['statements']))
+
+    if errors:
+        pytest.fail('{}: {}'.format(result['name'], ', '.join(errors)))
+
+
+def benchmark(name, fn, iterations=None):
+    result = run_benchmark(name, fn, iterations)
+    check_budget(result)
+    return result
+
+
+def budget_for(result):
+    """The budget recorded for a reference result, leaving a small margin over what it measured."""
+    return {
+        'p95_ms': int(math.ceil(result['p95_ms'] * LATENCY_MARGIN / 10) * 10),
+        'statements': result['statements'] + STATEMENT_MARGIN
+    }
+
+
+def write_budgets(path=BUDGETS_PATH):
+    """Records budgets for the benchmarks in this run, keeping the others and the comments at the top of the file."""
+    budgets = load_budgets()
+    budgets.update((result['name'], budget_for(result)) for result in results)
+    names = [result['name'] for result in results]
+    names.extend(sorted(set(budgets) - set(names)))
+
+    with io.open(path) as f:
+        header = [line for line in f if line.startswith('#')]
+
+    with io.open(path, 'w') as f:
+        f.write(u''.join(header))
+        for name in names:
+            f.write(u'\n{}:\n  p95_ms: {}\n  statements: {}\n'.format(
+                name, budgets[name]['p95_ms'], budgets[name]['statements']))
+
+
+def write_report(path):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
@@ -0,0 +1,72 @@
+from __future__ import absolute_import
+
+import json
+
+from benchmarks.harness import benchmark
+
+
+def get(client, url, **kwargs):
+    def fn():
+        response = client.get(url, **kwargs)
+        assert response.status_code == 200, response.get_data()
+        return response
+    return fn
+
+
+def test_supplier_search(client):
+    query = {
+        'query': {'match_all': {}},
+        'sort': [{'name': {'order': 'asc', 'mode': 'min'}}]
+    }
+    benchmark('supplier_search', get(
+        client,
+        '/suppliers/search?size=50',
+        data=json.dumps(query),
+        content_type='application/json'
+    ))
+
+
+def test_supplier_name_search(client):
+    benchmark('supplier_name_search', get(client, '/2/suppliers/search?keyword=agile&briefId=1'))
+
+
+def test_brief(client):
+    benchmark('brief', get(client, '/2/brief/1'))
+
+
+def test_opportunities(client):
+    benchmark('opportunities', get(client, '/2/opportunities?statusFilters=live,closed'))
+
+
+def test_briefs(client):
+    benchmark('briefs', get(client, '/briefs?per_page=50'))
+
+
+def test_applications(client):
+    benchmark('applications', get(client, '/applications'))
+
+
+def test_buyer_dashboard(buyer_client):
+    benchmark('buyer_dashboard', get(buyer_client, '/2/buyer/dashboard'))
+
+
+def test_seller_dashboard(seller_client):
+    benchmark('seller_dashboard', get(seller_client, '/2/supplier/dashboard'))
+
+
+def test_seller_dashboard_opportunities(seller_client):
+    benchmark('seller_dashboard_opportunities', get(seller_client, '/2/supplier/dashboard/opportunities'))
+
+
+def test_sellers_catalogue_report(buyer_client):
+    benchmark('sellers_catalogue_report', get(
+        buyer_client,
+        '/2/buyer/download/reports?reportType=sellersCatalogue'
+    ))
+
+
+def test_specialist_opportunities_report(buyer_client):
+    benchmark('specialist_opportunities_report', get(
+        buyer_client,
+        '/2/buyer/download/reports?reportType=specialist&startDate=2000-01-01&endDate=2100-01-01'
+    ))
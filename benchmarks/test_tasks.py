@@ -0,0 +1,18 @@
+from __future__ import absolute_import
+
+from benchmarks.harness import benchmark
+
+
+def test_update_brief_metrics(app):
+    from app.tasks.brief_tasks import update_brief_metrics
+    benchmark('update_brief_metrics', update_brief_metrics, iterations=5)
+
+
+def test_update_brief_response_metrics(app):
+    from app.tasks.brief_response_tasks import update_brief_response_metrics
+    benchmark('update_brief_response_metrics', update_brief_response_metrics, iterations=5)
+
+
+def test_dreamail_simulation(app):
+    from app.tasks.dreamail import send_dreamail
+    benchmark('dreamail_simulation', lambda: send_dreamail(True, False), iterations=3)
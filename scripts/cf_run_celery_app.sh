@@ -1,4 +1,10 @@
 #!/bin/bash
 
 eval $(./scripts/ups_as_envs.py)
+
+# set CELERY_BEAT=false on worker instances when beat runs on its own with cf_run_celery_beat.sh
+if [ "$CELERY_BEAT" = "false" ]; then
+    exec celery -A 'app.tasks' worker -l info
+fi
+
 exec celery -A 'app.tasks' worker -l info -B -s "/tmp/celerybeat-schedule"
@@ -0,0 +1,4 @@
+#!/bin/bash
+
+eval $(./scripts/ups_as_envs.py)
+exec celery -A 'app.tasks' beat -l info -s "/tmp/celerybeat-schedule"
@@ -2,13 +2,11 @@
 
 #  Example usage:
 #  ./scripts/importers/import_prices.py http://data-api.example.com/ < 'example_listings/test_source_data/DMP Data Source - Test price data.csv'  # noqa
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 import csv
 import json
 import logging
-import re
 import sys
-from six.moves.urllib import parse as url_parse
 
 from dmutils.data_tools import ValidationError, parse_money
 from .utils import nonEmptyOrNone, makeClient
@@ -31,21 +29,6 @@ def getRoleTable(client):
     return table
 
 
-def getSupplierCodeFromName(client, name):
-    name = name.strip()
-    path = '/suppliers?name={}'.format(url_parse.quote(name))
-    result = client.get(path)
-    if result.status_code >= 400:
-        logging.error('Failed to find supplier "{}".  HTTP error {}: {}'.format(name, result.status_code, result.data))
-        return None
-    data = json.loads(result.data)
-    suppliers = data['suppliers']
-    if len(suppliers) != 1:
-        logging.error('Error searching for supplier "{}": {} results found'.format(name, len(suppliers)))
-        return None
-    return suppliers[0]['code']
-
-
 def filterDudPrice(price):
     """
     The source data sometimes has empty strings or $0.00 to represent 'no price given'.
@@ -58,31 +41,51 @@ def filterDudPrice(price):
     return price
 
 
+BATCH_SIZE = 500
+
+
+def post_prices(client, batch):
+    num_failures = 0
+    num_successes = 0
+
+    result = client.post('/suppliers/prices/bulk', data=json.dumps({'prices': batch}),
+                         content_type='application/json')
+    if result.status_code != 200:
+        logging.error('Failed to update prices for suppliers {}.  HTTP error {}: {}'.format(
+            ', '.join(row['name'] for row in batch),
+            result.status_code,
+            result.data
+        ))
+        return len(batch), 0
+
+    for row_result in json.loads(result.data)['results']:
+        name = batch[row_result['index']]['name']
+        if row_result['status'] == 'updated':
+            num_successes += 1
+        elif row_result['status'] == 'not_found':
+            logging.error('Error searching for supplier "{}": {}'.format(name, row_result['error']))
+        else:
+            num_failures += 1
+            logging.error('Failed to update prices for supplier "{}": {}'.format(name, row_result['error']))
+
+    return num_failures, num_successes
+
+
 def run_import(input_file, client):
     num_failures = 0
     num_successes = 0
 
-    prices = {}
-    name_to_code = {}
+    prices = OrderedDict()
 
     roles = getRoleTable(client)
 
     for record in csv.DictReader(input_file):
-        name = record['Name']
-        if name in name_to_code:
-            code = name_to_code[name]
-        else:
-            code = getSupplierCodeFromName(client, record['Name'])
-            name_to_code[name] = code
-            if code is not None:
-                prices[code] = []
-
-        if code is None:
-            continue
+        name = record['Name'].strip()
+        supplier_prices = prices.setdefault(name, [])
 
         try:
             role = roles[record['Role'].lower().strip()]
-            prices[code].append({
+            supplier_prices.append({
                 'serviceRole': {
                     'role': role.role,
                     'category': role.category,
@@ -94,17 +97,11 @@ def run_import(input_file, client):
         except:
             'import error:{}: {}'.format(name, record['Role'].lower().strip())
 
-    for code, price_schedule in prices.items():
-        supplier_update = {'prices': price_schedule}
-        data = json.dumps({'supplier': supplier_update})
-        result = client.patch('/suppliers/{}'.format(code), data=data, content_type='application/json')
-        if result.status_code == 200:
-            num_successes += 1
-        else:
-            num_failures += 1
-            logging.error('Failed to update prices for supplier {}.  HTTP error {}: {}'.format(code,
-                                                                                               result.status_code,
-                                                                                               result.data))
+    rows = [{'name': supplier_name, 'prices': price_schedule} for supplier_name, price_schedule in prices.items()]
+    for i in range(0, len(rows), BATCH_SIZE):
+        batch_failures, batch_successes = post_prices(client, rows[i:i + BATCH_SIZE])
+        num_failures += batch_failures
+        num_successes += batch_successes
 
     return num_failures, num_successes
 
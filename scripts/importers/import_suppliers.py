@@ -9,10 +9,40 @@ import logging
 
 from .utils import nonEmptyOrNone, makeClient
 
+BATCH_SIZE = 500
+
+
+def post_suppliers(client, suppliers):
+    num_failures = 0
+    num_successes = 0
+
+    response = client.post('/suppliers/bulk', data=json.dumps({'suppliers': suppliers}),
+                           content_type='application/json')
+    if response.status_code >= 400:
+        logging.error('Error adding suppliers {}: server returned code {} {}'.format(
+            ', '.join(str(supplier['code']) for supplier in suppliers),
+            response.status_code,
+            response.get_data()
+        ))
+        return len(suppliers), 0
+
+    for result in json.loads(response.get_data())['results']:
+        if result['status'] == 'created':
+            num_successes += 1
+        else:
+            num_failures += 1
+            logging.error('Error adding supplier {}: {}'.format(
+                suppliers[result['index']]['code'],
+                result['error']
+            ))
+
+    return num_failures, num_successes
+
 
 def run_import(input_file, client):
     num_failures = 0
     num_successes = 0
+    suppliers = []
 
     for record in csv.DictReader(input_file):
         if not record['ID']:
@@ -67,17 +97,12 @@ def run_import(input_file, client):
             }]
         }
 
-        response = client.post('/suppliers', data=json.dumps({'supplier': supplier}), content_type='application/json')
-        if response.status_code >= 400:
-            num_failures += 1
-            msg = 'Error adding supplier {}: server returned code {} {}'.format(
-                supplier['code'],
-                response.status_code,
-                response.get_data()
-            )
-            logging.error(msg)
-        else:
-            num_successes += 1
+        suppliers.append(supplier)
+
+    for i in range(0, len(suppliers), BATCH_SIZE):
+        batch_failures, batch_successes = post_suppliers(client, suppliers[i:i + BATCH_SIZE])
+        num_failures += batch_failures
+        num_successes += batch_successes
 
     return num_failures, num_successes
 
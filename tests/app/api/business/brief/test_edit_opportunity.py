@@ -597,6 +597,69 @@ class TestEditOpportunity(BaseApplicationTest):
         assert history[0].data['sellerSelector'] == original_specialist_data['sellerSelector']
         assert history[0].data['title'] == original_specialist_data['title']
 
+    @mock.patch('app.api.business.brief.brief_edit_business.agency_service')
+    def test_edit_opportunity_stores_change_record(self, agency_service, briefs, users):
+        specialist_brief = brief_service.get(2)
+        user = user_service.get(2)
+        agency_service.get_agency_name.return_value = 'DTA'
+
+        edits = {
+            'closingDate': '',
+            'title': 'test',
+            'sellers': {
+                '2': {
+                    'name': 'Seller 2'
+                }
+            },
+            'summary': ''
+        }
+
+        brief_edit_business.edit_opportunity(user.id, specialist_brief.id, edits)
+        history = brief_history_service.all()
+
+        assert history[0].changes == {
+            'title': {
+                'oldValue': 'Specialist title',
+                'newValue': 'test'
+            },
+            'sellers': {
+                'added': {
+                    '2': {
+                        'name': 'Seller 2'
+                    }
+                }
+            }
+        }
+
+    @mock.patch('app.api.business.brief.brief_edit_business.agency_service')
+    def test_opportunity_history_works_out_changes_for_edits_without_change_records(
+        self, agency_service, briefs, users
+    ):
+        specialist_brief = brief_service.get(2)
+        user = user_service.get(2)
+        agency_service.get_agency_name.return_value = 'DTA'
+
+        edits = {
+            'closingDate': '',
+            'title': 'test',
+            'sellers': {},
+            'summary': ''
+        }
+
+        brief_edit_business.edit_opportunity(user.id, specialist_brief.id, edits)
+        edit = brief_history_service.all()[0]
+        edit.changes = None
+        brief_history_service.save(edit)
+
+        history = brief_edit_business.get_opportunity_history(specialist_brief.id)
+
+        assert len(history['edits']) == 1
+        assert history['edits'][0]['title'] == {
+            'oldValue': 'Specialist title',
+            'newValue': 'test'
+        }
+        assert brief_edit_business.only_sellers_were_edited(specialist_brief.id) is False
+
     @mock.patch('app.api.business.brief.brief_edit_business.agency_service')
     def test_edit_opportunity_creates_audit_event(self, agency_service, briefs, users):
         specialist_brief = brief_service.get(2)
@@ -2,11 +2,9 @@ import pendulum
 import pytest
 
 from app.api.business.brief import brief_business
-from app.api.services import audit_types, brief_responses_service
 from app.api.services import briefs as briefs_service
 from app.api.services import frameworks_service, lots_service
-from app.models import (AuditEvent, Brief, BriefQuestion, BriefResponse,
-                        Supplier, User, db)
+from app.models import Brief, BriefQuestion, BriefResponse, Supplier, User, db
 from tests.app.helpers import BaseApplicationTest
 
 
@@ -14,24 +12,6 @@ class TestBriefsService(BaseApplicationTest):
     def setup(self):
         super(TestBriefsService, self).setup()
 
-    @pytest.fixture()
-    def audit_event(self, app, brief_responses):
-        with app.app_context():
-            now = pendulum.now('utc')
-            brief_response = brief_responses_service.get(2)
-
-            db.session.add(
-                AuditEvent(
-                    audit_type=audit_types.create_brief_response,
-                    data={},
-                    db_object=brief_response,
-                    user='draft@friendflutter.com.au'
-                )
-            )
-
-            db.session.commit()
-            yield db.session.query(AuditEvent).first()
-
     @pytest.fixture()
     def brief(self, app, users):
         with app.app_context():
@@ -126,6 +106,7 @@ class TestBriefsService(BaseApplicationTest):
                     id=2,
                     brief_id=1,
                     created_at=now,
+                    created_by='draft@friendflutter.com.au',
                     data={},
                     supplier_code=456,
                     updated_at=now
@@ -224,8 +205,8 @@ class TestBriefsService(BaseApplicationTest):
         email_addresses = briefs_service.get_sellers_to_notify(brief, brief_business.is_open_to_all(brief))
         assert 'submitted@friendface.com.au' in email_addresses
 
-    def test_sellers_to_notify_has_email_address_of_user_that_created_draft_response(self, audit_event, brief,
-                                                                                     brief_responses, suppliers):
+    def test_sellers_to_notify_has_email_address_of_user_that_created_draft_response(self, brief, brief_responses,
+                                                                                     suppliers):
         email_addresses = briefs_service.get_sellers_to_notify(brief, brief_business.is_open_to_all(brief))
         assert 'draft@friendflutter.com.au' in email_addresses
 
@@ -1,5 +1,7 @@
+import pendulum
 import pytest
 
+from app.api.business.domain_criteria import DomainCriteria
 from app.api.services import evidence_assessment_service, evidence_service
 from app.models import Evidence, EvidenceAssessment, Supplier, User, db, utcnow
 from tests.app.helpers import BaseApplicationTest
@@ -166,3 +168,29 @@ class TestEvidenceService(BaseApplicationTest):
         approved_criteria = evidence_service.get_approved_domain_criteria(submission.id, previous_submission.id)
 
         assert '202' not in approved_criteria
+
+    def test_latest_assessment_is_returned_for_each_evidence(self, evidence, evidence_assessments, users):
+        db.session.add(
+            EvidenceAssessment(
+                id=2,
+                evidence_id=2,
+                user_id=users[0].id,
+                status='approved',
+                created_at=pendulum.now().add(minutes=1),
+                data={}
+            )
+        )
+        db.session.commit()
+
+        assessments = evidence_assessment_service.get_latest_assessments_for_evidence([1, 2, 3])
+
+        assert list(assessments.keys()) == [2]
+        assert assessments[2].id == 2
+
+    def test_criteria_needed_matches_domain_criteria(self, evidence):
+        all_evidence = evidence_service.get_all_evidence(supplier_code=123)
+
+        assert len(all_evidence) == 3
+        for e in all_evidence:
+            expected = DomainCriteria(domain_id=e['domain_id'], rate=e['maxDailyRate']).get_criteria_needed()
+            assert e['criteriaNeeded'] == expected
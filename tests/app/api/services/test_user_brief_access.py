@@ -0,0 +1,133 @@
+import pytest
+
+from app.api.services import briefs as briefs_service
+from app.api.services import frameworks_service, lots_service
+from app.models import Brief, Team, TeamBrief, TeamMember, User, db, utcnow
+from tests.app.helpers import BaseApplicationTest
+
+
+class TestUserBriefAccess(BaseApplicationTest):
+    def setup(self):
+        super(TestUserBriefAccess, self).setup()
+
+    @pytest.fixture()
+    def users(self, app):
+        with app.app_context():
+            for user_id in [1, 2, 3]:
+                db.session.add(
+                    User(
+                        id=user_id,
+                        name='Buyer {}'.format(user_id),
+                        email_address='buyer{}@dta.gov.au'.format(user_id),
+                        password='buyer',
+                        active=True,
+                        password_changed_at=utcnow(),
+                        role='buyer'
+                    )
+                )
+
+            db.session.commit()
+
+            yield db.session.query(User).all()
+
+    @pytest.fixture()
+    def team(self, app, users):
+        with app.app_context():
+            db.session.add(
+                Team(
+                    id=1,
+                    name='Marketplace',
+                    email_address='marketplace@dta.gov.au',
+                    status='completed',
+                    team_members=[
+                        TeamMember(user_id=1, is_team_lead=True),
+                        TeamMember(user_id=2, is_team_lead=False)
+                    ]
+                )
+            )
+
+            db.session.commit()
+
+            yield db.session.query(Team).first()
+
+    def create_brief(self, brief_id, user_id=None, team_id=None):
+        framework = frameworks_service.find(slug='digital-marketplace').one_or_none()
+        lot = lots_service.find(slug='specialist').one_or_none()
+
+        brief = Brief(id=brief_id, data={}, framework=framework, lot=lot)
+        if team_id:
+            brief.team_briefs = [TeamBrief(team_id=team_id, user_id=user_id)]
+        else:
+            brief.users = [User.query.get(user_id)]
+
+        db.session.add(brief)
+        db.session.commit()
+
+    def test_brief_user_without_team_has_access_to_own_briefs(self, app, users):
+        with app.app_context():
+            self.create_brief(1, user_id=3)
+
+            assert briefs_service.has_permission_to_brief(3, 1)
+            assert not briefs_service.has_permission_to_brief(1, 1)
+
+    def test_team_members_have_access_to_team_briefs(self, app, team):
+        with app.app_context():
+            self.create_brief(1, user_id=1, team_id=1)
+
+            assert briefs_service.has_permission_to_brief(1, 1)
+            assert briefs_service.has_permission_to_brief(2, 1)
+            assert not briefs_service.has_permission_to_brief(3, 1)
+
+    def test_team_members_have_access_to_briefs_of_teammates(self, app, team):
+        with app.app_context():
+            self.create_brief(1, user_id=2)
+
+            assert briefs_service.has_permission_to_brief(1, 1)
+            assert briefs_service.get_brief_counts(1)['draft'] == 1
+
+    def test_removed_team_member_loses_access_to_team_briefs(self, app, team):
+        with app.app_context():
+            self.create_brief(1, user_id=1, team_id=1)
+
+            team = Team.query.get(1)
+            team.team_members = [tm for tm in team.team_members if tm.user_id != 2]
+            db.session.commit()
+
+            assert briefs_service.has_permission_to_brief(1, 1)
+            assert not briefs_service.has_permission_to_brief(2, 1)
+
+    def test_user_added_to_brief_gains_access(self, app, users):
+        with app.app_context():
+            self.create_brief(1, user_id=1)
+
+            brief = Brief.query.get(1)
+            brief.users.append(User.query.get(3))
+            db.session.commit()
+
+            assert briefs_service.has_permission_to_brief(3, 1)
+            dashboard_briefs = briefs_service.get_buyer_dashboard_briefs(1, None)
+            assert sorted(dashboard_briefs[0]['creators']) == ['Buyer 1', 'Buyer 3']
+
+    def test_brief_user_changes_only_move_that_briefs_access(self, app, team):
+        with app.app_context():
+            self.create_brief(1, user_id=1, team_id=1)
+            self.create_brief(2, user_id=2)
+
+            brief = Brief.query.get(2)
+            brief.users.append(User.query.get(3))
+            db.session.commit()
+
+            assert briefs_service.has_permission_to_brief(3, 2)
+            assert not briefs_service.has_permission_to_brief(3, 1)
+            assert briefs_service.has_permission_to_brief(1, 1)
+            assert briefs_service.has_permission_to_brief(2, 1)
+
+            brief = Brief.query.get(2)
+            brief.users = [User.query.get(3)]
+            db.session.commit()
+
+            assert briefs_service.has_permission_to_brief(3, 2)
+            assert not briefs_service.has_permission_to_brief(1, 2)
+            assert not briefs_service.has_permission_to_brief(2, 2)
+            assert briefs_service.has_permission_to_brief(1, 1)
+            assert briefs_service.has_permission_to_brief(2, 1)
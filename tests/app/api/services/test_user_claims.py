@@ -0,0 +1,60 @@
+import pytest
+
+from app.api.services import user_claims_service
+from app.models import Team, UserClaim, db, utcnow
+from tests.app.helpers import BaseApplicationTest
+
+
+class TestUserClaimService(BaseApplicationTest):
+    def setup(self):
+        super(TestUserClaimService, self).setup()
+
+    @pytest.fixture()
+    def team(self, app):
+        with app.app_context():
+            db.session.add(Team(id=1, name='Marketplace', status='completed'))
+            db.session.commit()
+
+            yield db.session.query(Team).first()
+
+    @pytest.fixture()
+    def claims(self, app, team):
+        with app.app_context():
+            db.session.add(UserClaim(
+                id=1,
+                token='expired',
+                type='join_team',
+                email_address='me@digital.gov.au',
+                data={'team_id': 1},
+                expires_at=utcnow().subtract(days=1)
+            ))
+            db.session.add(UserClaim(
+                id=2,
+                token='active',
+                type='join_team',
+                email_address='me@digital.gov.au',
+                data={'team_id': 1},
+                expires_at=utcnow().add(days=1)
+            ))
+            db.session.commit()
+
+            yield db.session.query(UserClaim).all()
+
+    def test_make_claim_sets_expiry_and_team(self, team):
+        claim = user_claims_service.make_claim(
+            type='join_team',
+            email_address='me@digital.gov.au',
+            data={'team_id': 1}
+        )
+
+        assert claim.team_id == 1
+        assert claim.expires_at > utcnow().add(days=29)
+
+    def test_expired_claims_are_not_returned(self, claims):
+        assert user_claims_service.get_claim(token='expired', type='join_team') is None
+        assert user_claims_service.get_claim(token='active', type='join_team').id == 2
+        assert [c.id for c in user_claims_service.get_active_claims(type='join_team', team_id=1)] == [2]
+
+    def test_delete_expired_claims(self, claims):
+        assert user_claims_service.delete_expired_claims(batch_size=1) == 1
+        assert [c.id for c in UserClaim.query.all()] == [2]
@@ -2,7 +2,7 @@ from mock import patch
 
 from app.api.services import suppliers, users
 from app.brief_utils import check_seller_emails
-from app.models import Supplier, User
+from app.models import User
 
 
 def test_check_one_seller_email_not_found():
@@ -14,8 +14,8 @@ def test_check_one_seller_email_not_found():
     with \
         patch.object(users, 'get_sellers_by_email', return_value=[]) as get_sellers_by_email, \
         patch.object(suppliers,
-                     'get_suppliers_by_contact_email',
-                     return_value=[]) as get_suppliers_by_contact_email:
+                     'get_supplier_contact_emails',
+                     return_value=[]) as get_supplier_contact_emails:
             error = check_seller_emails(brief_data, errs)
             assert error is not None
             assert error['sellerEmail'] == 'email_not_found~nofound@a.com'
@@ -103,8 +103,8 @@ def test_check_some_seller_email_not_found():
     with \
         patch.object(users, 'get_sellers_by_email', return_value=[]) as get_sellers_by_email, \
         patch.object(suppliers,
-                     'get_suppliers_by_contact_email',
-                     return_value=[]) as get_suppliers_by_contact_email:
+                     'get_supplier_contact_emails',
+                     return_value=[]) as get_supplier_contact_emails:
             error = check_seller_emails(brief_data, errs)
             assert error is not None
             assert error['sellerEmailList'] == 'email_not_found~notfound@a.com'
@@ -135,10 +135,8 @@ def test_contact_email_found_for_one_seller():
     with \
         patch.object(users, 'get_sellers_by_email', return_value=[]) as get_sellers_by_email, \
         patch.object(suppliers,
-                     'get_suppliers_by_contact_email',
-                     return_value=[Supplier(data={
-                         'contact_email': 'found@a.com'
-                     })]) as get_suppliers_by_contact_email:
+                     'get_supplier_contact_emails',
+                     return_value=['found@a.com']) as get_supplier_contact_emails:
             error = check_seller_emails(brief_data, errs)
             assert error is None
 
@@ -153,9 +151,7 @@ def test_contact_email_found_for_some_sellers():
     with \
         patch.object(users, 'get_sellers_by_email', return_value=[]) as get_sellers_by_email, \
         patch.object(suppliers,
-                     'get_suppliers_by_contact_email',
-                     return_value=[Supplier(data={
-                         'contact_email': 'found@a.com'
-                     })]) as get_suppliers_by_contact_email:
+                     'get_supplier_contact_emails',
+                     return_value=['found@a.com']) as get_supplier_contact_emails:
             error = check_seller_emails(brief_data, errs)
             assert error is None
@@ -0,0 +1,21 @@
+from app.sql_instrumentation import SqlStats
+
+
+def test_keeps_slowest_statements():
+    stats = SqlStats(top_n=2)
+    stats.add('select 1', 5.0)
+    stats.add('select 2', 20.0)
+    stats.add('select 3', 1.0)
+    stats.add('select 4', 10.0)
+
+    assert stats.statements == 4
+    assert stats.db_ms == 36.0
+    assert [s['statement'] for s in stats.slowest()] == ['select 2', 'select 4']
+
+
+def test_top_n_of_zero_keeps_no_statements():
+    stats = SqlStats(top_n=0)
+    stats.add('select 1', 5.0)
+
+    assert stats.statements == 1
+    assert stats.slowest() == []
@@ -0,0 +1,48 @@
+import mock
+
+from app.tasks.singleton import run_singleton
+
+from .helpers import BaseApplicationTest
+
+
+def make_task(singleton_lease=60):
+    task = mock.Mock()
+    task.name = 'app.tasks.test_task'
+    task.singleton_lease = singleton_lease
+    task.request = mock.Mock(id='1')
+    return task
+
+
+class TestRunSingleton(BaseApplicationTest):
+    @mock.patch('app.tasks.singleton.get_redis_client')
+    def test_runs_and_releases_the_lock(self, get_redis_client):
+        lock = get_redis_client.return_value.lock.return_value
+        lock.acquire.return_value = True
+        call = mock.Mock(return_value='done')
+
+        with self.app.app_context():
+            assert run_singleton(make_task(), call) == 'done'
+
+        get_redis_client.return_value.lock.assert_called_once_with('task_lock:app.tasks.test_task', timeout=60)
+        lock.release.assert_called_once_with()
+
+    @mock.patch('app.tasks.singleton.get_redis_client')
+    def test_skips_when_already_running(self, get_redis_client):
+        lock = get_redis_client.return_value.lock.return_value
+        lock.acquire.return_value = False
+        call = mock.Mock()
+
+        with self.app.app_context():
+            assert run_singleton(make_task(), call) is None
+
+        assert not call.called
+        assert not lock.release.called
+
+    @mock.patch('app.tasks.singleton.get_redis_client')
+    def test_tasks_without_a_lease_are_not_locked(self, get_redis_client):
+        call = mock.Mock(return_value='done')
+
+        with self.app.app_context():
+            assert run_singleton(make_task(singleton_lease=None), call) == 'done'
+
+        assert not get_redis_client.called
@@ -0,0 +1,47 @@
+import time
+
+import mock
+import pytest
+from celery.exceptions import Retry
+
+from app.models import Framework
+from app.tasks.telemetry import run_task
+
+from .helpers import BaseApplicationTest
+
+
+def make_task(enqueued_at=None):
+    task = mock.Mock()
+    task.name = 'app.tasks.test_task'
+    task.request = mock.Mock(id='1', retries=0, enqueued_at=enqueued_at, headers=None)
+    return task
+
+
+class TestRunTask(BaseApplicationTest):
+    @mock.patch('app.tasks.telemetry.record_task_run')
+    def test_records_queue_time_and_statements(self, record_task_run):
+        def call(task):
+            Framework.query.all()
+            return 'done'
+
+        with self.app.app_context():
+            assert run_task(make_task(enqueued_at=time.time() - 2), call) == 'done'
+
+        task_name, outcome, queue_ms, runtime_ms, stats = record_task_run.call_args[0]
+        assert task_name == 'app.tasks.test_task'
+        assert outcome == 'success'
+        assert queue_ms >= 2000
+        assert stats.statements >= 1
+
+    @mock.patch('app.tasks.telemetry.record_task_run')
+    def test_records_retries(self, record_task_run):
+        def call(task):
+            raise Retry()
+
+        with self.app.app_context():
+            with pytest.raises(Retry):
+                run_task(make_task(), call)
+
+        task_name, outcome, queue_ms, runtime_ms, stats = record_task_run.call_args[0]
+        assert outcome == 'retry'
+        assert queue_ms is None
@@ -583,6 +583,37 @@ class TestListApplications(BaseApplicationsTest):
         data = json.loads(res.get_data(as_text=True))
         assert len(data['applications']) == 1
 
+    def test_search_applications_by_abn_and_emails(self):
+        data = dict(self.application_data, abn='12 345 678 901', contact_email='contact@searchable.biz')
+        application_id = self.setup_dummy_application(data=data)
+        other_id = self.setup_dummy_application()
+        self.setup_dummy_applicant(10, other_id)
+
+        for keyword in ['12 345', '12345678901', 'contact@searchable']:
+            res = self.search_applications(keyword)
+            data = json.loads(res.get_data(as_text=True))
+            assert [a['id'] for a in data['applications']] == [application_id]
+
+        res = self.search_applications('test+10@')
+        data = json.loads(res.get_data(as_text=True))
+        assert [a['id'] for a in data['applications']] == [other_id]
+
+        res = self.search_applications('100%')
+        data = json.loads(res.get_data(as_text=True))
+        assert data['applications'] == []
+
+    def test_search_application_document_follows_updates(self):
+        application_id = self.setup_dummy_application()
+
+        res = self.patch_application(application_id, {'name': 'Renamed Pty Ltd'})
+        assert res.status_code == 200
+
+        res = self.search_applications('renamed')
+        data = json.loads(res.get_data(as_text=True))
+        assert [a['id'] for a in data['applications']] == [application_id]
+        assert 'keyword' not in data['links']['self']
+        assert data['links']['self'].endswith('/applications/search/renamed')
+
 
 class TestSubmitApplication(BaseApplicationsTest):
     def setup(self):
@@ -2,7 +2,7 @@ import json
 
 from tests.app.helpers import BaseApplicationTest
 
-from app.models import db, CaseStudy
+from app.models import db, CaseStudy, Domain
 
 
 class BaseCaseStudyTest(BaseApplicationTest):
@@ -130,6 +130,18 @@ class TestUpdateCaseStudy(BaseCaseStudyTest):
         assert data['caseStudy']['supplierCode'] == 0
         assert data['caseStudy']['foo'] == 'baz'
 
+    def test_patch_sets_domain_from_service(self):
+        res = self.patch_case_study(
+            case_study_id=self.case_study_id,
+            data=dict(self.case_study_data, service='Developer')
+        )
+
+        assert res.status_code == 200
+        with self.app.app_context():
+            case_study = CaseStudy.query.get(self.case_study_id)
+            domain = Domain.query.get(case_study.domain_id)
+            assert domain.name == 'Software engineering and Development'
+
     def test_empty_patch(self):
         res = self.patch_case_study(
             case_study_id=self.case_study_id,
@@ -270,7 +270,8 @@ class TestFrameworkStats(BaseApplicationTest):
                 SupplierFramework.framework_id == framework_id,
                 SupplierFramework.supplier_code.in_(supplier_codes)
             ).update({
-                SupplierFramework.declaration: {'status': status}
+                SupplierFramework.declaration: {'status': status},
+                SupplierFramework.declaration_status: status or ''
             }, synchronize_session=False)
 
             db.session.commit()
@@ -444,7 +445,8 @@ class TestFrameworkStats(BaseApplicationTest):
                 SupplierFramework.framework_id == framework.id,
                 SupplierFramework.supplier_code.in_([0, 1])
             ).update({
-                SupplierFramework.declaration: None
+                SupplierFramework.declaration: None,
+                SupplierFramework.declaration_status: None
             }, synchronize_session=False)
 
             db.session.commit()
@@ -453,6 +455,42 @@ class TestFrameworkStats(BaseApplicationTest):
 
         assert response.status_code == 200
 
+    def test_declaration_status_and_submitted_drafts_are_maintained(self):
+        self.setup_supplier_data()
+        with self.app.app_context():
+            framework = Framework.query.filter(Framework.slug == 'g-cloud-7').first()
+
+        self.register_framework_interest(framework.id, [1, 2])
+        self.create_drafts(framework.id, [(1, 2), (3, 1)], status='submitted')
+        self.create_drafts(framework.id, [(2, 1)])
+        self.register_framework_interest(framework.id, [3])
+
+        with self.app.app_context():
+            supplier_framework = SupplierFramework.query.filter(
+                SupplierFramework.framework_id == framework.id,
+                SupplierFramework.supplier_code == 1
+            ).one()
+            supplier_framework.declaration['status'] = 'complete'
+            DraftService.query.filter(DraftService.supplier_code == 2).one().status = 'submitted'
+            db.session.delete(DraftService.query.filter(DraftService.supplier_code == 1).first())
+            db.session.commit()
+
+            assert_equal(
+                [
+                    (sf.supplier_code, sf.declaration_status, sf.submitted_draft_count)
+                    for sf in SupplierFramework.query.filter(
+                        SupplierFramework.framework_id == framework.id
+                    ).order_by(SupplierFramework.supplier_code)
+                ],
+                [(1, 'complete', 1), (2, '', 1), (3, '', 1)]
+            )
+
+        response = self.client.get('/frameworks/g-cloud-7/stats')
+        assert_equal(json.loads(response.get_data())['interested_suppliers'], [
+            {u'count': 2, u'declaration_status': None, u'has_completed_services': True},
+            {u'count': 1, u'declaration_status': u'complete', u'has_completed_services': True},
+        ])
+
 
 class TestGetFrameworkSuppliers(BaseApplicationTest):
     def setup(self):
@@ -1,3 +1,5 @@
+import json
+
 from ..helpers import BaseApplicationTest
 
 from nose.tools import assert_equal
@@ -8,3 +10,9 @@ class TestStatus(BaseApplicationTest):
     def test_should_return_200_from_elb_status_check(self):
         status_response = self.client.get('/_status?ignore-dependencies')
         assert_equal(200, status_response.status_code)
+
+    def test_status_includes_db_pool_stats(self):
+        status_response = self.client.get('/_status')
+        assert_equal(200, status_response.status_code)
+        data = json.loads(status_response.get_data())
+        assert_equal(self.app.config['SQLALCHEMY_POOL_SIZE'], data['db_pool']['size'])
@@ -513,6 +513,134 @@ class TestPostSupplier(BaseApplicationTest, JSONTestMixin):
         )
 
 
+class TestBulkImportSuppliers(BaseApplicationTest):
+    def import_suppliers(self, suppliers):
+        return self.client.post(
+            '/suppliers/bulk',
+            data=json.dumps({
+                'suppliers': suppliers
+            }),
+            content_type='application/json')
+
+    def test_valid_suppliers_are_created_and_invalid_ones_reported(self):
+        first = self.load_example_listing("Supplier")
+        second = self.load_example_listing("Supplier")
+        second['code'] = 2
+        duplicate = self.load_example_listing("Supplier")
+        unnamed = self.load_example_listing("Supplier")
+        unnamed['code'] = 3
+        unnamed['name'] = ''
+
+        response = self.import_suppliers([first, second, duplicate, unnamed])
+        assert_equal(response.status_code, 200)
+        results = json.loads(response.get_data())['results']
+        assert_equal([(r['index'], r['status']) for r in results],
+                     [(0, 'created'), (1, 'created'), (2, 'invalid'), (3, 'invalid')])
+        assert_equal([r['code'] for r in results[:2]], [1, 2])
+        assert_in('already in use', results[2]['error'])
+        assert_equal('Supplier name required', results[3]['error'])
+
+        with self.app.app_context():
+            assert_equal(sorted(s.code for s in Supplier.query.all()), [1, 2])
+            assert_equal(len(Supplier.query.filter_by(code=2).one().prices), 1)
+
+    def test_rows_the_database_or_relationships_reject_are_invalid_on_their_own(self):
+        valid = self.load_example_listing("Supplier")
+        unnamed = self.load_example_listing("Supplier")
+        unnamed['code'] = 2
+        del unnamed['name']
+        bad_addresses = self.load_example_listing("Supplier")
+        bad_addresses['code'] = 3
+        bad_addresses['addresses'] = 'x'
+
+        response = self.import_suppliers([unnamed, bad_addresses, valid])
+        assert_equal(response.status_code, 200)
+        results = json.loads(response.get_data())['results']
+        assert_equal([r['status'] for r in results], ['invalid', 'invalid', 'created'])
+        assert_equal('Supplier name required', results[0]['error'])
+
+        with self.app.app_context():
+            assert_equal([s.code for s in Supplier.query.all()], [1])
+
+    def test_rows_are_retried_one_by_one_when_the_database_rejects_the_batch(self):
+        first = self.load_example_listing("Supplier")
+        bad_status = self.load_example_listing("Supplier")
+        bad_status['code'] = 2
+        bad_status['status'] = 'bogus'
+        third = self.load_example_listing("Supplier")
+        third['code'] = 3
+
+        response = self.import_suppliers([first, bad_status, third])
+        assert_equal(response.status_code, 200)
+        results = json.loads(response.get_data())['results']
+        assert_equal([(r['index'], r['status']) for r in results],
+                     [(0, 'created'), (1, 'invalid'), (2, 'created')])
+
+        with self.app.app_context():
+            assert_equal(sorted(s.code for s in Supplier.query.all()), [1, 3])
+
+    def test_batch_must_be_a_list_within_the_batch_size(self):
+        assert_equal(self.import_suppliers({}).status_code, 400)
+
+        with mock.patch.dict(self.app.config, {'DM_API_SUPPLIER_IMPORT_BATCH_SIZE': 1}):
+            payload = self.load_example_listing("Supplier")
+            assert_equal(self.import_suppliers([payload, payload]).status_code, 400)
+
+
+class TestBulkImportPrices(BaseApplicationTest):
+    def setup(self):
+        super(TestBulkImportPrices, self).setup()
+        self.setup_dummy_suppliers(3)
+
+    def import_prices(self, prices):
+        return self.client.post(
+            '/suppliers/prices/bulk',
+            data=json.dumps({
+                'prices': prices
+            }),
+            content_type='application/json')
+
+    def price(self, role, hourly_rate='100.00'):
+        return {
+            'serviceRole': {'category': 'Business Analysis', 'role': role},
+            'hourlyRate': hourly_rate,
+            'dailyRate': '800.00',
+        }
+
+    def test_prices_replace_existing_prices_for_each_supplier(self):
+        self.import_prices([{'code': 1, 'prices': [self.price('Junior Business Analyst')]}])
+
+        response = self.import_prices([
+            {'code': 1, 'prices': [self.price('Senior Business Analyst', '150.00')]},
+            {'name': 'Supplier 2 ', 'prices': [self.price('Junior Business Analyst')]},
+            {'name': 'No such supplier', 'prices': [self.price('Junior Business Analyst')]},
+            {'code': 0, 'prices': [self.price('Junior Business Analyst', 'bad')]},
+            {'code': 1, 'prices': []},
+        ])
+        assert_equal(response.status_code, 200)
+        results = json.loads(response.get_data())['results']
+        assert_equal([r['status'] for r in results], ['updated', 'updated', 'not_found', 'invalid', 'invalid'])
+        assert_in('money format', results[3]['error'])
+        assert_in('already in this batch', results[4]['error'])
+
+        with self.app.app_context():
+            prices = Supplier.query.filter_by(code=1).one().prices
+            assert_equal([(p.service_role.name, p.hourly_rate, p.gst_included) for p in prices],
+                         [('Senior Business Analyst', Decimal('150.00'), True)])
+            assert_equal(len(Supplier.query.filter_by(code=2).one().prices), 1)
+            assert_equal(Supplier.query.filter_by(code=0).one().prices, [])
+
+    def test_unknown_and_duplicate_roles_are_invalid(self):
+        response = self.import_prices([
+            {'code': 1, 'prices': [self.price('Chief Imagineer')]},
+            {'code': 2, 'prices': [self.price('Junior Business Analyst'), self.price('Junior Business Analyst')]},
+        ])
+        results = json.loads(response.get_data())['results']
+        assert_equal([r['status'] for r in results], ['invalid', 'invalid'])
+        assert_in('Unknown role', results[0]['error'])
+        assert_in('Duplicate role', results[1]['error'])
+
+
 class TestSupplierSearch(BaseApplicationTest):
     def search(self, query_body, **args):
         if args:
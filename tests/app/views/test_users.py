@@ -1625,6 +1625,40 @@ class TestUsersExport(BaseUserTest):
         data = json.loads(self._return_users_export_after_setting_framework_status().get_data())["users"]
         assert len(data) == len(self.users) - 1
 
+    def test_response_as_ndjson(self):
+        self._setup()
+        self._put_complete_declaration()
+        self._post_complete_draft_service()
+        self._set_framework_status()
+        response = self.client.get('/users/export/{}?format=ndjson'.format(self.framework_slug))
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+
+        data = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert len(data) == len(self.users)
+        for datum in data:
+            self._assert_things_about_export_response(datum, parameters={
+                'declaration_status': 'complete',
+                'application_status': 'application'
+            })
+
+    def test_response_as_csv(self):
+        self._setup()
+        self._set_framework_status()
+        response = self.client.get('/users/export/{}?format=csv'.format(self.framework_slug))
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+
+        lines = response.get_data(as_text=True).splitlines()
+        assert lines[0] == ('user_email,user_name,supplier_code,declaration_status,'
+                            'application_status,framework_agreement,application_result')
+        assert len(lines) == len(self.users) + 1
+
+    def test_400_response_if_bad_format(self):
+        self._setup()
+        response = self.client.get('/users/export/{}?format=xml'.format(self.framework_slug))
+        assert response.status_code == 400
+
     # Test 400 if bad framework name
     def test_400_response_if_bad_framework_name(self):
         self._setup()
@@ -1,4 +1,5 @@
 import json
+import mock
 import pytest
 from base64 import b64encode
 
@@ -97,6 +98,18 @@ def test_login(client, users):
     assert res.status_code == 403
 
 
+@mock.patch('app.encryption.authenticate_user')
+@mock.patch('app.throttling.is_login_throttled')
+def test_login_throttled(is_login_throttled, authenticate_user, client, users):
+    is_login_throttled.return_value = True
+
+    res = client.post('/2/login', data=json.dumps({
+        'emailAddress': 'test@digital.gov.au', 'password': 'testpassword'
+    }), content_type='application/json')
+    assert res.status_code == 429
+    assert not authenticate_user.called
+
+
 def test_api_key_generating_by_admin(client, users, admin_users):
     res = client.post('/2/login', data=json.dumps({
         'emailAddress': 'testadmin@digital.gov.au', 'password': 'testpassword'
@@ -190,6 +203,24 @@ def test_api_key_revocation(client, users, api_key):
     assert res.status_code == 403
 
 
+def test_api_key_revocation_with_cache(app, client, users, api_key):
+    key = api_key.key
+    app.config['API_KEY_CACHE_TTL'] = 60
+
+    try:
+        res = client.get('/2/ping', headers={'X-Api-Key': key})
+        data = json.loads(res.get_data(as_text=True))
+        assert data['isAuthenticated']
+
+        res = client.post('/2/revoke-api-key/{}'.format(key))
+        assert res.status_code == 200
+
+        res = client.get('/2/ping', headers={'X-Api-Key': key})
+        assert res.status_code == 403
+    finally:
+        app.config['API_KEY_CACHE_TTL'] = 0
+
+
 def test_api_key_revocation_by_admin(client, users, admin_users, api_key):
     key = api_key.key
 
@@ -229,3 +260,16 @@ def test_api_key_require_auth_decorator(client, users, api_key):
 
     res = client.get('/2/reports/brief/published', headers={'X-Api-Key': key})
     assert res.status_code == 200
+
+
+def test_sampled_request_has_server_timing(app, client, users):
+    app.config['SQL_INSTRUMENTATION_SAMPLE_RATE'] = 1
+
+    try:
+        res = client.post('/2/login', data=json.dumps({
+            'emailAddress': 'test@digital.gov.au', 'password': 'testpassword'
+        }), content_type='application/json')
+        assert res.status_code == 200
+        assert res.headers['Server-Timing'].startswith('db;dur=')
+    finally:
+        app.config['SQL_INSTRUMENTATION_SAMPLE_RATE'] = 0
@@ -5,7 +5,7 @@ import mock
 
 from app import encryption
 from app.models import Brief, Lot, db, utcnow, Supplier, SupplierFramework, Contact, SupplierDomain, User,\
-    Framework, UserFramework, AuditEvent, FrameworkLot, Domain
+    Framework, UserFramework, AuditEvent, FrameworkLot, Domain, BriefResponse
 from app.api.business.validators import RFXDataValidator, ATMDataValidator
 from faker import Faker
 from dmapiclient.audit import AuditTypes
@@ -281,6 +281,7 @@ def test_create_brief_response_creates_an_audit_event(brief_response, client, su
 
     assert len(audit_events) == 1
     assert audit_events[0].data['briefResponseId'] == 1
+    assert BriefResponse.query.get(1).created_by == 'j@examplecompany.biz'
 
 
 @mock.patch('app.tasks.publish_tasks.brief_response')
@@ -0,0 +1,71 @@
+import json
+
+from app.models import Brief, Supplier, Tombstone, db
+
+
+def get_changes(client, api_key, entity_type, **params):
+    return client.get(
+        '/2/reports/changes/{}'.format(entity_type),
+        query_string=params,
+        headers={'X-Api-Key': api_key.key}
+    )
+
+
+def test_brief_changes_are_paged_by_watermark(client, app, api_key, briefs):
+    res = get_changes(client, api_key, 'brief', limit=2)
+    assert res.status_code == 200
+    first = json.loads(res.get_data(as_text=True))
+    assert [item['id'] for item in first['items']] == [1, 2]
+    assert first['hasMore'] is True
+    assert first['items'][0]['lot'] == 'specialist'
+    assert first['items'][0]['deleted'] is False
+
+    res = get_changes(client, api_key, 'brief', limit=5, since=first['watermark'])
+    second = json.loads(res.get_data(as_text=True))
+    assert [item['id'] for item in second['items']] == [3, 4, 5]
+    assert second['hasMore'] is False
+
+    res = get_changes(client, api_key, 'brief', since=second['watermark'])
+    assert json.loads(res.get_data(as_text=True)) == {
+        'items': [],
+        'watermark': second['watermark'],
+        'hasMore': False
+    }
+
+
+def test_deleted_brief_is_reported_from_its_tombstone(client, app, api_key, briefs):
+    res = get_changes(client, api_key, 'brief')
+    watermark = json.loads(res.get_data(as_text=True))['watermark']
+
+    with app.app_context():
+        db.session.delete(Brief.query.get(3))
+        db.session.commit()
+        assert Tombstone.query.filter(Tombstone.entity_type == 'brief', Tombstone.entity_id == 3).count() == 1
+
+    res = get_changes(client, api_key, 'brief', since=watermark)
+    items = json.loads(res.get_data(as_text=True))['items']
+    assert len(items) == 1
+    assert items[0]['id'] == 3
+    assert items[0]['deleted'] is True
+    assert items[0]['title'] is None
+
+
+def test_deleted_supplier_is_reported_as_a_change(client, app, api_key, suppliers):
+    res = get_changes(client, api_key, 'supplier')
+    result = json.loads(res.get_data(as_text=True))
+    assert [item['id'] for item in result['items']] == [1, 2, 3, 4, 5]
+
+    with app.app_context():
+        supplier = Supplier.query.filter(Supplier.code == 2).one()
+        supplier.status = 'deleted'
+        db.session.commit()
+
+    res = get_changes(client, api_key, 'supplier', since=result['watermark'])
+    items = json.loads(res.get_data(as_text=True))['items']
+    assert [(item['id'], item['deleted'], item['status']) for item in items] == [(2, True, 'deleted')]
+
+
+def test_change_feed_rejects_invalid_requests(client, app, api_key):
+    assert get_changes(client, api_key, 'brief', since='not-a-watermark').status_code == 400
+    assert get_changes(client, api_key, 'brief', limit=0).status_code == 400
+    assert get_changes(client, api_key, 'user').status_code == 404
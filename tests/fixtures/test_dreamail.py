@@ -0,0 +1,70 @@
+import mock
+import pytest
+
+from app.api.services import audit_types
+from app.emails.dreamail import send_dreamail
+from app.models import AuditEvent, Supplier, db
+
+
+@pytest.fixture()
+def consultants(app, suppliers):
+    with app.app_context():
+        for supplier in Supplier.query.all():
+            supplier.data['recruiter'] = 'no'
+
+        db.session.commit()
+        yield Supplier.query.all()
+
+
+@pytest.mark.parametrize('supplier_domains', [{'price_status': 'rejected'}], indirect=True)
+def test_dreamail_lists_domains_with_rejected_prices(app, consultants, supplier_domains):
+    with app.app_context():
+        result = send_dreamail(True, False)
+
+        assert sorted(r['supplier_code'] for r in result) == [s.code for s in consultants]
+        for r in result:
+            assert 'test{}@supplier.com'.format(r['supplier_code']) in r['to_addresses']
+            assert 'Strategy and Policy' in r['email_body']
+            assert 'case-study' not in r['email_body']
+
+
+@pytest.mark.parametrize('supplier_domains', [{'price_status': 'approved'}], indirect=True)
+@pytest.mark.parametrize('case_studies', [{'status': 'rejected'}], indirect=True)
+def test_dreamail_lists_rejected_case_studies(app, consultants, supplier_domains, case_studies):
+    with app.app_context():
+        result = send_dreamail(True, False)
+
+        assert [r['supplier_code'] for r in result] == [consultants[0].code]
+        for case_study in case_studies:
+            if case_study.data['service'] in ['Strategy and Policy', 'Change, Training and Transformation']:
+                assert '/case-study/{}"'.format(case_study.id) in result[0]['email_body']
+
+
+@pytest.mark.parametrize('supplier_domains', [{'price_status': 'rejected'}], indirect=True)
+def test_dreamail_skips_sellers_already_sent(app, consultants, supplier_domains):
+    with app.app_context():
+        db.session.add(AuditEvent(
+            audit_type=audit_types.seller_to_review_pricing_case_study_email_part_2,
+            user='',
+            data={},
+            db_object=Supplier.query.filter(Supplier.code == consultants[0].code).one()
+        ))
+        db.session.commit()
+
+        assert consultants[0].code not in [r['supplier_code'] for r in send_dreamail(True, False)]
+        assert consultants[0].code in [r['supplier_code'] for r in send_dreamail(True, True)]
+
+
+@pytest.mark.parametrize('supplier_domains', [{'price_status': 'rejected'}], indirect=True)
+@mock.patch('app.emails.dreamail.send_or_handle_error')
+def test_dreamail_audits_each_send_as_it_goes(send_or_handle_error, app, consultants, supplier_domains):
+    send_or_handle_error.side_effect = [None, None, Exception('process died')]
+
+    with app.app_context():
+        with pytest.raises(Exception):
+            send_dreamail(False, False)
+        db.session.rollback()
+
+        assert AuditEvent.query.filter(
+            AuditEvent.type == audit_types.seller_to_review_pricing_case_study_email_part_2.value
+        ).count() == 2
@@ -0,0 +1,180 @@
+import json
+
+import mock
+import pytest
+
+from app import throttling
+from app.models import User, db
+
+
+class FakePipeline(object):
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def call(*args):
+            self.calls.append((name, args))
+            return self
+        return call
+
+    def execute(self):
+        results = [getattr(self.client, name)(*args) for name, args in self.calls]
+        self.calls = []
+        return results
+
+
+class FakeRedis(object):
+    def __init__(self):
+        self.sorted_sets = {}
+        self.hashes = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def zadd(self, key, mapping):
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zremrangebyscore(self, key, min, max):
+        members = self.sorted_sets.get(key, {})
+        removed = [member for member, score in members.items() if min <= score <= max]
+        for member in removed:
+            del members[member]
+        return len(removed)
+
+    def zcard(self, key):
+        return len(self.sorted_sets.get(key, {}))
+
+    def expire(self, key, ttl):
+        return True
+
+    def hincrby(self, key, field, amount=1):
+        values = self.hashes.setdefault(key, {})
+        values[str(field)] = int(values.get(str(field), 0)) + amount
+        return values[str(field)]
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(str(field))
+
+    def hdel(self, key, *fields):
+        values = self.hashes.get(key, {})
+        return len([field for field in fields if values.pop(str(field), None) is not None])
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.sorted_sets.pop(key, None)
+
+
+@pytest.fixture()
+def fake_redis(app):
+    app.config['LOGIN_THROTTLE_ENABLED'] = True
+    app.config['LOGIN_THROTTLE_WINDOW'] = 300
+    app.config['LOGIN_THROTTLE_EMAIL_LIMIT'] = 3
+    app.config['LOGIN_THROTTLE_IP_LIMIT'] = 5
+    app.config['DM_FAILED_LOGIN_LIMIT'] = 4
+
+    with mock.patch('app.throttling.get_redis_client') as get_redis_client:
+        get_redis_client.return_value = FakeRedis()
+        yield get_redis_client.return_value
+
+
+@mock.patch('app.throttling.time.time')
+def test_email_address_is_throttled_within_the_window(time, app, fake_redis):
+    time.return_value = 1000.0
+
+    with app.app_context():
+        for _ in range(3):
+            assert not throttling.is_login_throttled('Someone@example.com', '10.0.0.1')
+            throttling.record_failed_login('someone@example.com', '10.0.0.1')
+
+        assert throttling.is_login_throttled('someone@example.com', '10.0.0.2')
+        assert not throttling.is_login_throttled('someone.else@example.com', '10.0.0.1')
+
+        time.return_value = 1301.0
+        assert not throttling.is_login_throttled('someone@example.com', '10.0.0.1')
+
+        stats = throttling.get_login_throttle_stats()
+        assert stats['failed'] == 3
+        assert stats['rejected_email'] == 1
+
+
+def test_ip_address_is_throttled_across_email_addresses(app, fake_redis):
+    with app.app_context():
+        for i in range(5):
+            throttling.record_failed_login('user{}@example.com'.format(i), '10.0.0.1')
+
+        assert throttling.is_login_throttled('new@example.com', '10.0.0.1')
+        assert not throttling.is_login_throttled('new@example.com', '10.0.0.2')
+        assert throttling.get_login_throttle_stats()['rejected_ip'] == 1
+
+
+def test_failed_logins_are_buffered_until_flushed(app, fake_redis, users):
+    with app.app_context():
+        user = User.query.get(7)
+        throttling.record_failed_login(user.email_address, '10.0.0.1', user)
+        throttling.record_failed_login(user.email_address, '10.0.0.1', user)
+        db.session.expire_all()
+
+        assert User.query.get(7).failed_login_count == 0
+        assert throttling.get_login_throttle_stats()['pending_failed_logins'] == 1
+
+        assert throttling.flush_failed_login_counts() == 1
+        assert User.query.get(7).failed_login_count == 2
+        assert throttling.flush_failed_login_counts() == 0
+
+
+def test_failed_login_that_locks_the_account_is_written_immediately(app, fake_redis, users):
+    with app.app_context():
+        user = User.query.get(7)
+        for _ in range(3):
+            throttling.record_failed_login(user.email_address, '10.0.0.1', user)
+        db.session.expire_all()
+        assert User.query.get(7).failed_login_count == 0
+
+        user = User.query.get(7)
+        throttling.record_failed_login(user.email_address, '10.0.0.1', user)
+        db.session.expire_all()
+
+        assert User.query.get(7).failed_login_count == 4
+        assert throttling.get_login_throttle_stats()['pending_failed_logins'] == 0
+
+
+def test_successful_login_clears_buffered_failures(app, client, fake_redis, users):
+    res = client.post('/2/login', data=json.dumps({
+        'emailAddress': 'test@digital.gov.au', 'password': 'wrong'
+    }), content_type='application/json')
+    assert res.status_code == 403
+
+    res = client.post('/2/login', data=json.dumps({
+        'emailAddress': 'test@digital.gov.au', 'password': 'testpassword'
+    }), content_type='application/json')
+    assert res.status_code == 200
+
+    with app.app_context():
+        assert throttling.get_login_throttle_stats()['pending_failed_logins'] == 0
+        assert throttling.flush_failed_login_counts() == 0
+        assert User.query.get(7).failed_login_count == 0
+
+
+def test_client_ip_is_the_address_the_trusted_proxy_saw(app):
+    headers = {'X-Forwarded-For': '1.2.3.4, 10.0.0.1'}
+    with app.test_request_context(headers=headers, environ_base={'REMOTE_ADDR': '10.0.0.2'}) as context:
+        assert throttling.get_client_ip(context.request) == '10.0.0.1'
+
+        app.config['LOGIN_THROTTLE_TRUSTED_PROXIES'] = 2
+        assert throttling.get_client_ip(context.request) == '1.2.3.4'
+
+        app.config['LOGIN_THROTTLE_TRUSTED_PROXIES'] = 0
+        assert throttling.get_client_ip(context.request) == '10.0.0.2'
+
+    with app.test_request_context(environ_base={'REMOTE_ADDR': '10.0.0.2'}) as context:
+        app.config['LOGIN_THROTTLE_TRUSTED_PROXIES'] = 1
+        assert throttling.get_client_ip(context.request) == '10.0.0.2'
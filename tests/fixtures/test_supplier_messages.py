@@ -0,0 +1,42 @@
+import mock
+
+from app.api.business import supplier_business
+from app.models import Supplier, db
+
+
+class FakeRedis(object):
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+
+@mock.patch('app.api.business.supplier_business.get_redis_client')
+def test_supplier_messages_are_cached_until_the_supplier_changes(get_redis_client, app, suppliers):
+    get_redis_client.return_value = FakeRedis()
+
+    with app.app_context():
+        with mock.patch.object(
+            supplier_business, '_get_supplier_messages', wraps=supplier_business._get_supplier_messages
+        ) as get_supplier_messages:
+            first = supplier_business.get_supplier_messages(1, False)
+            second = supplier_business.get_supplier_messages(1, False)
+
+            assert get_supplier_messages.call_count == 1
+            assert second._asdict() == first._asdict()
+
+            supplier = Supplier.query.filter(Supplier.code == 1).one()
+            supplier.data['representative'] = 'Someone New'
+            db.session.commit()
+
+            supplier_business.get_supplier_messages(1, False)
+            assert get_supplier_messages.call_count == 2
+
+        ttl = get_redis_client.return_value.ttls['supplier_messages:1:0']
+        assert 0 < ttl <= app.config['SUPPLIER_MESSAGES_CACHE_TTL']
@@ -0,0 +1,91 @@
+import json
+
+import mock
+
+from app import supplier_profiles
+from app.models import Supplier, SupplierDomain, db
+
+
+class FakeRedis(object):
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def hmget(self, key, *fields):
+        stored = self.values.get(key, {})
+        return [stored.get(field) for field in fields]
+
+    def pipeline(self):
+        return self
+
+    def hmset(self, key, mapping):
+        self.values[key] = dict(mapping)
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+    def execute(self):
+        pass
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+@mock.patch('app.supplier_profiles.get_redis_client')
+def test_supplier_profile_is_stored_until_its_version_changes(get_redis_client, app, supplier_domains):
+    get_redis_client.return_value = FakeRedis()
+
+    with app.test_request_context():
+        with mock.patch.object(
+            supplier_profiles, 'render_supplier_profile', wraps=supplier_profiles.render_supplier_profile
+        ) as render_supplier_profile:
+            first = supplier_profiles.get_supplier_profile(1)
+            second = supplier_profiles.get_supplier_profile(1)
+
+            assert render_supplier_profile.call_count == 1
+            assert second == first
+            assert json.loads(first)['code'] == 1
+
+            # a change to a related row still moves the version when its stored profile isn't deleted
+            with mock.patch.object(supplier_profiles, 'invalidate_supplier_profiles'):
+                supplier_domain = SupplierDomain.query.join(Supplier).filter(Supplier.code == 1).first()
+                supplier_domain.status = 'assessed'
+                db.session.commit()
+            assert 'supplier_profile:1' in get_redis_client.return_value.values
+
+            supplier_profiles.get_supplier_profile(1)
+            assert render_supplier_profile.call_count == 2
+
+        ttl = get_redis_client.return_value.ttls['supplier_profile:1']
+        assert ttl == app.config['SUPPLIER_PROFILE_CACHE_TTL']
+
+
+@mock.patch('app.supplier_profiles.get_redis_client')
+def test_supplier_profile_is_invalidated_when_the_supplier_changes(get_redis_client, app, suppliers):
+    get_redis_client.return_value = FakeRedis()
+
+    with app.test_request_context():
+        supplier_profiles.get_supplier_profile(1)
+        supplier_profiles.get_supplier_profile(2)
+
+        supplier = Supplier.query.filter(Supplier.code == 1).one()
+        supplier.data['contact_phone'] = '456'
+        db.session.commit()
+
+        assert 'supplier_profile:1' not in get_redis_client.return_value.values
+        assert 'supplier_profile:2' in get_redis_client.return_value.values
+        assert json.loads(supplier_profiles.get_supplier_profile(1))['contact_phone'] == '456'
+
+
+@mock.patch('app.supplier_profiles.get_redis_client')
+def test_deleted_supplier_has_no_profile(get_redis_client, app, suppliers):
+    get_redis_client.return_value = FakeRedis()
+
+    with app.test_request_context():
+        supplier = Supplier.query.filter(Supplier.code == 1).one()
+        supplier.status = 'deleted'
+        db.session.commit()
+
+        assert supplier_profiles.get_supplier_profile(1) is None
+        assert supplier_profiles.get_supplier_profile(100) is None
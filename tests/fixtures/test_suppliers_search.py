@@ -209,3 +209,36 @@ def test_seller_search_does_not_return_recruiter_for_non_specialist(
     }
 
     assert recruiter not in json.loads(response.data)['sellers']
+
+
+def test_supplier_name_keyword_search_is_limited(app, suppliers):
+    with app.app_context():
+        from app.api.services import suppliers as suppliers_service
+        results = suppliers_service.get_suppliers_by_name_keyword('supplier', limit=2)
+
+        assert results == [
+            {'code': 1, 'name': 'Test Supplier1'},
+            {'code': 2, 'name': 'Test Supplier2'}
+        ]
+
+
+def test_supplier_name_keyword_search_ranks_prefix_and_matches_abn(app, suppliers):
+    with app.app_context():
+        from app.api.services import suppliers as suppliers_service
+        supplier = Supplier.query.filter(Supplier.code == 3).one()
+        supplier.name = 'Supplier Three'
+        db.session.commit()
+
+        assert suppliers_service.get_suppliers_by_name_keyword('supplier')[0]['code'] == 3
+        assert suppliers_service.get_suppliers_by_name_keyword('4') == [{'code': 4, 'name': 'Test Supplier4'}]
+        assert suppliers_service.get_suppliers_by_name_keyword('%') == []
+
+
+def test_supplier_contact_emails(app, suppliers):
+    with app.app_context():
+        from app.api.services import suppliers as suppliers_service
+
+        assert suppliers_service.get_supplier_contact_emails(['test1@supplier.com', 'nobody@supplier.com']) == [
+            'test1@supplier.com'
+        ]
+        assert suppliers_service.get_supplier_contact_emails([]) == []
@@ -298,3 +298,80 @@ def test_user_join_team_request_multiple_all_denied_with_single_deny(
         response = client.get('/2/team/join-request/1/%s' % (team_join_requests[2].token))
         response_data = json.loads(response.data)
         assert response.status_code == 404
+
+
+@mock.patch('app.tasks.publish_tasks.team')
+@mock.patch('app.api.business.team_business.send_removed_team_member_notification_emails')
+@mock.patch('app.api.business.team_business.send_team_member_notification_emails')
+@mock.patch('app.api.business.team_business.send_team_lead_notification_emails')
+def test_team_member_search_excludes_users_in_completed_teams(send_team_lead_notification_emails,
+                                                              send_team_member_notification_emails,
+                                                              send_removed_team_member_notification_emails,
+                                                              publish_team, client, app, agencies, team, users):
+    with app.app_context():
+        db.session.add(Team(id=2, name='New Team', status='created'))
+        db.session.add(TeamMember(team_id=2, user_id=3, is_team_lead=True))
+        db.session.add(TeamMember(team_id=2, user_id=4, is_team_lead=False))
+        db.session.commit()
+
+        client.post('/2/login', data=json.dumps({
+            'emailAddress': 'me3@test.gov.au', 'password': 'test'
+        }), content_type='application/json')
+
+        def update_team(team_members, create_team=False):
+            return client.post('/2/team/2/update', content_type='application/json', data=json.dumps({
+                'name': 'New Team',
+                'teamLeads': {'3': {}},
+                'teamMembers': team_members,
+                'createTeam': create_team
+            }))
+
+        # completing the team puts its members in the directory's completed team set
+        response = update_team({'4': {'permissions': {}}}, create_team=True)
+        assert response.status_code == 200
+        db.session.expire_all()
+        assert [(u.id, u.in_completed_team) for u in User.query.filter(User.id.in_([3, 4])).order_by(User.id)] == [
+            (3, True), (4, True)
+        ]
+
+        # and removing a member takes them out of it
+        response = update_team({})
+        assert response.status_code == 200
+        db.session.expire_all()
+        assert [(u.id, u.in_completed_team) for u in User.query.filter(User.id.in_([3, 4])).order_by(User.id)] == [
+            (3, True), (4, False)
+        ]
+        assert send_removed_team_member_notification_emails.called
+
+        client.get('/2/logout')
+        client.post('/2/login', data=json.dumps({
+            'emailAddress': 'me@digital.gov.au', 'password': 'test'
+        }), content_type='application/json')
+
+        response = client.get('/2/team/members/search?keywords=test')
+        response_data = json.loads(response.data)
+        assert response.status_code == 200
+        assert [u['id'] for u in response_data['users']] == [4]
+
+        response = client.get('/2/team/members/search?keywords=%25')
+        response_data = json.loads(response.data)
+        assert response.status_code == 200
+        assert response_data['users'] == []
+
+
+def test_people_overview_is_paginated(client, app, agencies, team, users, team_members):
+    with app.app_context():
+        client.post('/2/login', data=json.dumps({
+            'emailAddress': 'me@digital.gov.au', 'password': 'test'
+        }), content_type='application/json')
+
+        response = client.get('/2/people?page=1')
+        response_data = json.loads(response.data)
+        assert response.status_code == 200
+        assert response_data['total'] == 3
+        assert response_data['page'] == 1
+        assert [u['id'] for u in response_data['users']] == [1, 4, 3]
+
+        response = client.get('/2/people?page=2')
+        response_data = json.loads(response.data)
+        assert response_data['users'] == []
@@ -24,4 +24,16 @@ do_startup()
 
 if __name__ == '__main__':
     from waitress import serve
-    serve(application, port=port, expose_tracebacks=application.config['DEBUG'])
+    from app.pool import check_pool_capacity
+
+    threads = int(os.getenv('WAITRESS_THREADS', application.config['WAITRESS_THREADS']))
+    connection_limit = int(os.getenv('WAITRESS_CONNECTION_LIMIT', application.config['WAITRESS_CONNECTION_LIMIT']))
+    check_pool_capacity(threads, application.config)
+
+    serve(
+        application,
+        port=port,
+        threads=threads,
+        connection_limit=connection_limit,
+        expose_tracebacks=application.config['DEBUG']
+    )